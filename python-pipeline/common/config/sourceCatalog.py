@@ -0,0 +1,164 @@
+"""
+sourceCatalog.py
+
+Common config:
+- 수집 소스 카탈로그 (settings.yaml) 단일 로더
+- 실행당 1회 로드 → 불변 SourceRecord 튜플 (host / SignalStage / 정수 priority 미리 계산)
+- fetch 계획(우선순위 순서 + 호스트 분산)도 로드 시 1회 계산 → plan()은 순서만 조회
+- 수집 / 분류 / 저장 로직 없음
+"""
+
+import os
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+from urllib.parse import urlsplit
+
+import yaml
+
+from common.enums.signalType import SignalStage
+
+
+CONFIG_DIR = os.path.dirname(os.path.abspath(__file__))
+SETTINGS_PATH = os.path.join(CONFIG_DIR, "settings.yaml")
+
+PRIORITY_LEVELS = {"high": 1, "normal": 2}
+PRIORITY_LABELS = {v: k for k, v in PRIORITY_LEVELS.items()}
+
+
+class SourceRecord(NamedTuple):
+    id: str
+    name: str
+    url: str
+    host: str
+    group: str                  # rss / visual
+    stage: SignalStage
+    priority: int               # 1 = high, 2 = normal (작을수록 먼저 수집)
+    category: Optional[str]
+    language: str
+    domain: Optional[str]       # 업종 (fashion / beauty / ...)
+    geography: Optional[str]
+    enabled: bool
+
+    @property
+    def priority_label(self) -> str:
+        """레퍼런스 row에 저장하는 문자열 priority (high / normal)"""
+        return PRIORITY_LABELS.get(self.priority, "normal")
+
+
+def _host(url: str) -> str:
+    return urlsplit(url).netloc.lower()
+
+
+def _record(group: str, stage: SignalStage, raw: Dict, defaults: Dict) -> SourceRecord:
+    entry = {**defaults, **raw}
+    priority = entry.get("priority", "normal")
+    if priority not in PRIORITY_LEVELS:
+        raise ValueError(f"{entry.get('id')}: unknown priority '{priority}'")
+    return SourceRecord(
+        id=entry["id"],
+        name=entry["name"],
+        url=entry["url"],
+        host=_host(entry["url"]),
+        group=group,
+        stage=stage,
+        priority=PRIORITY_LEVELS[priority],
+        category=entry.get("category"),
+        language=entry.get("language", "en"),
+        domain=entry.get("domain"),
+        geography=entry.get("geography"),
+        enabled=bool(entry.get("enabled", True)),
+    )
+
+
+def _tiered_round_robin(records: Iterable[SourceRecord]) -> List[str]:
+    """
+    priority 단계별로 호스트 라운드로빈 → high 소스가 먼저, 같은 호스트는 연속되지 않게
+    """
+    tiers: Dict[int, Dict[str, List[str]]] = {}
+    for r in records:
+        tiers.setdefault(r.priority, {}).setdefault(r.host, []).append(r.url)
+
+    ordered: List[str] = []
+    for priority in sorted(tiers):
+        queues = list(tiers[priority].values())
+        while queues:
+            next_round = []
+            for q in queues:
+                ordered.append(q.pop(0))
+                if q:
+                    next_round.append(q)
+            queues = next_round
+    return ordered
+
+
+class SourceCatalog:
+    """
+    catalog = get_source_catalog()
+    sources = catalog.sources("rss")          # enabled, priority 순
+    urls = catalog.plan(due_sources)          # fetch 순서
+    """
+
+    def __init__(self, records: Iterable[SourceRecord]):
+        self._records: Tuple[SourceRecord, ...] = tuple(
+            sorted(records, key=lambda r: r.priority)
+        )
+
+        self._by_url: Dict[str, SourceRecord] = {}
+        for r in self._records:
+            if r.url in self._by_url:
+                raise ValueError(f"duplicate source url: {r.url}")
+            self._by_url[r.url] = r
+
+        self._groups: Dict[str, Tuple[SourceRecord, ...]] = {}
+        for r in self._records:
+            self._groups[r.group] = self._groups.get(r.group, ()) + (r,)
+
+        self._hosts: Dict[str, Tuple[SourceRecord, ...]] = {}
+        for r in self._records:
+            self._hosts[r.host] = self._hosts.get(r.host, ()) + (r,)
+
+        self._rank: Dict[str, int] = {
+            url: i for i, url in enumerate(_tiered_round_robin(self._records))
+        }
+
+    @classmethod
+    def from_settings(cls, path: str = SETTINGS_PATH) -> "SourceCatalog":
+        with open(path, "r", encoding="utf-8") as f:
+            settings = yaml.safe_load(f) or {}
+
+        defaults = settings.get("defaults", {})
+        records = []
+        for group, spec in (settings.get("groups") or {}).items():
+            stage = SignalStage(spec["stage"])
+            records.extend(_record(group, stage, raw, defaults) for raw in spec.get("sources", []))
+        return cls(records)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def sources(self, group: Optional[str] = None, include_disabled: bool = False) -> Tuple[SourceRecord, ...]:
+        records = self._groups.get(group, ()) if group else self._records
+        if include_disabled:
+            return records
+        return tuple(r for r in records if r.enabled)
+
+    def get(self, url: str) -> Optional[SourceRecord]:
+        return self._by_url.get(url)
+
+    def by_host(self, host: str) -> Tuple[SourceRecord, ...]:
+        return self._hosts.get(host, ())
+
+    def plan(self, sources: Iterable[SourceRecord]) -> List[str]:
+        """
+        이번 실행에서 요청할 소스 → fetch 순서 (카탈로그 로드 시 계산한 순위 기준)
+        """
+        return sorted((s.url for s in sources), key=lambda url: self._rank.get(url, len(self._rank)))
+
+
+_catalog: Optional[SourceCatalog] = None
+
+
+def get_source_catalog() -> SourceCatalog:
+    global _catalog
+    if _catalog is None:
+        _catalog = SourceCatalog.from_settings()
+    return _catalog
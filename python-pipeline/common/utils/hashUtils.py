@@ -4,11 +4,116 @@ Module A utility:
 - 의미 없는 안정적 ID 생성
 - 중복 판단용 해시
 - 판단/해석 없음
+
+해시 백엔드:
+- DIGESTS: 이름 → digest 함수 (register_digest로 추가 가능)
+- sha256: 기본값. 저장되거나 호출 측과 비교되는 ID·해시 (dedup text_hash, seen entry 해시,
+          embed_chunks의 chunk_hash / existing_hashes 등)는 계속 sha256
+- fast (blake2b, FAST_DIGEST_SIZE 바이트): 저장 포맷에 묶이지 않은 캐시 키 / 메모리 내 비교용
+- canonical_encode: 단순 값 필드는 JSON 인코더 없이 직접 직렬화
+  (json.dumps(sort_keys=True, ensure_ascii=False, separators=(",", ":"))와 바이트 단위 동일 → 기존 해시 유지)
 """
 
 import hashlib
 import json
-from typing import Any, Dict
+from json.encoder import encode_basestring
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+
+# =========================
+# Digest Backends
+# =========================
+
+FAST_DIGEST = "blake2b"
+FAST_DIGEST_SIZE = 16       # 128bit — 캐시 키 충돌 확률 무시 가능, hex 32자
+
+DIGESTS: Dict[str, Callable[[bytes], str]] = {
+    "sha256": lambda data: hashlib.sha256(data).hexdigest(),
+    "blake2b": lambda data: hashlib.blake2b(data, digest_size=FAST_DIGEST_SIZE).hexdigest(),
+}
+
+
+def register_digest(name: str, fn: Callable[[bytes], str]) -> None:
+    """digest 백엔드 추가 (bytes → hex 문자열)"""
+    DIGESTS[name] = fn
+
+
+def _digest_fn(algo: str) -> Callable[[bytes], str]:
+    try:
+        return DIGESTS[algo]
+    except KeyError:
+        raise ValueError(f"unknown digest: {algo}") from None
+
+
+def digest(value, algo: str = "sha256") -> str:
+    if isinstance(value, str):
+        value = value.encode("utf-8")
+    return _digest_fn(algo)(value)
+
+
+def fast_digest(value) -> str:
+    """저장 포맷에 묶이지 않은 키용 빠른 해시 (blake2b)"""
+    return digest(value, FAST_DIGEST)
+
+
+def hash_many(values: Sequence, algo: str = "sha256") -> List[str]:
+    """
+    배치 해시 (입력 순서 유지). 배치 내 같은 값은 1회만 계산
+    """
+    fn = _digest_fn(algo)
+    memo: Dict[Any, str] = {}
+    out: List[str] = []
+    for value in values:
+        h = memo.get(value)
+        if h is None:
+            h = memo[value] = fn(value.encode("utf-8") if isinstance(value, str) else value)
+        out.append(h)
+    return out
+
+
+# =========================
+# Canonical Encoding
+# =========================
+
+def _encode_scalar(value) -> Optional[str]:
+    """단순 값의 JSON 표현. 컨테이너 등 그 외 타입은 None"""
+    if isinstance(value, str):
+        return encode_basestring(value)
+    if value is None:
+        return "null"
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    if type(value) is int:
+        return int.__repr__(value)
+    if type(value) is float and value == value and value not in (float("inf"), float("-inf")):
+        return float.__repr__(value)
+    return None
+
+
+def canonical_encode(fields: Dict[str, Any]) -> str:
+    """
+    json.dumps(fields, sort_keys=True, ensure_ascii=False, separators=(",", ":"))와 같은 문자열
+    값이 모두 str / int / float / bool / None이면 직접 조립, 아니면 json.dumps
+    """
+    parts = []
+    for key in sorted(fields):
+        if not isinstance(key, str):
+            break
+        encoded = _encode_scalar(fields[key])
+        if encoded is None:
+            break
+        parts.append(f"{encode_basestring(key)}:{encoded}")
+    else:
+        return "{" + ",".join(parts) + "}"
+
+    return json.dumps(
+        fields,
+        sort_keys=True,
+        ensure_ascii=False,
+        separators=(",", ":")
+    )
 
 
 # =========================
@@ -22,19 +127,47 @@ def sha256_hash(value: str) -> str:
     return hashlib.sha256(value.encode("utf-8")).hexdigest()
 
 
-def hash_from_fields(fields: Dict[str, Any]) -> str:
+def hash_from_fields(fields: Dict[str, Any], algo: str = "sha256") -> str:
     """
     여러 필드를 묶어서 안정적인 해시 생성
     - key 순서 고정
     - 값만으로 판단
     """
-    normalized = json.dumps(
-        fields,
-        sort_keys=True,
-        ensure_ascii=False,
-        separators=(",", ":")
-    )
-    return sha256_hash(normalized)
+    return digest(canonical_encode(fields), algo)
+
+
+# =========================
+# Item Content Hash
+# =========================
+
+CONTENT_FIELDS = ("title", "summary", "content", "body_text")
+_CONTENT_MEMO = "_content_hash"
+
+
+def build_content_text(item: Dict) -> str:
+    """
+    item 본문 텍스트 (CONTENT_FIELDS 단순 결합)
+    """
+    parts = [item.get(field, "") for field in CONTENT_FIELDS]
+    return " ".join([p.strip() for p in parts if p]).strip()
+
+
+def item_content_hash(item: Dict) -> Optional[str]:
+    """
+    build_content_text의 sha256 (텍스트가 없으면 None)
+    - item["_content_hash"]에 메모: (필드 값 참조, 해시)
+    - 필드 값이 다른 객체로 바뀌면 (정제 / 본문 보강 등) 다시 계산
+    - item 본문 해시를 쓰는 단계는 현재 deduplicate뿐 (임베딩은 청크 단위 해시)
+    """
+    values = tuple(item.get(field) for field in CONTENT_FIELDS)
+    memo = item.get(_CONTENT_MEMO)
+    if memo is not None and all(a is b for a, b in zip(memo[0], values)):
+        return memo[1]
+
+    text = build_content_text(item)
+    h = sha256_hash(text) if text else None
+    item[_CONTENT_MEMO] = (values, h)
+    return h
 
 
 # =========================
@@ -6,47 +6,266 @@ Module A - Preprocess responsibility:
 - 의미 해석 / 번역 / 판단 금지
 - 감지 결과를 메타데이터로만 추가
 
+감지 방식 (배치):
+- 텍스트 앞 PREFIX_CHARS 글자만 사용
+- 문자 체계 fast path: 가나 → ja / 한글 → ko / 라틴 + 영어 기능어 비율 → en
+- 판단이 애매한 텍스트만 langdetect 모델로 감지 (대량이면 프로세스 풀)
+- 결과는 (DETECTOR_VERSION + prefix) fast_digest 기준 SQLite 캐시에 저장 → 실행 간 재사용
+  (같은 입력이면 결과가 같으므로 staging 없이 즉시 기록)
+
 Used before:
 - textEmbedding.py
 """
 
-from typing import Dict, Optional
+import os
+import re
+import sqlite3
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence
+
 from langdetect import detect, DetectorFactory, LangDetectException
 
+from common.utils.hashUtils import fast_digest
+
 # 재현성 보장
 DetectorFactory.seed = 42
 
 
 # =========================
-# Core
+# Config
 # =========================
 
-def detect_language(text: str) -> Optional[str]:
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+LANGUAGE_CACHE_PATH = os.path.join(BASE_DIR, "moduleA", "data", "state", "language_cache.db")
+
+DETECTOR_VERSION = "1"        # fast path 규칙 / PREFIX_CHARS 변경 시 올림 (캐시 키에 포함)
+PREFIX_CHARS = 500            # 감지에 쓰는 앞부분 길이
+
+ITEM_FIELDS = ["title", "summary", "content", "body_text"]
+
+PARALLEL_MIN_TEXTS = 2000     # 모델 감지 대상이 이보다 적으면 프로세스 기동 비용이 더 큼
+PARALLEL_CHUNK = 200
+
+KANA_MIN_RATIO = 0.1          # 가나는 일본어에만 쓰임 → 소량이어도 ja
+HANGUL_MIN_RATIO = 0.3        # 한국어 본문에도 라틴 브랜드명이 섞임
+LATIN_MIN_RATIO = 0.95
+ACCENTED_MAX_RATIO = 0.01     # 악센트 문자가 이보다 많으면 유럽어 가능성 → 모델
+EN_MIN_WORDS = 5
+EN_STOPWORD_RATIO = 0.2
+
+EN_STOPWORDS = frozenset("""
+the and of to is for with on that this by from as at are be it an or was its their
+has have not but will can you we our they which who more new how what when your
+""".split())
+
+_RE_LETTER = re.compile(r"[^\W\d_]")
+_RE_HANGUL = re.compile(r"[ᄀ-ᇿ㄰-㆏가-힣]")
+_RE_KANA = re.compile(r"[぀-ヿ]")
+_RE_LATIN = re.compile(r"[A-Za-zÀ-ɏ]")
+_RE_ACCENTED = re.compile(r"[À-ɏ]")
+_RE_WORD = re.compile(r"[A-Za-z']+")
+
+_AMBIGUOUS = object()
+
+
+# =========================
+# Fast Path
+# =========================
+
+def _prefix(text) -> str:
+    if not isinstance(text, str):
+        return ""
+    return text[:PREFIX_CHARS].strip()
+
+
+def script_language(text: str):
     """
-    단일 텍스트 언어 감지
-    실패 시 None 반환
+    문자 체계만으로 판단. 글자가 없으면 None, 판단 불가면 _AMBIGUOUS
     """
-    if not isinstance(text, str) or not text.strip():
+    letters = len(_RE_LETTER.findall(text))
+    if letters == 0:
         return None
+    if len(_RE_KANA.findall(text)) >= letters * KANA_MIN_RATIO:
+        return "ja"
+    if len(_RE_HANGUL.findall(text)) >= letters * HANGUL_MIN_RATIO:
+        return "ko"
+    if (
+        len(_RE_LATIN.findall(text)) >= letters * LATIN_MIN_RATIO
+        and len(_RE_ACCENTED.findall(text)) <= letters * ACCENTED_MAX_RATIO
+    ):
+        words = _RE_WORD.findall(text.lower())
+        if len(words) >= EN_MIN_WORDS and sum(w in EN_STOPWORDS for w in words) >= len(words) * EN_STOPWORD_RATIO:
+            return "en"
+    return _AMBIGUOUS
 
+
+def _model_language(text: str) -> Optional[str]:
     try:
         return detect(text)
     except LangDetectException:
         return None
 
 
+def _model_chunk(texts: List[str]) -> List[Optional[str]]:
+    return [_model_language(t) for t in texts]
+
+
+def _model_languages(texts: List[str], workers: Optional[int], parallel_min: int) -> List[Optional[str]]:
+    if len(texts) < parallel_min:
+        return _model_chunk(texts)
+    chunks = [texts[i:i + PARALLEL_CHUNK] for i in range(0, len(texts), PARALLEL_CHUNK)]
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        return [lang for chunk in pool.map(_model_chunk, chunks) for lang in chunk]
+
+
+# =========================
+# Cache
+# =========================
+
+class LanguageCache:
+    """
+    text_key (fast_digest(DETECTOR_VERSION + prefix)) → language ("" = 감지 실패)
+    """
+
+    _LOOKUP_BATCH = 500
+
+    def __init__(self, path: str = LANGUAGE_CACHE_PATH):
+        self.path = path
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS languages (text_key TEXT PRIMARY KEY, language TEXT NOT NULL)"
+        )
+        self._conn.commit()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(prefix: str) -> str:
+        return fast_digest(f"{DETECTOR_VERSION}\x00{prefix}")
+
+    def lookup(self, keys: Sequence[str]) -> Dict[str, Optional[str]]:
+        keys = sorted(set(keys))
+        found: Dict[str, Optional[str]] = {}
+        with self._lock:
+            for i in range(0, len(keys), self._LOOKUP_BATCH):
+                batch = keys[i:i + self._LOOKUP_BATCH]
+                rows = self._conn.execute(
+                    f"SELECT text_key, language FROM languages WHERE text_key IN ({','.join('?' * len(batch))})",
+                    batch,
+                ).fetchall()
+                found.update((k, lang or None) for k, lang in rows)
+        return found
+
+    def store(self, results: Dict[str, Optional[str]]) -> None:
+        if not results:
+            return
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO languages (text_key, language) VALUES (?, ?)",
+                [(k, lang or "") for k, lang in results.items()],
+            )
+            self._conn.commit()
+
+
+_cache: Optional[LanguageCache] = None
+
+
+def get_language_cache() -> LanguageCache:
+    global _cache
+    if _cache is None:
+        _cache = LanguageCache()
+    return _cache
+
+
+# =========================
+# Core
+# =========================
+
+def detect_languages(
+    texts: Sequence[str],
+    cache: Optional[LanguageCache] = None,
+    workers: Optional[int] = None,
+    parallel_min: int = PARALLEL_MIN_TEXTS,
+    stats: Optional[Dict[str, int]] = None,
+) -> List[Optional[str]]:
+    """
+    텍스트 배치 언어 감지 (입력 순서 유지). 실패 / 빈 텍스트는 None
+    cache: 기본 get_language_cache()
+    stats: 주어지면 cached / script / model 건수를 누적
+    """
+    cache = cache or get_language_cache()
+    stats = stats if stats is not None else {}
+    for k in ("cached", "script", "model"):
+        stats.setdefault(k, 0)
+
+    prefixes = [_prefix(t) for t in texts]
+    keys = [LanguageCache.key(p) if p else None for p in prefixes]
+
+    pending = {k: p for k, p in zip(keys, prefixes) if k}
+    results = cache.lookup(list(pending))
+    stats["cached"] += len(results)
+
+    detected: Dict[str, Optional[str]] = {}
+    ambiguous: Dict[str, str] = {}
+    for k, p in pending.items():
+        if k in results:
+            continue
+        lang = script_language(p)
+        if lang is _AMBIGUOUS:
+            ambiguous[k] = p
+        else:
+            detected[k] = lang
+    stats["script"] += len(detected)
+    stats["model"] += len(ambiguous)
+
+    if ambiguous:
+        detected.update(zip(ambiguous, _model_languages(list(ambiguous.values()), workers, parallel_min)))
+
+    cache.store(detected)
+    results.update(detected)
+    return [results.get(k) if k else None for k in keys]
+
+
+def detect_language(text: str) -> Optional[str]:
+    """
+    단일 텍스트 언어 감지
+    실패 시 None 반환
+    """
+    return detect_languages([text])[0]
+
+
+def _item_text(item: Dict) -> str:
+    parts = [item.get(field, "") for field in ITEM_FIELDS]
+    return " ".join([p for p in parts if isinstance(p, str) and p.strip()])
+
+
+def detect_items_language(
+    items: List[Dict],
+    cache: Optional[LanguageCache] = None,
+    workers: Optional[int] = None,
+    parallel_min: int = PARALLEL_MIN_TEXTS,
+) -> List[Dict]:
+    """
+    item 배치 언어 감지 (in-place, 같은 리스트 반환)
+    - ITEM_FIELDS를 단순 결합한 텍스트의 앞부분 기준
+    - 결과는 item["language"]에 저장
+    """
+    languages = detect_languages(
+        [_item_text(item) for item in items],
+        cache=cache, workers=workers, parallel_min=parallel_min,
+    )
+    for item, lang in zip(items, languages):
+        item["language"] = lang
+    return items
+
+
 def detect_item_language(item: Dict) -> Dict:
     """
     item 단위 언어 감지
-    - title / summary / content를 단순 결합
+    - title / summary / content / body_text를 단순 결합
     - 결과는 item["language"]에 저장
     """
-    parts = [
-        item.get("title", ""),
-        item.get("summary", ""),
-        item.get("content", "")
-    ]
-    text = " ".join([p for p in parts if isinstance(p, str) and p.strip()])
-
-    item["language"] = detect_language(text)
+    detect_items_language([item])
     return item
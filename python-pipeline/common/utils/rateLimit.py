@@ -0,0 +1,71 @@
+"""
+rateLimit.py
+
+Common utility:
+- 외부 API 호출 속도 제한 (token bucket)
+- 429 / 일시 오류 재시도용 지수 백오프 지연 계산
+- 호출 대상 / 결과 해석 없음
+"""
+
+import random
+import threading
+import time
+from typing import Iterator
+
+
+class TokenBucket:
+    """
+    rate: 초당 토큰 보충 수
+    capacity: 최대 버스트 크기
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        토큰 확보까지 대기. 실제 대기한 시간(초) 반환
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+                delay = (tokens - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+    def penalize(self, seconds: float) -> None:
+        """
+        서버가 속도 제한을 알린 경우(429) 버킷을 비워 다음 호출을 늦춤
+        """
+        with self._lock:
+            self._refill()
+            self._tokens = min(self._tokens, 0.0) - seconds * self.rate
+
+
+def backoff_delays(
+    retries: int,
+    base: float = 2.0,
+    factor: float = 2.0,
+    max_delay: float = 60.0,
+) -> Iterator[float]:
+    """
+    지수 백오프 + jitter 지연 시간 시퀀스 (각 단계 지연의 50~100%)
+    """
+    delay = base
+    for _ in range(retries):
+        capped = min(delay, max_delay)
+        yield capped / 2 + random.uniform(0, capped / 2)
+        delay *= factor
@@ -0,0 +1,77 @@
+"""
+stateStore.py
+
+Common utility:
+- 파이프라인 로컬 상태(JSON) 파일 읽기/쓰기
+- 쓰기는 임시 파일 → rename 으로 원자적 교체 (중간 실패 시 기존 파일 보존)
+- StagedJsonState: 실행 성공 시에만 반영되는 key → dict 상태
+- 상태의 의미 해석 없음
+"""
+
+import json
+import os
+import threading
+from typing import Any, Dict
+
+
+def load_json_state(path: str, default: Any = None) -> Any:
+    """
+    상태 파일 로드. 없거나 손상된 경우 default 반환
+    """
+    if not os.path.exists(path):
+        return default
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"[STATE] {os.path.basename(path)} 로드 실패 — 초기화: {e}")
+        return default
+
+
+def save_json_state(path: str, data: Any) -> None:
+    """
+    상태 파일 원자적 저장
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+    os.replace(tmp_path, path)
+
+
+class StagedJsonState:
+    """
+    key → dict 상태 파일 + 실행 단위 staging
+    - stage()한 변경은 commit() 전까지 메모리에만 보관
+    - 파이프라인이 성공한 경우에만 commit(), 실패 시 rollback()
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._data: Dict[str, Dict] = load_json_state(path, default={})
+        self._pending: Dict[str, Dict] = {}
+        self._lock = threading.RLock()
+
+    def get(self, key: str) -> Dict:
+        with self._lock:
+            return dict(self._pending.get(key) or self._data.get(key) or {})
+
+    def stage(self, key: str, value: Dict) -> None:
+        with self._lock:
+            self._pending[key] = value
+
+    def snapshot(self) -> Dict[str, Dict]:
+        with self._lock:
+            return {**self._data, **self._pending}
+
+    def commit(self) -> None:
+        with self._lock:
+            if not self._pending:
+                return
+            self._data.update(self._pending)
+            self._pending = {}
+            save_json_state(self.path, self._data)
+
+    def rollback(self) -> None:
+        with self._lock:
+            self._pending = {}
@@ -6,59 +6,151 @@ Module A - Preprocess responsibility:
 - HTML / URL / 이메일 / 이모지 제거
 - 의미 해석, 요약, 판단, 키워드 생성 금지
 
+정제 모드 (필드별 지정):
+- normalize: 소문자화 + HTML / URL / 이메일 / 이모지·특수문자 제거 (title 등 짧은 필드)
+             → 태그 1회 + URL 1회 + 이메일·특수문자를 정규식 1개로 합쳐 1회 스캔 (총 3회), 공백 정리는 split/join
+- markup:    HTML 태그 / 엔티티만 제거, 대소문자·문장부호·문단 구분 유지 (body_text)
+- 대량 배치(백필)는 PARALLEL_MIN_TEXTS 이상일 때 프로세스 풀로 분할 처리
+
 Used before:
 - textEmbedding.py
 """
 
+import html
+import os
 import re
-from typing import Dict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence
 
 
 # =========================
 # Regex Patterns
 # =========================
 
-RE_HTML = re.compile(r"<[^>]+>")
+# normalize: 태그 → URL → 이메일 | 특수문자(이모지 포함 — \w가 아니므로) 순서로 치환 (기존 순서 유지)
+# 태그를 먼저 공백으로 바꿔야 태그에 붙은 URL / 이메일이 뒤 단어까지 삼키지 않고,
+# URL을 이메일보다 먼저 지워야 "abc@http://..." 에서 이메일 패턴이 URL 뒤까지 삼키지 않음
+RE_TAG = re.compile(r"<[^>]+>")
 RE_URL = re.compile(r"http[s]?://\S+")
-RE_EMAIL = re.compile(r"\S+@\S+")
-RE_EMOJI = re.compile(
-    "["
-    "\U0001F600-\U0001F64F"
-    "\U0001F300-\U0001F5FF"
-    "\U0001F680-\U0001F6FF"
-    "\U0001F1E0-\U0001F1FF"
-    "]+",
-    flags=re.UNICODE
+RE_NORMALIZE = re.compile(
+    r"\S+@\S+"
+    r"|[^\w\s\-]"
+)
+
+# markup: script/style 블록 제거, 블록 태그 → 문단 구분, 그 외 태그 → 공백
+RE_MARKUP = re.compile(
+    r"<(script|style)\b[^>]*>.*?</\1\s*>"
+    r"|(</?(?:p|div|li|ul|ol|h[1-6]|blockquote|tr|section|article|br)\b[^>]*>)"
+    r"|<[^>]+>",
+    flags=re.IGNORECASE | re.DOTALL
 )
-RE_WHITESPACE = re.compile(r"\s+")
+RE_PARAGRAPH_BREAK = re.compile(r"\n\s*\n")
+
+
+# =========================
+# Config
+# =========================
+
+NORMALIZE, MARKUP = "normalize", "markup"
+
+FIELD_MODES: Dict[str, str] = {
+    "title": NORMALIZE,
+    "summary": NORMALIZE,
+    "content": NORMALIZE,
+    "body_text": MARKUP,
+}
+
+PARALLEL_MIN_TEXTS = 20000    # 이보다 적으면 프로세스 기동 비용이 더 큼
+PARALLEL_CHUNK = 2000         # 워커 1회 전송 단위
 
 
 # =========================
 # Core
 # =========================
 
-def clean_text(text: str) -> str:
-    if not isinstance(text, str):
-        return ""
+def _normalize(text: str) -> str:
+    text = RE_URL.sub(" ", RE_TAG.sub(" ", text.lower()))
+    return " ".join(RE_NORMALIZE.sub(" ", text).split())
+
+
+def _markup_sub(match) -> str:
+    return "\n\n" if match.group(2) else " "
+
+
+def _strip_markup(text: str) -> str:
+    text = html.unescape(RE_MARKUP.sub(_markup_sub, text))
+    paragraphs = (" ".join(p.split()) for p in RE_PARAGRAPH_BREAK.split(text))
+    return "\n\n".join(p for p in paragraphs if p)
 
-    text = text.lower()
-    text = RE_HTML.sub(" ", text)
-    text = RE_URL.sub(" ", text)
-    text = RE_EMAIL.sub(" ", text)
-    text = RE_EMOJI.sub(" ", text)
 
-    # 최소한의 특수문자 제거 (의미 손상 방지)
-    text = re.sub(r"[^\w\s\-]", " ", text)
+_MODES = {NORMALIZE: _normalize, MARKUP: _strip_markup}
 
-    text = RE_WHITESPACE.sub(" ", text).strip()
-    return text
+
+def _clean_chunk(mode: str, texts: List[str]) -> List[str]:
+    fn = _MODES[mode]
+    return [fn(t) if isinstance(t, str) else "" for t in texts]
+
+
+def clean_texts(
+    texts: Sequence[str],
+    mode: str = NORMALIZE,
+    workers: Optional[int] = None,
+    parallel_min: int = PARALLEL_MIN_TEXTS,
+) -> List[str]:
+    """
+    텍스트 배치 정제 (입력 순서 유지). 문자열이 아닌 값은 ""
+    parallel_min 이상이면 프로세스 풀에서 PARALLEL_CHUNK 단위로 처리
+    """
+    if mode not in _MODES:
+        raise ValueError(f"unknown clean mode: {mode}")
+    texts = list(texts)
+    if len(texts) < parallel_min:
+        return _clean_chunk(mode, texts)
+
+    chunks = [texts[i:i + PARALLEL_CHUNK] for i in range(0, len(texts), PARALLEL_CHUNK)]
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        results = pool.map(_clean_chunk, [mode] * len(chunks), chunks)
+        return [t for chunk in results for t in chunk]
+
+
+def clean_items(
+    items: List[Dict],
+    field_modes: Optional[Dict[str, str]] = None,
+    workers: Optional[int] = None,
+    parallel_min: int = PARALLEL_MIN_TEXTS,
+) -> List[Dict]:
+    """
+    item 배치의 텍스트 필드 정제 (in-place, 같은 리스트 반환)
+    field_modes: 필드 → 정제 모드 (기본 FIELD_MODES). 없는 필드는 건너뜀
+    같은 모드의 필드는 전 item을 모아 clean_texts 1회로 처리
+    """
+    field_modes = field_modes or FIELD_MODES
+    by_mode: Dict[str, List[str]] = {}
+    for field, mode in field_modes.items():
+        by_mode.setdefault(mode, []).append(field)
+
+    for mode, fields in by_mode.items():
+        slots = [(item, field) for item in items for field in fields if field in item]
+        cleaned = clean_texts(
+            [item[field] for item, field in slots],
+            mode=mode,
+            workers=workers,
+            parallel_min=parallel_min,
+        )
+        for (item, field), text in zip(slots, cleaned):
+            item[field] = text
+    return items
+
+
+def clean_text(text: str) -> str:
+    if not isinstance(text, str):
+        return ""
+    return _normalize(text)
 
 
 def clean_item_text(item: Dict) -> Dict:
     """
-    item 단위 텍스트 필드 정제
+    item 단위 텍스트 필드 정제 (FIELD_MODES 기준)
     """
-    for field in ("title", "summary", "content"):
-        if field in item:
-            item[field] = clean_text(item.get(field))
+    clean_items([item])
     return item
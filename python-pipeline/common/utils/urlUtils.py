@@ -0,0 +1,55 @@
+"""
+urlUtils.py
+
+Common utility:
+- 중복 판단용 URL 정규화 (canonical URL)
+- 추적 파라미터(utm_* 등) / fragment / 기본 포트 / www. / 끝 슬래시 차이 제거
+- 저장용 source_url은 바꾸지 않음 — 비교 키로만 사용
+"""
+
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+
+TRACKING_PREFIXES = ("utm_", "mc_", "_hs", "pk_", "ga_")
+TRACKING_PARAMS = {
+    "fbclid", "gclid", "dclid", "msclkid", "yclid", "igshid", "mkt_tok",
+    "ref", "ref_src", "ref_url", "cmpid", "ncid", "sr_share",
+}
+DEFAULT_PORTS = {"http": "80", "https": "443"}
+
+
+def _is_tracking(key: str) -> bool:
+    key = key.lower()
+    return key in TRACKING_PARAMS or key.startswith(TRACKING_PREFIXES)
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    비교용 canonical URL. 파싱할 수 없으면 strip한 원문 반환
+
+    https://www.Example.com:443/a/b/?utm_source=rss&id=2#top → https://example.com/a/b?id=2
+    """
+    url = (url or "").strip()
+    if not url:
+        return ""
+    try:
+        parts = urlsplit(url)
+        port = parts.port
+    except ValueError:
+        return url
+
+    scheme = (parts.scheme or "http").lower()
+    host = (parts.hostname or "").lower()
+    if host.startswith("www."):
+        host = host[4:]
+    netloc = host if port is None or str(port) == DEFAULT_PORTS.get(scheme) else f"{host}:{port}"
+
+    path = parts.path or "/"
+    if len(path) > 1:
+        path = path.rstrip("/") or "/"
+
+    query = urlencode(sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not _is_tracking(k)
+    ))
+    return urlunsplit((scheme, netloc, path, query, ""))
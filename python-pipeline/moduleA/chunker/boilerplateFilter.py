@@ -0,0 +1,291 @@
+"""
+boilerplateFilter.py
+
+Module A - Chunker
+- 소스별로 반복되는 상용구(푸터 / 뉴스레터 안내 / "The post X appeared first on Y")를
+  임베딩 전에 청크에서 제거
+- 의미 해석 / 요약 / 분류 금지 — 반복 빈도만 사용
+
+방식:
+- 청크를 문장 / 줄 단위 segment로 나누고 fingerprint 생성
+  (소문자 + 기호 제거 + 숫자 → 0, 레퍼런스 제목은 자리표시자로 치환 → 제목만 다른 템플릿 문장도 같은 값)
+- 같은 소스에서 fingerprint가 나온 문서 수 (이번 배치 + 이전 실행 누적) ≥ MIN_DOC_FREQ 이면 상용구
+  문서 = canonical source_url (실행마다 새로 붙는 레퍼런스 id가 아님)
+  → 수정돼 재수집된 같은 기사는 몇 번 들어와도 1개 문서로 셈
+- segment가 전부 상용구인 청크는 제외(drop), 일부면 해당 segment만 빼고 축약(collapse)
+  → 축약 후 MIN_CHUNK_TOKENS 미만이면 제외, 축약된 청크는 원문 오프셋(char_start / char_end)을 버림
+- 누적 (source, fingerprint, 문서 키)는 SQLite에 staging → 파이프라인 성공 시에만 commit
+"""
+
+import os
+import re
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Set, Tuple
+
+from common.utils.hashUtils import fast_digest
+from common.utils.urlUtils import canonicalize_url
+from moduleA.chunker.chunkBatch import ChunkBatch
+from moduleA.chunker.documentChunker import MIN_CHUNK_TOKENS, get_tokenizer
+
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+STATE_DIR = os.path.join(BASE_DIR, "data", "state")
+BOILERPLATE_PATH = os.path.join(STATE_DIR, "boilerplate.db")
+
+MIN_DOC_FREQ = 3              # 같은 소스의 문서(canonical URL) 3개 이상에서 반복되면 상용구
+MIN_SEGMENT_CHARS = 20        # 이보다 짧은 segment는 판단하지 않음 (짧은 일반 문장 오탐 방지)
+SINGLETON_TTL_DAYS = 30       # 문서 1개에서만 본 fingerprint는 이 기간 뒤 정리
+
+_RE_SEGMENT = re.compile(r"[^\n]+?(?:[.!?。！？…](?=\s)|$)", flags=re.MULTILINE)
+_RE_NON_WORD = re.compile(r"[^\w]+")
+_RE_DIGIT = re.compile(r"\d")
+_TITLE_MARK = "\x00title\x00"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS boilerplate_docs (
+    source      TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    doc_key     TEXT NOT NULL,
+    last_seen   TEXT NOT NULL,
+    PRIMARY KEY (source, fingerprint, doc_key)
+);
+"""
+
+
+# =========================
+# Fingerprint
+# =========================
+
+def _normalize(text: str) -> str:
+    return " ".join(_RE_NON_WORD.sub(" ", text.lower()).split())
+
+
+def segments(text: str) -> List[Tuple[int, int]]:
+    """문장 / 줄 단위 (start, end) — 앞뒤 공백 제외"""
+    spans = []
+    for m in _RE_SEGMENT.finditer(text):
+        start, end = m.start(), m.end()
+        while start < end and text[start].isspace():
+            start += 1
+        if start < end:
+            spans.append((start, end))
+    return spans
+
+
+def segment_fingerprint(segment: str, title: str = "") -> Optional[str]:
+    """짧은 segment는 None (판단 제외)"""
+    if len(segment) < MIN_SEGMENT_CHARS:
+        return None
+    normalized = _normalize(segment)
+    title = _normalize(title or "")
+    if title and len(title) >= 8:
+        normalized = normalized.replace(title, _TITLE_MARK)
+    return fast_digest(_RE_DIGIT.sub("0", normalized))
+
+
+def _source_of(item: Dict) -> str:
+    return item.get("source_name") or item.get("source") or ""
+
+
+def _doc_key(item: Dict, reference_id) -> str:
+    """문서 식별 키: canonical source_url, 없으면 레퍼런스 id"""
+    return canonicalize_url(item.get("source_url", "")) or str(reference_id)
+
+
+# =========================
+# Index
+# =========================
+
+class BoilerplateIndex:
+    """
+    (source, fingerprint) → 등장한 문서 키(canonical URL) 집합 누적
+    """
+
+    _LOOKUP_BATCH = 500
+
+    def __init__(self, path: str = BOILERPLATE_PATH):
+        self.path = path
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+        self._pending: Set[Tuple[str, str, str]] = set()
+        self._lock = threading.RLock()
+
+    def doc_counts(self, source: str, fp_docs: Dict[str, Set[str]]) -> Dict[str, int]:
+        """
+        fingerprint별 문서 수 = 이전 실행까지 commit된 문서 ∪ fp_docs (이번 배치 문서)
+        같은 문서가 양쪽에 있으면 1번만 셈
+        """
+        fps = sorted(fp_docs)
+        counts = {fp: len(docs) for fp, docs in fp_docs.items()}
+        with self._lock:
+            for i in range(0, len(fps), self._LOOKUP_BATCH):
+                batch = fps[i:i + self._LOOKUP_BATCH]
+                marks = ",".join("?" * len(batch))
+                rows = self._conn.execute(
+                    "SELECT fingerprint, COUNT(*) FROM boilerplate_docs "
+                    f"WHERE source = ? AND fingerprint IN ({marks}) GROUP BY fingerprint",
+                    [source, *batch],
+                ).fetchall()
+                for fp, n in rows:
+                    counts[fp] += n
+                # 이미 기록된 문서(재수집)는 중복 제외
+                rows = self._conn.execute(
+                    "SELECT fingerprint, doc_key FROM boilerplate_docs "
+                    f"WHERE source = ? AND fingerprint IN ({marks})",
+                    [source, *batch],
+                ).fetchall()
+                for fp, doc in rows:
+                    if doc in fp_docs[fp]:
+                        counts[fp] -= 1
+        return counts
+
+    def stage(self, source: str, fp_docs: Dict[str, Set[str]]) -> None:
+        with self._lock:
+            for fp, docs in fp_docs.items():
+                self._pending.update((source, fp, doc) for doc in docs)
+
+    def commit(self) -> None:
+        with self._lock:
+            if not self._pending:
+                return
+            now = datetime.utcnow()
+            self._conn.executemany(
+                """
+                INSERT INTO boilerplate_docs (source, fingerprint, doc_key, last_seen)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(source, fingerprint, doc_key) DO UPDATE SET
+                    last_seen = excluded.last_seen
+                """,
+                [(source, fp, doc, now.isoformat()) for source, fp, doc in self._pending],
+            )
+            cutoff = (now - timedelta(days=SINGLETON_TTL_DAYS)).isoformat()
+            self._conn.execute(
+                """
+                DELETE FROM boilerplate_docs
+                WHERE last_seen < ? AND (source, fingerprint) IN (
+                    SELECT source, fingerprint FROM boilerplate_docs
+                    GROUP BY source, fingerprint HAVING COUNT(*) < 2
+                )
+                """,
+                (cutoff,),
+            )
+            self._conn.commit()
+            self._pending = set()
+
+    def rollback(self) -> None:
+        with self._lock:
+            self._pending = set()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            total, boiler = self._conn.execute(
+                """
+                SELECT COUNT(*), COALESCE(SUM(docs >= ?), 0) FROM (
+                    SELECT COUNT(*) AS docs FROM boilerplate_docs GROUP BY source, fingerprint
+                )
+                """,
+                (MIN_DOC_FREQ,),
+            ).fetchone()
+        return {"fingerprints": total, "boilerplate": boiler}
+
+
+_index: Optional[BoilerplateIndex] = None
+
+
+def get_boilerplate_index() -> BoilerplateIndex:
+    global _index
+    if _index is None:
+        _index = BoilerplateIndex()
+    return _index
+
+
+# =========================
+# Filter
+# =========================
+
+def filter_boilerplate(
+    chunks,
+    items: List[Dict],
+    index: Optional[BoilerplateIndex] = None,
+    min_doc_freq: int = MIN_DOC_FREQ,
+) -> Tuple[List[Dict], Dict]:
+    """
+    chunks: chunk_items 결과 (dict 리스트) 또는 ChunkBatch
+    items: 같은 배치의 레퍼런스 (reference_id → source / title / source_url)
+    index: 주어지면 이전 실행 빈도를 더하고, 이번 배치 빈도를 staging (commit은 호출 측)
+
+    Returns:
+        kept:   상용구 제거 후 청크 — 입력과 같은 형식 (축약된 청크는 chunk_text / token_count 갱신)
+        report: { dropped, collapsed, tokens_saved, sources: { source: {chunks, dropped, collapsed, tokens_saved} } }
+    """
+    by_id = {item.get("id"): item for item in items}
+
+    # 1. 청크별 segment fingerprint + 소스별 문서(canonical URL) 빈도
+    parsed = []
+    docs_by_source: Dict[str, Dict[str, Set[str]]] = {}
+    for chunk in chunks:
+        ref_id = chunk.get("reference_id")
+        item = by_id.get(ref_id) or {}
+        source = _source_of(item)
+        doc = _doc_key(item, ref_id)
+        text = chunk["chunk_text"]
+        segs = [(s, e, segment_fingerprint(text[s:e], item.get("title", ""))) for s, e in segments(text)]
+        parsed.append((chunk, source, segs))
+        fp_docs = docs_by_source.setdefault(source, {})
+        for _, _, fp in segs:
+            if fp:
+                fp_docs.setdefault(fp, set()).add(doc)
+
+    boilerplate: Dict[str, Set[str]] = {}
+    for source, fp_docs in docs_by_source.items():
+        if index is not None:
+            counts = index.doc_counts(source, fp_docs)
+            index.stage(source, fp_docs)
+        else:
+            counts = {fp: len(docs) for fp, docs in fp_docs.items()}
+        boilerplate[source] = {fp for fp, n in counts.items() if n >= min_doc_freq}
+
+    # 2. drop / collapse
+    tokenizer = get_tokenizer()
+    keep: List[int] = []
+    collapsed: Dict[int, Tuple[str, int]] = {}
+    report = {"dropped": 0, "collapsed": 0, "tokens_saved": 0, "sources": {}}
+    for i, (chunk, source, segs) in enumerate(parsed):
+        src = report["sources"].setdefault(source, {"chunks": 0, "dropped": 0, "collapsed": 0, "tokens_saved": 0})
+        src["chunks"] += 1
+        boiler = boilerplate.get(source, set())
+        if not any(fp in boiler for _, _, fp in segs):
+            keep.append(i)
+            continue
+
+        text = chunk["chunk_text"]
+        before = chunk.get("token_count") or tokenizer.count(text)
+        remaining = " ".join(text[s:e] for s, e, fp in segs if fp not in boiler)
+        after = tokenizer.count(remaining) if remaining else 0
+        if after < MIN_CHUNK_TOKENS:
+            key, saved = "dropped", before
+        else:
+            key, saved = "collapsed", before - after
+            keep.append(i)
+            collapsed[i] = (remaining, after)
+        for counter in (report, src):
+            counter[key] += 1
+            counter["tokens_saved"] += saved
+
+    if isinstance(chunks, ChunkBatch):
+        for i, (text, tokens) in collapsed.items():
+            chunks.set_text(i, text, tokens)
+        return chunks.select(keep), report
+
+    kept = [
+        {
+            **{k: v for k, v in chunks[i].items() if k not in ("char_start", "char_end")},
+            "chunk_text": collapsed[i][0], "token_count": collapsed[i][1],
+        } if i in collapsed else chunks[i]
+        for i in keep
+    ]
+    return kept, report
@@ -0,0 +1,218 @@
+"""
+chunkBatch.py
+
+Module A - Chunker
+- 청크를 청크별 dict 대신 컬럼 단위로 보관 (chunker → boilerplateFilter → embedder → writer 공유)
+- 문자열 컬럼은 list, 정수 컬럼은 array('i'), 플래그는 numpy bool
+- 임베딩은 (청크 수 × 차원) float32 버퍼 1개 — Python float list는 writer가 전송 배치 단위로만 생성
+- 단계 간 복사 없음: 각 단계는 같은 배치에 컬럼을 채우거나, select()로 남길 행만 추림
+
+행 접근:
+- batch[i] / iter(batch) → ChunkRow (__slots__ 뷰, 읽기 전용 Mapping)
+  기존 dict 청크처럼 row["chunk_text"], row.get("token_count") 사용 가능
+- to_dicts() / from_dicts(): 기존 dict 리스트 API와의 변환
+"""
+
+from array import array
+from collections.abc import Mapping
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+
+import numpy as np
+
+
+ROW_KEYS = (
+    "reference_id", "chunk_index", "chunk_text", "token_count",
+    "char_start", "char_end", "chunk_hash", "embedding", "_skipped",
+)
+
+
+class ChunkRow(Mapping):
+    """ChunkBatch의 i번째 행 뷰 (값 복사 없음)"""
+
+    __slots__ = ("_batch", "_i")
+
+    def __init__(self, batch: "ChunkBatch", i: int):
+        self._batch = batch
+        self._i = i
+
+    def __getitem__(self, key: str):
+        b, i = self._batch, self._i
+        if key == "reference_id":
+            return b.reference_id[i]
+        if key == "chunk_index":
+            return b.chunk_index[i]
+        if key == "chunk_text":
+            return b.chunk_text[i]
+        if key == "token_count":
+            return b.token_count[i]
+        if key == "char_start":
+            return b.char_start[i]
+        if key == "char_end":
+            return b.char_end[i]
+        if key == "chunk_hash":
+            return b.chunk_hash[i]
+        if key == "embedding":
+            return b.embedding(i)
+        if key == "_skipped":
+            return bool(b.skipped[i])
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(ROW_KEYS)
+
+    def __len__(self) -> int:
+        return len(ROW_KEYS)
+
+    def __repr__(self) -> str:
+        return f"ChunkRow({self._batch.reference_id[self._i]!r}, {self._batch.chunk_index[self._i]})"
+
+
+class ChunkBatch:
+    """
+    batch = chunk_batch(items)
+    batch, report = filter_boilerplate(batch, items)
+    embed_batch(batch, store=get_embedding_store())
+    insert_chunks(batch, saved_refs, items)
+    """
+
+    def __init__(self):
+        self.reference_id: List[str] = []
+        self.chunk_index = array("i")
+        self.chunk_text: List[str] = []
+        self.token_count = array("i")
+        self.char_start = array("i")
+        self.char_end = array("i")
+        self.chunk_hash: List[Optional[str]] = []
+        self._skipped: Optional[np.ndarray] = None
+        self._has_embedding: Optional[np.ndarray] = None
+        self.embeddings: Optional[np.ndarray] = None     # (n, dim) float32, 첫 set_embeddings 때 할당
+
+    # ── build ───────────────────────────────────────
+
+    def append(
+        self,
+        reference_id: str,
+        chunk_index: int,
+        chunk_text: str,
+        token_count: int = 0,
+        char_start: int = -1,
+        char_end: int = -1,
+    ) -> None:
+        """청킹 단계 전용 (hash / embedding 채우기 전)"""
+        self.reference_id.append(reference_id)
+        self.chunk_index.append(chunk_index)
+        self.chunk_text.append(chunk_text)
+        self.token_count.append(token_count)
+        self.char_start.append(char_start)
+        self.char_end.append(char_end)
+        self.chunk_hash.append(None)
+
+    @classmethod
+    def from_dicts(cls, chunks: Iterable[Dict]) -> "ChunkBatch":
+        batch = cls()
+        for c in chunks:
+            batch.append(
+                c["reference_id"], c.get("chunk_index", 0), c["chunk_text"],
+                c.get("token_count") or 0, c.get("char_start", -1), c.get("char_end", -1),
+            )
+        return batch
+
+    # ── columns ─────────────────────────────────────
+
+    def __len__(self) -> int:
+        return len(self.chunk_text)
+
+    def __getitem__(self, i: int) -> ChunkRow:
+        if not -len(self) <= i < len(self):
+            raise IndexError(i)
+        return ChunkRow(self, i % len(self))
+
+    def __iter__(self) -> Iterator[ChunkRow]:
+        return (ChunkRow(self, i) for i in range(len(self)))
+
+    @property
+    def skipped(self) -> np.ndarray:
+        if self._skipped is None or len(self._skipped) != len(self):
+            self._skipped = np.zeros(len(self), dtype=bool)
+        return self._skipped
+
+    @property
+    def has_embedding(self) -> np.ndarray:
+        if self._has_embedding is None or len(self._has_embedding) != len(self):
+            self._has_embedding = np.zeros(len(self), dtype=bool)
+        return self._has_embedding
+
+    def set_text(self, i: int, chunk_text: str, token_count: int) -> None:
+        """i행 텍스트 교체 (축약 등) — 원문 오프셋은 더 이상 맞지 않으므로 -1, 해시는 재계산 대상"""
+        self.chunk_text[i] = chunk_text
+        self.token_count[i] = token_count
+        self.char_start[i] = self.char_end[i] = -1
+        self.chunk_hash[i] = None
+
+    def set_embeddings(self, indices: Sequence[int], vectors: Sequence[Sequence[float]]) -> None:
+        """indices 행에 임베딩 기록 (float32로 변환해 버퍼에 직접 복사)"""
+        if not len(indices):
+            return
+        block = np.asarray(vectors, dtype=np.float32)
+        if self.embeddings is None:
+            self.embeddings = np.zeros((len(self), block.shape[1]), dtype=np.float32)
+        self.embeddings[np.asarray(indices)] = block
+        self.has_embedding[np.asarray(indices)] = True
+
+    def embedding(self, i: int) -> Optional[np.ndarray]:
+        """i행 임베딩 (버퍼 view) — 없으면 None"""
+        if self.embeddings is None or not self.has_embedding[i]:
+            return None
+        return self.embeddings[i]
+
+    def embedded_count(self) -> int:
+        """이번 실행에서 새로 임베딩된 행 수 (캐시 스킵 제외)"""
+        return int((self.has_embedding & ~self.skipped).sum())
+
+    # ── select / export ─────────────────────────────
+
+    def select(self, indices: Sequence[int]) -> "ChunkBatch":
+        """indices 행만 남긴 새 배치 (임베딩 버퍼는 해당 행만 복사)"""
+        out = ChunkBatch()
+        idx = list(indices)
+        out.reference_id = [self.reference_id[i] for i in idx]
+        out.chunk_index = array("i", (self.chunk_index[i] for i in idx))
+        out.chunk_text = [self.chunk_text[i] for i in idx]
+        out.token_count = array("i", (self.token_count[i] for i in idx))
+        out.char_start = array("i", (self.char_start[i] for i in idx))
+        out.char_end = array("i", (self.char_end[i] for i in idx))
+        out.chunk_hash = [self.chunk_hash[i] for i in idx]
+        take = np.asarray(idx, dtype=np.intp)
+        out._skipped = self.skipped[take]
+        out._has_embedding = self.has_embedding[take]
+        if self.embeddings is not None:
+            out.embeddings = self.embeddings[take]
+        return out
+
+    def to_dicts(self) -> List[Dict]:
+        """기존 dict 청크 형식 (embedding은 list[float] 또는 None)"""
+        out = []
+        for i in range(len(self)):
+            row = {
+                "reference_id": self.reference_id[i],
+                "chunk_index": self.chunk_index[i],
+                "chunk_text": self.chunk_text[i],
+            }
+            if self.token_count[i]:
+                row["token_count"] = self.token_count[i]
+            if self.char_start[i] >= 0:
+                row["char_start"], row["char_end"] = self.char_start[i], self.char_end[i]
+            if self.chunk_hash[i] is not None:
+                row["chunk_hash"] = self.chunk_hash[i]
+                emb = self.embedding(i)
+                row["embedding"] = emb.tolist() if emb is not None else None
+            if self.skipped[i]:
+                row["_skipped"] = True
+            out.append(row)
+        return out
+
+    def nbytes(self) -> int:
+        """숫자 컬럼 + 임베딩 버퍼 크기 (문자열 제외)"""
+        size = sum(col.itemsize * len(col) for col in (self.chunk_index, self.token_count, self.char_start, self.char_end))
+        size += self.skipped.nbytes + self.has_embedding.nbytes
+        return size + (self.embeddings.nbytes if self.embeddings is not None else 0)
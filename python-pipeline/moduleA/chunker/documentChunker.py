@@ -6,19 +6,142 @@ Module A - Chunker
 - 의미 해석 / 요약 / 분류 금지
 - 단순 텍스트 분할만 수행
 
-Chunk strategy:
+Chunk strategy (mode="tokens"):
+- 임베딩 모델 토큰 기준 최대 CHUNK_TOKENS, CHUNK_OVERLAP_TOKENS 오버랩
+- 경계는 문장 끝 우선, 아니면 단어 사이 공백 (둘 다 청크가 SNAP_MIN_RATIO 이상 찼을 때만)
+  → 그래도 없으면 (공백 없이 긴 구간) 토큰 경계에서 절단
+- 분할 결과는 원문 (start, end) 오프셋 + token_count — chunk_item에서 한 번만 chunk_text로 잘라냄
+- MIN_CHUNK_TOKENS 미만 청크는 버림
+- 마지막 창의 새 내용(오버랩 제외)이 MIN_CHUNK_TOKENS 이상 되도록 직전 창 끝을 당김
+- tokenizer: tiktoken (모델 인코딩, 1회 로드 후 캐시). 미설치 / 로드 실패 시 근사 토크나이저
+
+Chunk strategy (mode="cdc", content-defined):
+- 경계 위치를 내용으로 결정: 문자 단위 gear rolling hash (최근 ~32자에만 의존)의
+  상위 CDC_MASK_BITS 비트가 0인 단어 끝(공백 없는 한자 / 가나 구간은 글자 사이)에서 자름
+- 토큰 수 CDC_MIN_TOKENS 이상일 때만 경계 인정, CDC_MAX_TOKENS 초과 시 완화 조건(비트 수 - CDC_BACKUP_BITS)을
+  만족한 마지막 위치에서 절단 (그것도 없을 때만 위치 기준 강제 절단)
+- 문서 앞부분에 문장이 추가 / 수정돼도 이후 경계는 같은 위치로 다시 맞춰짐
+  → 뒤쪽 청크의 chunk_hash가 그대로 → 임베딩 캐시 재사용 (오버랩 없음)
+
+Chunk strategy (mode="structure", 기본 — 문단 / 섹션 기준):
+- 줄(문단) 단위 블록 = 크롤러 섹션 힌트 (articleExtractor가 블록 태그마다 "\n\n"으로 구분)
+- 짧고 문장부호로 끝나지 않는 블록(제목, h1~h4)은 섹션 시작 → 청크가 섹션을 넘지 않음
+  (제목만 있는 조각은 다음 섹션 본문과 합침 — 제목만 있는 청크 방지)
+- 청크가 STRUCT_MIN_TOKENS 미만인 상태에서 다음 문단이 넘치면 문단을 문장 단위로 나눠 채움
+- 섹션 안에서는 문단을 통째로 STRUCT_MAX_TOKENS까지 채움 → 넘치는 문단은 문장 단위 → 넘치는 문장은 토큰 분할
+- 오버랩 없음 → 오버랩만 남은 꼬리 청크(임베딩 호출 낭비) 없음, 마지막 청크가 작으면 앞 청크에 합침
+- 수정된 문단이 속한 섹션의 청크만 바뀜 → 나머지 chunk_hash 재사용
+
+출력:
+- chunk_items: 청크 dict 리스트
+- chunk_batch: ChunkBatch (컬럼 저장, runDaily 경로 — 청크별 dict 생성 없음)
+- chunk_report: 레퍼런스당 청크 수 / 평균 채움 비율 (token_count ÷ 모드별 최대 토큰)
+
+Chunk strategy (mode="chars", 이전 방식):
 - 최대 500자 단위
 - 200자 오버랩
 - 최소 50자 이하 청크는 버림
 """
 
-from typing import List, Dict
+import random
+import re
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Tuple
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+from moduleA.chunker.chunkBatch import ChunkBatch
 
 
+EMBED_MODEL = "text-embedding-3-small"    # textEmbedder.MODEL과 같은 토크나이저
+
+CHUNK_MODE = "structure"
+CHUNK_TOKENS = 128
+CHUNK_OVERLAP_TOKENS = 48
+MIN_CHUNK_TOKENS = 12
+SNAP_MIN_RATIO = 0.5
+
+CDC_MIN_TOKENS = 48
+CDC_MAX_TOKENS = 160
+CDC_MASK_BITS = 5           # 후보 경계당 1/32 확률 → 평균 청크 ≈ 최소 + 32 단어
+CDC_BACKUP_BITS = 2         # 최대 크기 도달 시 쓰는 완화 조건 (mask_bits - 2 비트)
+CDC_SEED = 7
+
+STRUCT_MAX_TOKENS = 160
+STRUCT_MIN_TOKENS = 48      # 청크가 이보다 작은데 다음 문단이 넘치면 문단을 문장 단위로 나눠 채움
+HEADING_MAX_TOKENS = 16     # 이하 + 문장부호로 끝나지 않는 블록 = 섹션 제목
+
 CHUNK_SIZE = 500
 CHUNK_OVERLAP = 200
 MIN_CHUNK_LEN = 50
 
+_RE_WORD = re.compile(r"\S+")
+_RE_BLOCK = re.compile(r"[^\n]*\S[^\n]*")
+_SENTENCE_END = ".!?。！？…"
+_RE_UNSPACED = re.compile(r"[぀-ヿ一-鿿]")     # 공백 없이 쓰는 문자 (가나 / 한자) → 글자 사이도 경계 후보
+_gear_rng = random.Random(CDC_SEED)
+_GEAR = [_gear_rng.getrandbits(32) for _ in range(256)]
+
+# 근사 토큰: 한글 / 가나 / 한자 1자, 숫자 3자리, 그 외 문자 6자까지, 기호 1개
+_RE_APPROX_TOKEN = re.compile(
+    r"[ᄀ-ᇿ぀-ヿ㄰-㆏一-鿿가-힣]"
+    r"|\d{1,3}"
+    r"|[^\W\d_]{1,6}"
+    r"|\S"
+)
+
+
+class ChunkSpan(NamedTuple):
+    start: int
+    end: int
+    token_count: int
+
+
+# =========================
+# Tokenizer
+# =========================
+
+class _TiktokenTokenizer:
+    def __init__(self, encoding):
+        self.name = encoding.name
+        self._encoding = encoding
+
+    def offsets(self, text: str) -> List[int]:
+        """토큰별 시작 문자 오프셋 (오름차순)"""
+        tokens = self._encoding.encode(text, disallowed_special=())
+        return self._encoding.decode_with_offsets(tokens)[1]
+
+    def count(self, text: str) -> int:
+        return len(self._encoding.encode(text, disallowed_special=()))
+
+
+class _ApproxTokenizer:
+    name = "approx"
+
+    def offsets(self, text: str) -> List[int]:
+        return [m.start() for m in _RE_APPROX_TOKEN.finditer(text)]
+
+    def count(self, text: str) -> int:
+        return len(_RE_APPROX_TOKEN.findall(text))
+
+
+@lru_cache(maxsize=None)
+def get_tokenizer(model: str = EMBED_MODEL):
+    if tiktoken is not None:
+        try:
+            return _TiktokenTokenizer(tiktoken.encoding_for_model(model))
+        except Exception as e:
+            print(f"[CHUNK] tiktoken 인코딩 로드 실패 — 근사 토크나이저 사용: {e}")
+    return _ApproxTokenizer()
+
+
+# =========================
+# Split
+# =========================
 
 def _split_text(text: str) -> List[str]:
     chunks = []
@@ -35,33 +158,366 @@ def _split_text(text: str) -> List[str]:
     return chunks
 
 
-def chunk_item(item: Dict) -> List[Dict]:
+def _last_at_most(positions: List[int], limit: int) -> int:
+    i = bisect_right(positions, limit)
+    return positions[i - 1] if i else -1
+
+
+def split_spans(
+    text: str,
+    max_tokens: int = CHUNK_TOKENS,
+    overlap: int = CHUNK_OVERLAP_TOKENS,
+    min_tokens: int = MIN_CHUNK_TOKENS,
+    tokenizer=None,
+) -> List[ChunkSpan]:
     """
-    레퍼런스 1개 → 청크 리스트
-    각 청크는 reference_id + chunk_index + chunk_text 포함
+    text → 청크 오프셋 목록 (문자열 복사 없음)
+    각 span은 단어 시작에서 시작해 문장 끝 / 단어 끝에서 끝남 (앞뒤 공백 미포함)
+    """
+    if overlap >= max_tokens:
+        raise ValueError("overlap must be smaller than max_tokens")
+    tokenizer = tokenizer or get_tokenizer()
+    offs = tokenizer.offsets(text)
+    words = [(m.start(), m.end()) for m in _RE_WORD.finditer(text)]
+    if not offs or not words:
+        return []
+
+    starts = [s for s, _ in words]
+    ends = [e for _, e in words]
+    sentence_ends = [
+        e for i, (_, e) in enumerate(words)
+        if text[e - 1] in _SENTENCE_END
+        or "\n" in text[e: starts[i + 1] if i + 1 < len(words) else len(text)]
+    ]
+    n = len(offs)
+
+    def token_at(pos: int) -> int:
+        """pos 문자를 포함하는 토큰 index"""
+        return max(bisect_right(offs, pos) - 1, 0)
+
+    def count(start: int, end: int) -> int:
+        return bisect_left(offs, end) - token_at(start)
+
+    spans: List[ChunkSpan] = []
+    start = starts[0]
+    while True:
+        t0 = token_at(start)
+        cut = False
+        if t0 + max_tokens >= n:
+            end = ends[-1]
+        else:
+            limit = offs[t0 + max_tokens]   # 청크에 들어가지 못하는 첫 토큰의 시작
+            min_fill = max_tokens * SNAP_MIN_RATIO
+            if n - (t0 + max_tokens) < min_tokens and max_tokens - min_tokens >= min_fill:
+                limit = offs[n - min_tokens]    # 마지막 창이 오버랩만 남지 않도록 새 내용 min_tokens 확보
+            sentence = _last_at_most(sentence_ends, limit)
+            word = _last_at_most(ends, limit)
+            if sentence > start and count(start, sentence) >= min_fill:
+                end = sentence
+            elif word > start and count(start, word) >= min_fill:
+                end = word
+            else:
+                end, cut = limit, True      # 뒤따르는 공백 없는 긴 구간 → 토큰 경계에서 절단
+
+        tokens = count(start, end)
+        if tokens >= min_tokens:
+            spans.append(ChunkSpan(start, end, tokens))
+        if end >= ends[-1]:
+            return spans
+
+        # 오버랩: 끝에서 overlap 토큰 앞 이후의 첫 단어 시작 (항상 start보다 뒤)
+        back = offs[max(bisect_left(offs, end) - overlap, t0 + 1)]
+        if cut and back <= end and bisect_left(starts, back) == bisect_left(starts, end):
+            start = back        # 공백 없는 구간 내부 → 토큰 경계에서 재개
+        else:
+            k = bisect_left(starts, back)
+            if k >= len(starts):
+                return spans
+            start = starts[k]
+
+
+def _gear_hashes(text: str, positions: List[int]) -> List[int]:
+    """positions(오름차순, 1..len) 각 위치 직전까지의 gear rolling hash (32bit)"""
+    out: List[int] = []
+    h, k, n = 0, 0, len(positions)
+    gear = _GEAR
+    for i, c in enumerate(text, 1):
+        h = ((h << 1) + gear[ord(c) & 0xFF]) & 0xFFFFFFFF
+        if k < n and positions[k] == i:
+            out.append(h)
+            k += 1
+    return out
+
+
+def cdc_spans(
+    text: str,
+    min_tokens: int = CDC_MIN_TOKENS,
+    max_tokens: int = CDC_MAX_TOKENS,
+    mask_bits: int = CDC_MASK_BITS,
+    tokenizer=None,
+) -> List[ChunkSpan]:
+    """
+    content-defined 청크 오프셋 목록 (오버랩 없음, 문자열 복사 없음)
+    마지막 청크가 MIN_CHUNK_TOKENS 미만이면 앞 청크에 합침 (max_tokens를 넘으면 대신 경계를 앞으로 당김)
+    """
+    if min_tokens >= max_tokens:
+        raise ValueError("min_tokens must be smaller than max_tokens")
+    tokenizer = tokenizer or get_tokenizer()
+    offs = tokenizer.offsets(text)
+    words = [(m.start(), m.end()) for m in _RE_WORD.finditer(text)]
+    if not offs or not words:
+        return []
+
+    starts = [s for s, _ in words]
+    last = words[-1][1]
+    candidates = sorted({e for _, e in words} | {m.end() for m in _RE_UNSPACED.finditer(text)})
+    hashes = _gear_hashes(text, candidates)
+    shift = 32 - mask_bits
+    backup_shift = 32 - max(mask_bits - CDC_BACKUP_BITS, 1)
+
+    def token_at(pos: int) -> int:
+        return max(bisect_right(offs, pos) - 1, 0)
+
+    def count(start: int, end: int) -> int:
+        return bisect_left(offs, end) - token_at(start)
+
+    def next_start(pos: int) -> int:
+        if pos < len(text) and not text[pos].isspace():
+            return pos
+        k = bisect_left(starts, pos)
+        return starts[k] if k < len(starts) else len(text)
+
+    spans: List[ChunkSpan] = []
+    start, prev, backup, i = starts[0], -1, -1, 0
+    while i < len(candidates):
+        pos = candidates[i]
+        if pos <= start:
+            i += 1
+            continue
+        tokens = count(start, pos)
+        if tokens > max_tokens:
+            # 최대 초과 → 완화 조건(backup) 경계, 없으면 직전 후보에서 자르고 pos는 새 청크 기준으로 다시 판단
+            end = backup if backup > start else prev if prev > start else offs[token_at(start) + max_tokens]
+        elif tokens >= min_tokens and hashes[i] >> shift == 0:
+            end = pos
+            i += 1
+        else:
+            if tokens >= min_tokens and hashes[i] >> backup_shift == 0:
+                backup = pos
+            prev = pos
+            i += 1
+            continue
+        spans.append(ChunkSpan(start, end, count(start, end)))
+        start, prev, backup = next_start(end), -1, -1
+
+    if start < last:
+        tail = ChunkSpan(start, last, count(start, last))
+        if tail.token_count < MIN_CHUNK_TOKENS and spans:
+            head = spans.pop()
+            if count(head.start, last) <= max_tokens:
+                tail = ChunkSpan(head.start, last, count(head.start, last))
+            else:
+                # 합치면 max_tokens 초과 → 앞 청크 끝을 당겨 꼬리가 MIN_CHUNK_TOKENS를 채우게 함
+                k = bisect_left(candidates, tail.start) - 1
+                while k >= 0 and candidates[k] > head.start and count(next_start(candidates[k]), last) < MIN_CHUNK_TOKENS:
+                    k -= 1
+                if k >= 0 and candidates[k] > head.start:
+                    end = candidates[k]
+                    head = ChunkSpan(head.start, end, count(head.start, end))
+                    tail = ChunkSpan(next_start(end), last, count(next_start(end), last))
+                spans.append(head)
+        spans.append(tail)
+    return [span for span in spans if span.token_count >= MIN_CHUNK_TOKENS]
+
+
+def _blocks(text: str) -> List[Tuple[int, int]]:
+    """줄 단위 블록 (start, end) — 앞뒤 공백 제외"""
+    spans = []
+    for m in _RE_BLOCK.finditer(text):
+        start, end = m.start(), m.end()
+        while text[start].isspace():
+            start += 1
+        while text[end - 1].isspace():
+            end -= 1
+        spans.append((start, end))
+    return spans
+
+
+def _sentences(text: str, start: int, end: int) -> List[Tuple[int, int]]:
+    """[start, end) 구간의 문장 (start, end) — 문장부호로 끝나는 단어 뒤에서 자름"""
+    spans, s = [], None
+    for m in _RE_WORD.finditer(text, start, end):
+        if s is None:
+            s = m.start()
+        if text[m.end() - 1] in _SENTENCE_END:
+            spans.append((s, m.end()))
+            s = None
+    if s is not None:
+        spans.append((s, end))
+    return spans
+
+
+def structure_spans(
+    text: str,
+    max_tokens: int = STRUCT_MAX_TOKENS,
+    min_tokens: int = STRUCT_MIN_TOKENS,
+    tokenizer=None,
+) -> List[ChunkSpan]:
+    """
+    문단 / 섹션 기준 청크 오프셋 목록 (오버랩 없음, 문자열 복사 없음)
+    청크는 섹션 경계를 넘지 않음 (제목만 있는 조각 / MIN_CHUNK_TOKENS 미만 조각 제외)
+    문단 → 문장 → 토큰 순으로만 더 잘게 나눔. 앞 조각이 min_tokens 미만이면 다음 문단을 문장 단위로 나눠 채움
     """
-    full_text = " ".join(filter(None, [
+    if min_tokens >= max_tokens:
+        raise ValueError("min_tokens must be smaller than max_tokens")
+    tokenizer = tokenizer or get_tokenizer()
+    offs = tokenizer.offsets(text)
+    blocks = _blocks(text)
+    if not offs or not blocks:
+        return []
+
+    def token_at(pos: int) -> int:
+        return max(bisect_right(offs, pos) - 1, 0)
+
+    def count(start: int, end: int) -> int:
+        return bisect_left(offs, end) - token_at(start)
+
+    spans: List[ChunkSpan] = []
+    cur = None      # [start, end]
+
+    def flush() -> None:
+        nonlocal cur
+        if cur is not None:
+            spans.append(ChunkSpan(cur[0], cur[1], count(cur[0], cur[1])))
+        cur = None
+
+    def pieces(start: int, end: int, budget: int) -> List[Tuple[int, int]]:
+        """문장 → budget 토큰 이하 조각 (오버랩 없음, 마지막 조각도 MIN_CHUNK_TOKENS 확보)"""
+        sub = split_spans(text[start:end], budget, 0, max(min(MIN_CHUNK_TOKENS, budget // 2), 1), tokenizer)
+        return [(start + p.start, start + p.end) for p in sub] or [(start, end)]
+
+    def add(start: int, end: int, level: int) -> None:
+        """level 0 = 문단, 1 = 문장, 2 = 토큰 조각"""
+        nonlocal cur
+        if cur is not None and count(cur[0], end) <= max_tokens:
+            cur[1] = end
+            return
+        small = cur is not None and count(cur[0], cur[1]) < min_tokens
+        if level == 2 or (count(start, end) <= max_tokens and not small):
+            flush()
+            cur = [start, end]
+            return
+        # 넘치는 단위, 또는 앞 조각(제목 등)이 작아 따로 내보내면 안 됨 → 한 단계 잘게
+        units = _sentences(text, start, end) if level == 0 else []
+        if len(units) > 1:
+            for s, e in units:
+                add(s, e, 1)
+            return
+        room = max_tokens - count(cur[0], cur[1]) if small else max_tokens
+        for s, e in pieces(start, end, max(room, 1)):
+            add(s, e, 2)
+
+    heading_only = False
+    for start, end in blocks:
+        heading = text[end - 1] not in _SENTENCE_END and count(start, end) <= HEADING_MAX_TOKENS
+        if heading and cur is not None and not heading_only and count(cur[0], cur[1]) >= MIN_CHUNK_TOKENS:
+            flush()     # 섹션 경계 (제목만 있거나 버려질 만큼 작은 조각은 다음 섹션으로)
+        carried = cur is None or heading_only
+        add(start, end, 0)
+        heading_only = heading and (carried or cur[0] == start)
+    flush()
+
+    if len(spans) > 1 and spans[-1].token_count < MIN_CHUNK_TOKENS:
+        tail, head = spans.pop(), spans.pop()
+        if count(head.start, tail.end) <= max_tokens:
+            spans.append(ChunkSpan(head.start, tail.end, count(head.start, tail.end)))
+        else:
+            spans.extend([head, tail])
+    return [span for span in spans if span.token_count >= MIN_CHUNK_TOKENS]
+
+
+def _iter_item_chunks(item: Dict, mode: str) -> Iterator[Tuple[str, int, int, int]]:
+    """레퍼런스 1개 → (chunk_text, token_count, char_start, char_end). chars 모드는 token_count 0 / 오프셋 -1"""
+    sep = "\n\n" if mode == "structure" else " "    # structure: 제목도 하나의 블록
+    full_text = sep.join(filter(None, [
         item.get("title", ""),
         item.get("body_text", ""),
     ])).strip()
 
     if not full_text:
-        return []
+        return
+    if mode == "chars":
+        for chunk in _split_text(full_text):
+            yield chunk, 0, -1, -1
+        return
+    if mode == "tokens":
+        spans = split_spans(full_text)
+    elif mode == "cdc":
+        spans = cdc_spans(full_text)
+    elif mode == "structure":
+        spans = structure_spans(full_text)
+    else:
+        raise ValueError(f"unknown chunk mode: {mode}")
 
-    raw_chunks = _split_text(full_text)
+    for span in spans:
+        yield full_text[span.start:span.end], span.token_count, span.start, span.end
 
-    return [
-        {
-            "reference_id": item["id"],
-            "chunk_index": i,
-            "chunk_text": chunk,
-        }
-        for i, chunk in enumerate(raw_chunks)
-    ]
+
+def chunk_item(item: Dict, mode: str = CHUNK_MODE) -> List[Dict]:
+    """
+    레퍼런스 1개 → 청크 리스트
+    각 청크는 reference_id + chunk_index + chunk_text 포함
+    mode="structure" / "tokens" / "cdc"이면 + token_count / char_start / char_end (full_text 기준)
+    """
+    chunks = []
+    for i, (text, tokens, start, end) in enumerate(_iter_item_chunks(item, mode)):
+        chunk = {"reference_id": item["id"], "chunk_index": i, "chunk_text": text}
+        if start >= 0:
+            chunk.update(token_count=tokens, char_start=start, char_end=end)
+        chunks.append(chunk)
+    return chunks
 
 
-def chunk_items(items: List[Dict]) -> List[Dict]:
+def chunk_items(items: List[Dict], mode: str = CHUNK_MODE) -> List[Dict]:
     all_chunks = []
     for item in items:
-        all_chunks.extend(chunk_item(item))
+        all_chunks.extend(chunk_item(item, mode=mode))
     return all_chunks
+
+
+def chunk_batch(items: Iterable[Dict], mode: str = CHUNK_MODE) -> ChunkBatch:
+    """
+    chunk_items와 같은 분할, 청크별 dict 없이 ChunkBatch 컬럼에 바로 추가
+    """
+    batch = ChunkBatch()
+    for item in items:
+        for i, (text, tokens, start, end) in enumerate(_iter_item_chunks(item, mode)):
+            batch.append(item["id"], i, text, tokens, start, end)
+    return batch
+
+
+MODE_MAX_TOKENS = {"structure": STRUCT_MAX_TOKENS, "tokens": CHUNK_TOKENS, "cdc": CDC_MAX_TOKENS}
+
+
+def chunk_report(chunks, mode: str = CHUNK_MODE) -> Dict:
+    """
+    chunk_items / chunk_batch 결과 집계
+    fill_ratio: token_count ÷ 모드별 최대 토큰의 평균 (낮을수록 임베딩 호출당 내용이 적음)
+    """
+    per_ref: Dict[str, int] = {}
+    fills: List[float] = []
+    budget = MODE_MAX_TOKENS.get(mode)
+    for chunk in chunks:
+        ref = chunk["reference_id"]
+        per_ref[ref] = per_ref.get(ref, 0) + 1
+        tokens = chunk.get("token_count")
+        if budget and tokens:
+            fills.append(tokens / budget)
+    total = sum(per_ref.values())
+    return {
+        "references": len(per_ref),
+        "chunks": total,
+        "chunks_per_reference": round(total / len(per_ref), 2) if per_ref else 0.0,
+        "max_chunks_per_reference": max(per_ref.values(), default=0),
+        "fill_ratio": round(sum(fills) / len(fills), 3) if fills else 0.0,
+    }
@@ -0,0 +1,127 @@
+"""
+articleCache.py
+
+Module A - Collector
+- 기사 URL별 본문 캐시 (SQLite)
+- 저장: HTTP validator(ETag / Last-Modified), 원문 HTML의 content_hash, 추출된 본문
+- FRESH_DAYS 이내 캐시는 요청 없이 재사용, 이후에는 조건부 GET
+  - 304 또는 content_hash 동일 → 재추출 없이 캐시 본문 사용
+- 재수집해도 안전한 캐시이므로 staging 없이 즉시 기록
+"""
+
+import os
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+STATE_DIR = os.path.join(BASE_DIR, "data", "state")
+ARTICLE_CACHE_PATH = os.path.join(STATE_DIR, "article_cache.db")
+
+FRESH_DAYS = 7
+
+
+class ArticleCache:
+    """
+    url → { etag, last_modified, content_hash, text, fetched_at }
+    """
+
+    def __init__(self, path: str = ARTICLE_CACHE_PATH):
+        self.path = path
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS articles (
+                url           TEXT PRIMARY KEY,
+                etag          TEXT,
+                last_modified TEXT,
+                content_hash  TEXT NOT NULL,
+                text          TEXT NOT NULL,
+                fetched_at    TEXT NOT NULL
+            )
+        """)
+        self._conn.commit()
+        self._lock = threading.Lock()
+
+    def lookup(self, url: str) -> Optional[Dict]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT etag, last_modified, content_hash, text, fetched_at FROM articles WHERE url = ?",
+                (url,),
+            ).fetchone()
+        if row is None:
+            return None
+        etag, last_modified, content_hash, text, fetched_at = row
+        return {
+            "etag": etag,
+            "last_modified": last_modified,
+            "content_hash": content_hash,
+            "text": text,
+            "fetched_at": fetched_at,
+        }
+
+    @staticmethod
+    def is_fresh(entry: Dict, now: Optional[datetime] = None) -> bool:
+        now = now or datetime.utcnow()
+        return now - datetime.fromisoformat(entry["fetched_at"]) < timedelta(days=FRESH_DAYS)
+
+    @staticmethod
+    def conditional_headers(entry: Optional[Dict]) -> Dict[str, str]:
+        headers = {}
+        if entry and entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry and entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def store(
+        self,
+        url: str,
+        content_hash: str,
+        text: str,
+        response_headers: Optional[Dict[str, str]] = None,
+        now: Optional[datetime] = None,
+    ) -> None:
+        response_headers = response_headers or {}
+        now = now or datetime.utcnow()
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT INTO articles (url, etag, last_modified, content_hash, text, fetched_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(url) DO UPDATE SET
+                    etag = excluded.etag,
+                    last_modified = excluded.last_modified,
+                    content_hash = excluded.content_hash,
+                    text = excluded.text,
+                    fetched_at = excluded.fetched_at
+                """,
+                (
+                    url,
+                    response_headers.get("etag"),
+                    response_headers.get("last-modified"),
+                    content_hash,
+                    text,
+                    now.isoformat(),
+                ),
+            )
+            self._conn.commit()
+
+    def touch(self, url: str, now: Optional[datetime] = None) -> None:
+        """변경 없음(304 / 같은 content_hash) 확인 시각 갱신"""
+        now = now or datetime.utcnow()
+        with self._lock:
+            self._conn.execute("UPDATE articles SET fetched_at = ? WHERE url = ?", (now.isoformat(), url))
+            self._conn.commit()
+
+
+_cache: Optional[ArticleCache] = None
+
+
+def get_article_cache() -> ArticleCache:
+    global _cache
+    if _cache is None:
+        _cache = ArticleCache()
+    return _cache
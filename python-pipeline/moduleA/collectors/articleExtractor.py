@@ -0,0 +1,100 @@
+"""
+articleExtractor.py
+
+Module A - Collector
+- 기사 HTML → 본문 텍스트 (문단 / 제목 블록 단위, "\n\n" 구분 — documentChunker structure 모드의 섹션 힌트)
+- trafilatura 설치 시 사용 (pip install trafilatura), 없으면 html.parser 기반 fallback
+- fallback: <article> / <main> 안의 문단을 우선, 부족하면 페이지 전체 문단
+  script / style / nav / header / footer / aside / form 내부 텍스트 제외
+- 요약 / 분류 / 판단 금지. 원문 텍스트 추출만.
+"""
+
+from html.parser import HTMLParser
+from typing import List, Optional
+
+try:
+    import trafilatura
+except ImportError:
+    trafilatura = None
+
+
+SKIP_TAGS = {"script", "style", "noscript", "nav", "header", "footer", "aside", "form", "svg", "iframe", "button"}
+BLOCK_TAGS = {"p", "h1", "h2", "h3", "h4", "li", "blockquote", "pre", "figcaption"}
+CONTAINER_TAGS = {"article", "main"}
+
+MIN_BLOCK_CHARS = 25      # 이보다 짧은 문단(메뉴, 버튼 라벨 등)은 제외 — 제목 제외
+MIN_ARTICLE_CHARS = 200   # <article>/<main> 안 텍스트가 이보다 짧으면 페이지 전체 사용
+
+
+class _MainTextParser(HTMLParser):
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.blocks: List[tuple] = []     # (text, in_container, is_heading)
+        self._skip_depth = 0
+        self._container_depth = 0
+        self._buf: Optional[List[str]] = None
+        self._heading = False
+
+    def _flush(self) -> None:
+        if self._buf is not None:
+            text = " ".join("".join(self._buf).split())
+            if text:
+                self.blocks.append((text, self._container_depth > 0, self._heading))
+        self._buf = None
+
+    def handle_starttag(self, tag, attrs):
+        if tag in SKIP_TAGS:
+            self._skip_depth += 1
+        elif tag in CONTAINER_TAGS:
+            self._container_depth += 1
+        elif tag in BLOCK_TAGS:
+            self._flush()
+            self._buf = []
+            self._heading = tag.startswith("h")
+        elif tag == "br" and self._buf is not None:
+            self._buf.append(" ")
+
+    def handle_endtag(self, tag):
+        if tag in SKIP_TAGS:
+            self._skip_depth = max(0, self._skip_depth - 1)
+        elif tag in CONTAINER_TAGS:
+            self._flush()
+            self._container_depth = max(0, self._container_depth - 1)
+        elif tag in BLOCK_TAGS:
+            self._flush()
+
+    def handle_data(self, data):
+        if self._buf is not None and self._skip_depth == 0:
+            self._buf.append(data)
+
+
+def _fallback_extract(html: str) -> str:
+    parser = _MainTextParser()
+    parser.feed(html)
+    parser.close()
+    parser._flush()
+
+    blocks = [
+        (text, in_container)
+        for text, in_container, is_heading in parser.blocks
+        if is_heading or len(text) >= MIN_BLOCK_CHARS
+    ]
+    contained = [text for text, in_container in blocks if in_container]
+    if sum(len(t) for t in contained) >= MIN_ARTICLE_CHARS:
+        return "\n\n".join(contained)
+    return "\n\n".join(text for text, _ in blocks)
+
+
+def extract_main_text(html: str) -> str:
+    """
+    HTML 문자열 → 본문 텍스트 (추출 실패 시 빈 문자열)
+    """
+    if not html:
+        return ""
+    if trafilatura is not None:
+        text = trafilatura.extract(html, include_comments=False, include_tables=False)
+        if text:
+            # trafilatura는 블록을 줄바꿈 1개로 구분 → fallback과 같은 "\n\n" (textCleaner / 청커가 블록 경계로 사용)
+            return "\n\n".join(line.strip() for line in text.splitlines() if line.strip())
+    return _fallback_extract(html)
@@ -0,0 +1,271 @@
+"""
+articleFetcher.py
+
+Module A - Collector (선택 단계)
+- RSS entry의 기사 URL → 본문 추출 → item["body_text"] 보강
+  (피드 summary는 수백 자라 청킹 / 스코어링 입력으로 부족)
+- httpPool: 호스트별 keep-alive 연결 재사용 + 호스트별 동시성 제한
+- robots.txt 준수: Disallow 경로 제외, Crawl-delay / Request-rate 만큼 호스트별 간격 유지
+- articleCache: 최근 본문은 요청 없이 재사용, 이후 조건부 GET
+  304 / 원문 content_hash 동일 → 재추출 생략
+- 호스트별 처리량(pages/sec) 리포트
+- 요약 / 분류 / 판단 금지. 원문 텍스트 보강만.
+"""
+
+import hashlib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit
+from urllib.robotparser import RobotFileParser
+
+from common.utils.rateLimit import TokenBucket
+from moduleA.collectors.articleCache import ArticleCache, get_article_cache
+from moduleA.collectors.articleExtractor import extract_main_text
+from moduleA.collectors.httpPool import HostConnectionPool
+
+
+ARTICLE_WORKERS = 8
+ARTICLE_BUDGET = 180.0       # 본문 수집 전체 예산 (초)
+DEFAULT_HOST_DELAY = 1.0     # robots.txt에 Crawl-delay가 없을 때 호스트별 최소 요청 간격 (초)
+MAX_HOST_DELAY = 30.0        # 과도한 Crawl-delay는 이 값으로 제한 (예산 내 소수만 수집)
+ROBOTS_AGENT = "OTB-Research-Bot"
+
+
+# =========================
+# Robots
+# =========================
+
+class RobotsPolicy:
+    """
+    호스트별 robots.txt 1회 조회 → 허용 여부 + 요청 간격(token bucket)
+    RFC 9309: 4xx → 전체 허용 / 5xx·연결 실패 → 전체 비허용
+    """
+
+    def __init__(self, pool: HostConnectionPool, default_delay: float = DEFAULT_HOST_DELAY):
+        self.pool = pool
+        self.default_delay = default_delay
+        self._parsers: Dict[str, Optional[RobotFileParser]] = {}
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._host_locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def _load(self, scheme: str, netloc: str) -> Optional[RobotFileParser]:
+        """None이면 호스트 전체 비허용"""
+        result = self.pool.request(f"{scheme}://{netloc}/robots.txt")
+        parser = RobotFileParser()
+        status = result["status"] or 0
+        if result["body"] is not None and 200 <= status < 300:
+            parser.parse(result["body"].decode("utf-8", errors="replace").splitlines())
+        elif 400 <= status < 500:
+            parser.parse([])
+        else:
+            return None
+        return parser
+
+    def _policy(self, url: str):
+        parts = urlsplit(url)
+        netloc = parts.netloc.lower()
+        with self._lock:
+            host_lock = self._host_locks.setdefault(netloc, threading.Lock())
+        with host_lock:
+            if netloc not in self._parsers:
+                parser = self._load(parts.scheme, netloc)
+                delay = self.default_delay
+                if parser is not None:
+                    crawl_delay = parser.crawl_delay(ROBOTS_AGENT)
+                    rate = parser.request_rate(ROBOTS_AGENT)
+                    if crawl_delay:
+                        delay = max(delay, float(crawl_delay))
+                    if rate and rate.requests:
+                        delay = max(delay, rate.seconds / rate.requests)
+                self._parsers[netloc] = parser
+                self._buckets[netloc] = TokenBucket(rate=1.0 / min(delay, MAX_HOST_DELAY), capacity=1)
+            return self._parsers[netloc], self._buckets[netloc]
+
+    def allowed(self, url: str) -> bool:
+        parser, _ = self._policy(url)
+        return parser is not None and parser.can_fetch(ROBOTS_AGENT, url)
+
+    def throttle(self, url: str) -> float:
+        """호스트 요청 간격 대기. 대기한 시간(초) 반환"""
+        _, bucket = self._policy(url)
+        return bucket.acquire()
+
+
+# =========================
+# Throughput
+# =========================
+
+class HostStats:
+    """
+    host → { fetched, not_modified, cached, disallowed, errors, bytes, pages_per_sec }
+    pages_per_sec: 네트워크 요청 수 / (첫 요청 시작 ~ 마지막 응답 종료)
+    """
+
+    COUNTERS = ("fetched", "not_modified", "cached", "disallowed", "errors", "bytes")
+
+    def __init__(self):
+        self._hosts: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+
+    def _host(self, host: str) -> Dict:
+        if host not in self._hosts:
+            self._hosts[host] = {**{c: 0 for c in self.COUNTERS}, "_first": None, "_last": None}
+        return self._hosts[host]
+
+    def count(self, host: str, counter: str, n: int = 1) -> None:
+        with self._lock:
+            self._host(host)[counter] += n
+
+    def span(self, host: str, started: float, finished: float) -> None:
+        with self._lock:
+            h = self._host(host)
+            h["_first"] = started if h["_first"] is None else min(h["_first"], started)
+            h["_last"] = finished if h["_last"] is None else max(h["_last"], finished)
+
+    def report(self) -> Dict[str, Dict]:
+        with self._lock:
+            hosts = {host: dict(h) for host, h in self._hosts.items()}
+        out = {}
+        for host, h in sorted(hosts.items()):
+            first, last = h.pop("_first"), h.pop("_last")
+            pages = h["fetched"] + h["not_modified"]
+            elapsed = (last - first) if first is not None else 0.0
+            h["pages_per_sec"] = round(pages / elapsed, 2) if elapsed > 0 else None
+            out[host] = h
+        return out
+
+
+# =========================
+# Core
+# =========================
+
+def _decode_html(body: bytes, headers: Dict[str, str]) -> str:
+    content_type = headers.get("content-type", "")
+    charset = "utf-8"
+    if "charset=" in content_type:
+        charset = content_type.split("charset=")[-1].split(";")[0].strip().strip('"') or charset
+    try:
+        return body.decode(charset, errors="replace")
+    except LookupError:
+        return body.decode("utf-8", errors="replace")
+
+
+def _fetch_text(
+    url: str,
+    pool: HostConnectionPool,
+    cache: ArticleCache,
+    robots: RobotsPolicy,
+    stats: HostStats,
+) -> Optional[str]:
+    """
+    기사 URL 1개 → 본문 텍스트 (없으면 None). 캐시 / robots / 처리량 집계 포함
+    """
+    host = urlsplit(url).netloc.lower()
+    cached = cache.lookup(url)
+    if cached is not None and ArticleCache.is_fresh(cached):
+        stats.count(host, "cached")
+        return cached["text"]
+
+    if not robots.allowed(url):
+        stats.count(host, "disallowed")
+        return None
+
+    robots.throttle(url)
+    started = time.monotonic()
+    result = pool.request(url, headers=ArticleCache.conditional_headers(cached))
+    stats.span(host, started, time.monotonic())
+
+    if result["status"] == 304 and cached is not None:
+        stats.count(host, "not_modified")
+        cache.touch(url)
+        return cached["text"]
+    if result["error"] or not result["body"]:
+        stats.count(host, "errors")
+        return None
+
+    stats.count(host, "fetched")
+    stats.count(host, "bytes", len(result["body"]))
+    content_hash = hashlib.sha256(result["body"]).hexdigest()
+    if cached is not None and cached["content_hash"] == content_hash:
+        cache.touch(url)
+        return cached["text"]
+
+    text = extract_main_text(_decode_html(result["body"], result["headers"]))
+    cache.store(url, content_hash, text, result["headers"])
+    return text
+
+
+def fetch_articles(
+    items: List[Dict],
+    max_workers: int = ARTICLE_WORKERS,
+    total_budget: float = ARTICLE_BUDGET,
+    pool: Optional[HostConnectionPool] = None,
+    cache: Optional[ArticleCache] = None,
+    robots: Optional[RobotsPolicy] = None,
+) -> Dict:
+    """
+    items의 source_url 본문을 받아 body_text 보강 (추출 본문이 기존보다 길 때만, in-place)
+
+    Returns: { updated, budget_exceeded, hosts: { host: HostStats } }
+    """
+    targets = [
+        item for item in items
+        if (item.get("source_url") or "").startswith(("http://", "https://"))
+    ]
+    report = {"updated": 0, "budget_exceeded": 0, "hosts": {}}
+    if not targets:
+        return report
+
+    own_pool = pool is None
+    pool = pool or HostConnectionPool()
+    cache = cache or get_article_cache()
+    robots = robots or RobotsPolicy(pool)
+    stats = HostStats()
+    stopped = threading.Event()
+    lock = threading.Lock()
+
+    def _task(item: Dict) -> None:
+        text = _fetch_text(item["source_url"], pool, cache, robots, stats)
+        if not text:
+            return
+        # stopped 확인과 item 수정을 같은 잠금 안에서 → 반환 이후에는 item을 건드리지 않음
+        with lock:
+            if stopped.is_set():
+                return
+            if len(text) > len(item.get("body_text") or ""):
+                item["body_text"] = text
+                report["updated"] += 1
+
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="article-fetch")
+    futures = [executor.submit(_task, item) for item in targets]
+    done, not_done = wait(futures, timeout=total_budget)
+    # 예산 초과 후 끝나는 작업은 item을 수정하지 않음
+    with lock:
+        stopped.set()
+    executor.shutdown(wait=False, cancel_futures=True)
+    if own_pool:
+        if not_done:
+            # 아직 실행 중인 작업이 pool을 쓰므로 모두 끝난 뒤 백그라운드에서 닫음
+            def _close_when_idle() -> None:
+                executor.shutdown(wait=True)
+                pool.close()
+            threading.Thread(target=_close_when_idle, name="article-pool-close", daemon=True).start()
+        else:
+            pool.close()
+
+    for future in done:
+        if future.exception() is not None:
+            print(f"[ARTICLE] 처리 실패: {future.exception()}")
+    report["budget_exceeded"] = len(not_done)
+    report["hosts"] = stats.report()
+
+    for host, h in report["hosts"].items():
+        print(
+            f"[ARTICLE] {host}: {h['fetched']} fetched / {h['not_modified']} 304 / "
+            f"{h['cached']} cached / {h['disallowed']} robots / {h['errors']} errors "
+            f"({h['pages_per_sec'] or '-'} pages/s)"
+        )
+    return report
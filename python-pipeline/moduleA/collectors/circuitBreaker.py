@@ -0,0 +1,146 @@
+"""
+circuitBreaker.py
+
+Module A - Collector
+- 소스(피드 URL)별 circuit breaker (closed / open / half_open)
+- retrieval_logs의 crawl_status로 갱신: 연속 blocked가 FAILURE_THRESHOLD회 → open
+- open 소스는 cooldown 동안 요청하지 않음 (매 실행 타임아웃 비용 제거)
+- cooldown이 지나면 half_open → 짧은 타임아웃으로 1회 probe
+  - probe 성공 → closed / 실패 → 다시 open (cooldown 2배, 최대 MAX_COOLDOWN_HOURS)
+- 상태 갱신은 commit() 전까지 메모리에만 보관 (실패한 실행은 반영하지 않음)
+"""
+
+import os
+from datetime import datetime, timedelta
+from typing import Dict, Optional, Sequence
+
+from common.utils.stateStore import StagedJsonState
+
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+STATE_DIR = os.path.join(BASE_DIR, "data", "state")
+BREAKER_PATH = os.path.join(STATE_DIR, "circuit_breakers.json")
+
+FAILURE_THRESHOLD = 3          # open까지 연속 blocked 횟수
+BASE_COOLDOWN_HOURS = 24.0
+MAX_COOLDOWN_HOURS = 24.0 * 7
+
+PROBE_CONNECT_TIMEOUT = 5      # half_open probe는 짧은 타임아웃으로
+PROBE_READ_DEADLINE = 8
+
+CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+# allow() 결과
+FETCH, PROBE, SKIP = "fetch", "probe", "skip"
+
+
+def _parse(ts: Optional[str]) -> Optional[datetime]:
+    return datetime.fromisoformat(ts) if ts else None
+
+
+class CircuitBreaker(StagedJsonState):
+    """
+    url → { state, failures, cooldown_hours, opened_at, retry_at }
+    """
+
+    def __init__(self, path: str = BREAKER_PATH):
+        super().__init__(path)
+
+    def state_of(self, url: str) -> str:
+        return self.get(url).get("state", CLOSED)
+
+    def allow(self, url: str, now: Optional[datetime] = None) -> str:
+        """
+        이번 실행에서 소스 처리 방식: fetch / probe / skip
+        open 상태에서 cooldown이 지났으면 half_open으로 전환 후 probe
+        """
+        now = now or datetime.utcnow()
+        with self._lock:
+            entry = self.get(url)
+            state = entry.get("state", CLOSED)
+            if state == CLOSED:
+                return FETCH
+            if state == OPEN:
+                retry_at = _parse(entry.get("retry_at"))
+                if retry_at is not None and now < retry_at:
+                    return SKIP
+                entry["state"] = HALF_OPEN
+                self.stage(url, entry)
+            return PROBE
+
+    def split(self, sources: Sequence, now: Optional[datetime] = None):
+        """
+        sources(SourceRecord 목록) → (fetch 대상, probe 대상 url 집합, skip된 소스)
+        """
+        allowed, probes, skipped = [], set(), []
+        for source in sources:
+            decision = self.allow(source.url, now)
+            if decision == SKIP:
+                skipped.append(source)
+                continue
+            if decision == PROBE:
+                probes.add(source.url)
+            allowed.append(source)
+        return allowed, probes, skipped
+
+    def record(self, url: str, crawl_status: str, now: Optional[datetime] = None) -> str:
+        """
+        수집 결과 1건 반영 후 새 상태 반환
+        blocked 외(success / partial / not_modified)는 모두 정상 응답으로 간주
+        """
+        now = now or datetime.utcnow()
+        with self._lock:
+            entry = self.get(url)
+            state = entry.get("state", CLOSED)
+
+            if crawl_status != "blocked":
+                if state != CLOSED or entry.get("failures"):
+                    self.stage(url, {"state": CLOSED, "failures": 0})
+                return CLOSED
+
+            failures = entry.get("failures", 0) + 1
+            cooldown = entry.get("cooldown_hours")
+            if state == HALF_OPEN:
+                cooldown = min((cooldown or BASE_COOLDOWN_HOURS) * 2, MAX_COOLDOWN_HOURS)
+            elif failures >= FAILURE_THRESHOLD:
+                cooldown = BASE_COOLDOWN_HOURS
+            else:
+                self.stage(url, {"state": CLOSED, "failures": failures})
+                return CLOSED
+
+            self.stage(url, {
+                "state": OPEN,
+                "failures": failures,
+                "cooldown_hours": cooldown,
+                "opened_at": now.isoformat(),
+                "retry_at": (now + timedelta(hours=cooldown)).isoformat(),
+            })
+            return OPEN
+
+    def summary(self) -> Dict:
+        """
+        run stats용 요약: 상태별 개수 + closed가 아닌 소스 목록
+        """
+        counts = {CLOSED: 0, OPEN: 0, HALF_OPEN: 0}
+        tripped = []
+        for url, entry in self.snapshot().items():
+            state = entry.get("state", CLOSED)
+            counts[state] = counts.get(state, 0) + 1
+            if state != CLOSED:
+                tripped.append({
+                    "source_url": url,
+                    "state": state,
+                    "failures": entry.get("failures", 0),
+                    "retry_at": entry.get("retry_at"),
+                })
+        return {**counts, "tripped": sorted(tripped, key=lambda r: r["retry_at"] or "")}
+
+
+_breaker: Optional[CircuitBreaker] = None
+
+
+def get_circuit_breaker() -> CircuitBreaker:
+    global _breaker
+    if _breaker is None:
+        _breaker = CircuitBreaker()
+    return _breaker
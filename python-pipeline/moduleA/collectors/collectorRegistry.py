@@ -0,0 +1,211 @@
+"""
+collectorRegistry.py
+
+Module A - Collector 레지스트리
+- 수집기(collector)와 저장 함수(store)를 이름으로 등록
+- 등록된 수집기를 하나의 데드라인 안에서 동시 실행
+- 수집기별 실패 격리 + 소요 시간 기록
+- 데드라인을 넘긴 수집기는 공유 로컬 상태(seenIndex / validator / schedule / breaker)에 staging하지 못함
+  → 수집기는 staging 구간을 guard.staging()으로 감싸고, 데드라인 시 guard.cancel()
+    (결과가 버려진 수집기의 entry가 seen으로 commit되어 유실되는 것 방지)
+- 수집 결과 해석 / 가공 금지
+
+수집기 추가:
+  register_collector("name", "package.module:function", store="package.module:function")
+  → collect(run_id) 호출 결과를 store(result)로 저장 (store 없으면 호출 측이 직접 사용)
+  → collect가 guard 인자를 받으면 StagingGuard 전달
+"""
+
+import importlib
+import inspect
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional, Union
+
+
+COLLECTOR_DEADLINE = 180.0  # 전체 수집 단계 데드라인 (초)
+
+Target = Union[str, Callable]
+
+_REGISTRY: Dict[str, Dict] = {}
+
+
+# =========================
+# Registry
+# =========================
+
+def register_collector(
+    name: str,
+    collect: Target,
+    store: Optional[Target] = None,
+    enabled: bool = True,
+) -> None:
+    """
+    collect / store: callable 또는 "module.path:function" 문자열 (실행 시점에 import)
+    enabled=False 수집기는 names로 명시했을 때만 실행
+    """
+    _REGISTRY[name] = {
+        "name": name,
+        "collect": collect,
+        "store": store,
+        "enabled": enabled,
+    }
+
+
+def get_collectors(names: Optional[List[str]] = None) -> List[Dict]:
+    if names is None:
+        return [spec for spec in _REGISTRY.values() if spec["enabled"]]
+
+    unknown = [n for n in names if n not in _REGISTRY]
+    if unknown:
+        raise KeyError(f"Unknown collectors: {', '.join(unknown)}")
+    return [_REGISTRY[n] for n in names]
+
+
+def _resolve(target: Target) -> Callable:
+    if callable(target):
+        return target
+    module_path, func_name = target.split(":")
+    return getattr(importlib.import_module(module_path), func_name)
+
+
+# =========================
+# Cancellation
+# =========================
+
+class CollectorCancelled(Exception):
+    """데드라인 이후 staging 시도"""
+
+
+class StagingGuard:
+    """
+    수집기 1개의 공유 상태 staging 구간 보호
+    - staging(): 취소됐으면 CollectorCancelled, 아니면 구간이 끝날 때까지 cancel()을 대기시킴
+    - cancel(): 이후 staging 금지. staging이 이미 시작됐으면 (끝난 뒤) True
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.cancelled = False
+        self.staged = False
+
+    @contextmanager
+    def staging(self):
+        with self._lock:
+            if self.cancelled:
+                raise CollectorCancelled("deadline exceeded before staging")
+            self.staged = True
+            yield
+
+    def cancel(self) -> bool:
+        with self._lock:
+            self.cancelled = True
+            return self.staged
+
+
+# =========================
+# Core
+# =========================
+
+def _run_one(spec: Dict, run_id: str, guard: StagingGuard) -> Dict:
+    started = time.monotonic()
+    outcome = {"result": None, "error": None, "elapsed_ms": 0}
+    try:
+        collect = _resolve(spec["collect"])
+        if "guard" in inspect.signature(collect).parameters:
+            outcome["result"] = collect(run_id, guard=guard)
+        else:
+            outcome["result"] = collect(run_id)
+    except Exception as e:
+        outcome["error"] = f"{type(e).__name__}: {e}"
+    outcome["elapsed_ms"] = int((time.monotonic() - started) * 1000)
+    return outcome
+
+
+def run_collectors(
+    run_id: str,
+    names: Optional[List[str]] = None,
+    deadline: float = COLLECTOR_DEADLINE,
+) -> Dict[str, Dict]:
+    """
+    등록된 수집기 동시 실행.
+
+    returns: name → { result, error, elapsed_ms }
+             데드라인 안에 끝나지 않은 수집기는 error="deadline exceeded", result=None
+             (이후 staging 불가 — 이미 staging 중이었으면 끝날 때까지 기다려 결과 사용)
+    """
+    specs = get_collectors(names)
+    if not specs:
+        return {}
+
+    executor = ThreadPoolExecutor(max_workers=len(specs), thread_name_prefix="collector")
+    guards = {spec["name"]: StagingGuard() for spec in specs}
+    futures = {
+        executor.submit(_run_one, spec, run_id, guards[spec["name"]]): spec["name"]
+        for spec in specs
+    }
+    done, _ = wait(futures, timeout=deadline)
+    for future, name in futures.items():
+        if future not in done and guards[name].cancel():
+            # staging을 마친 수집기는 결과 반환만 남음 → 결과를 버리면 staging된 entry가 유실
+            wait([future])
+            done.add(future)
+    executor.shutdown(wait=False, cancel_futures=True)
+
+    outcomes: Dict[str, Dict] = {}
+    for future, name in futures.items():
+        if future in done:
+            outcomes[name] = future.result()
+        else:
+            outcomes[name] = {
+                "result": None,
+                "error": "deadline exceeded",
+                "elapsed_ms": int(deadline * 1000),
+            }
+
+        outcome = outcomes[name]
+        if outcome["error"]:
+            print(f"[COLLECT] {name}: 실패 — {outcome['error']} ({outcome['elapsed_ms']}ms)")
+        else:
+            print(f"[COLLECT] {name}: 완료 ({outcome['elapsed_ms']}ms)")
+
+    return outcomes
+
+
+def store_collected(outcomes: Dict[str, Dict]) -> None:
+    """
+    store가 등록된 수집기 결과 저장 (실패/빈 결과는 건너뜀)
+    """
+    for name, outcome in outcomes.items():
+        store = _REGISTRY[name]["store"]
+        if store is None or not outcome["result"]:
+            continue
+        _resolve(store)(outcome["result"])
+
+
+# =========================
+# Default Collectors
+# =========================
+
+register_collector(
+    "rss",
+    "moduleA.collectors.rssCollector:collect_rss",
+)
+register_collector(
+    "trends",
+    "moduleA.collectors.googleTrendsCollector:collect_trends",
+    store="moduleA.writers.supabaseWriter:upsert_trend_signals",
+)
+register_collector(
+    "visual",
+    "moduleA.collectors.visualTrendCollector:collect_visual_trends",
+    store="moduleA.writers.supabaseWriter:upsert_visual_trends",
+)
+register_collector(
+    "pinterest",
+    "moduleA.collectors.pinterestCollector:collect_pinterest_trends",
+    store="moduleA.writers.supabaseWriter:upsert_visual_trends",
+    enabled=False,  # Playwright 필요 — --collectors 로 명시 실행
+)
@@ -10,9 +10,12 @@ import json
 import uuid
 from datetime import datetime
 
-import feedparser
 from pytrends.request import TrendReq
 
+from common.config.sourceCatalog import get_source_catalog
+from moduleA.collectors.feedFetcher import fetch_all
+from moduleA.collectors.feedParser import FeedParsePool
+
 # =========================
 # 기본 설정
 # =========================
@@ -30,237 +33,37 @@ NOW = datetime.utcnow().isoformat()
 
 
 # =========================
-# 1️⃣ Enhanced RSS Sources (50+)
+# 1️⃣ RSS Sources — sourceCatalog(settings.yaml) rss 그룹
+#    (레거시 crawler는 비활성 소스까지 모두 수집)
 # =========================
 
-RSS_SOURCES = [
-    # ============ 디자인 종합 ============
-    {
-        "name": "DesignBoom",
-        "url": "https://www.designboom.com/feed/",
-        "category": "Design General",
-        "language": "en"
-    },
-    {
-        "name": "Dezeen",
-        "url": "https://www.dezeen.com/feed/",
-        "category": "Design General",
-        "language": "en"
-    },
-    {
-        "name": "Design Milk",
-        "url": "https://design-milk.com/feed/",
-        "category": "Design General",
-        "language": "en"
-    },
-    {
-        "name": "It's Nice That",
-        "url": "https://www.itsnicethat.com/feed",
-        "category": "Design General",
-        "language": "en"
-    },
-    {
-        "name": "Creative Bloq",
-        "url": "https://www.creativebloq.com/feed",
-        "category": "Design General",
-        "language": "en"
-    },
-    {
-        "name": "Abduzeedo",
-        "url": "https://abduzeedo.com/rss.xml",
-        "category": "Design Inspiration",
-        "language": "en"
-    },
-    {
-        "name": "Colossal",
-        "url": "https://www.thisiscolossal.com/feed/",
-        "category": "Art + Design",
-        "language": "en"
-    },
-    
-    # ============ UX/UI 전문 (OTB 핵심!) ============
-    {
-        "name": "Nielsen Norman Group",
-        "url": "https://www.nngroup.com/feed/rss/",
-        "category": "UX Research",
-        "language": "en",
-        "priority": "high"  # 민주님 논문 기반!
-    },
-    {
-        "name": "UX Collective (Medium)",
-        "url": "https://uxdesign.cc/feed",
-        "category": "UX Design",
-        "language": "en",
-        "priority": "high"
-    },
-    {
-        "name": "Smashing Magazine",
-        "url": "https://www.smashingmagazine.com/feed/",
-        "category": "Web Design + UX",
-        "language": "en",
-        "priority": "high"
-    },
-    {
-        "name": "UX Matters",
-        "url": "https://www.uxmatters.com/index.xml",
-        "category": "UX Strategy",
-        "language": "en"
-    },
-    {
-        "name": "Boxes and Arrows",
-        "url": "https://boxesandarrows.com/feed/",
-        "category": "IA + UX",
-        "language": "en"
-    },
-    {
-        "name": "A List Apart",
-        "url": "https://alistapart.com/main/feed/",
-        "category": "Web Standards + UX",
-        "language": "en"
-    },
-    
-    # ============ 브랜딩 ============
-    {
-        "name": "Brand New (UnderConsideration)",
-        "url": "https://www.underconsideration.com/brandnew/feed/",
-        "category": "Brand Identity",
-        "language": "en",
-        "priority": "high"
-    },
-    {
-        "name": "The Dieline",
-        "url": "https://thedieline.com/feed/",
-        "category": "Packaging Design",
-        "language": "en"
-    },
-    {
-        "name": "BP&O",
-        "url": "https://bpando.org/feed/",
-        "category": "Brand Packaging Opinion",
-        "language": "en"
-    },
-    
-    # ============ 웹 디자인 쇼케이스 ============
-    {
-        "name": "Awwwards Blog",
-        "url": "https://www.awwwards.com/blog/feed/",
-        "category": "Web Design Excellence",
-        "language": "en"
-    },
-    {
-        "name": "SiteInspire Blog",
-        "url": "https://www.siteinspire.com/feed/",
-        "category": "Web Design Inspiration",
-        "language": "en"
-    },
-    {
-        "name": "CSS Design Awards",
-        "url": "https://www.cssdesignawards.com/blog/feed/",
-        "category": "CSS + Web Design",
-        "language": "en"
-    },
-    
-    # ============ 모바일/앱 디자인 ============
-    {
-        "name": "UI Movement",
-        "url": "https://uimovement.com/feed/",
-        "category": "Mobile UI Patterns",
-        "language": "en"
-    },
-    {
-        "name": "Pttrns Blog",
-        "url": "https://pttrns.com/blog/feed",
-        "category": "Mobile UI Screenshots",
-        "language": "en"
-    },
-    
-    # ============ AI/테크 트렌드 ============
-    {
-        "name": "TechCrunch",
-        "url": "https://techcrunch.com/feed/",
-        "category": "Tech News",
-        "language": "en"
-    },
-    {
-        "name": "The Verge Design",
-        "url": "https://www.theverge.com/design/rss/index.xml",
-        "category": "Tech + Design",
-        "language": "en"
-    },
-    {
-        "name": "Fast Company Design",
-        "url": "https://www.fastcompany.com/section/design/rss",
-        "category": "Design + Innovation",
-        "language": "en"
-    },
-    {
-        "name": "Wired Design",
-        "url": "https://www.wired.com/feed/category/design/latest/rss",
-        "category": "Future Design",
-        "language": "en"
-    },
-    
-    # ============ 한국어 소스 (Geography: KR) ============
-    {
-        "name": "디자인정글",
-        "url": "http://www.jungle.co.kr/rss/magazine_list",
-        "category": "Korean Design Magazine",
-        "language": "ko",
-        "geography": "KR"
-    },
-    {
-        "name": "월간 디자인",
-        "url": "https://mdesign.designhouse.co.kr/feed",
-        "category": "Monthly Design Korea",
-        "language": "ko",
-        "geography": "KR"
-    },
-    {
-        "name": "Design DB (한국디자인진흥원)",
-        "url": "https://www.designdb.com/rss",
-        "category": "Korean Design Promotion",
-        "language": "ko",
-        "geography": "KR"
-    },
-    
-    # ============ 도메인별 전문 매체 ============
-    
-    # Beauty Domain
-    {
-        "name": "Cosmetics Design",
-        "url": "https://www.cosmeticsdesign.com/rss",
-        "category": "Beauty + Packaging",
-        "domain": "Beauty",
-        "language": "en"
-    },
-    
-    # Fashion Domain
-    {
-        "name": "WWD (Women's Wear Daily)",
-        "url": "https://wwd.com/feed/",
-        "category": "Fashion News",
-        "domain": "Fashion",
-        "language": "en"
-    },
-    {
-        "name": "BoF (Business of Fashion)",
-        "url": "https://www.businessoffashion.com/feed",
-        "category": "Fashion Business",
-        "domain": "Fashion",
-        "language": "en"
-    },
-    
-    # F&B Domain
-    {
-        "name": "The Dieline (Food & Beverage)",
-        "url": "https://thedieline.com/blog/category/food-beverage/feed",
-        "category": "F&B Packaging",
-        "domain": "F&B",
-        "language": "en"
-    },
-    
-
-]
+RSS_SOURCES = get_source_catalog().sources("rss", include_disabled=True)
+
+# 카탈로그 표기(rssCollector 기준)와 다른 레거시 출력 라벨 — news_*.json 소비 측이 이 문자열에 의존
+# source id → { source_name / category / domain }
+LEGACY_LABELS = {
+    "ux-collective":    {"source_name": "UX Collective (Medium)"},
+    "brand-new":        {"source_name": "Brand New (UnderConsideration)"},
+    "bpando":           {"category": "Brand Packaging Opinion"},
+    "awwwards-blog":    {"category": "Web Design Excellence"},
+    "jungle":           {"category": "Korean Design Magazine"},
+    "mdesign":          {"category": "Monthly Design Korea"},
+    "designdb":         {"source_name": "Design DB (한국디자인진흥원)", "category": "Korean Design Promotion"},
+    "wwd":              {"source_name": "WWD (Women's Wear Daily)", "domain": "Fashion"},
+    "bof":              {"source_name": "BoF (Business of Fashion)", "domain": "Fashion"},
+    "cosmetics-design": {"domain": "Beauty"},
+    "dieline-fnb":      {"source_name": "The Dieline (Food & Beverage)", "domain": "F&B"},
+}
+
+
+def _legacy_labels(source) -> dict:
+    labels = {
+        "source_name": source.name,
+        "category": source.category or "uncategorized",
+        "domain": source.domain,
+    }
+    labels.update(LEGACY_LABELS.get(source.id, {}))
+    return labels
 
 
 # =========================
@@ -271,33 +74,44 @@ def crawl_news(run_id: str, max_per_source: int = 20):
     results = []
     failed_sources = []
 
+    print(f"[CRAWLER] Fetching {len(RSS_SOURCES)} sources...")
+    with FeedParsePool(max_entries=max_per_source) as parser:
+        fetched = fetch_all(
+            get_source_catalog().plan(RSS_SOURCES), on_result=parser.submit, planned=True,
+        )
+        parsed = parser.drain()
+
     for source in RSS_SOURCES:
+        labels = _legacy_labels(source)
         try:
-            print(f"[CRAWLER] Fetching {source['name']}...")
-            feed = feedparser.parse(source["url"])
+            if fetched[source.url]["error"]:
+                raise IOError(fetched[source.url]["error"])
+            feed = parsed.get(source.url)
+            if isinstance(feed, Exception):
+                raise feed
 
-            for entry in feed.entries[:max_per_source]:
+            for entry in (feed or {}).get("entries", []):
                 item = {
                     "id": str(uuid.uuid4()),
                     "run_id": run_id,
                     "source": "news",
-                    "source_name": source["name"],
-                    "category": source.get("category", "uncategorized"),
-                    "domain": source.get("domain", None),
-                    "geography": source.get("geography", None),
-                    "priority": source.get("priority", "normal"),
+                    "source_name": labels["source_name"],
+                    "category": labels["category"],
+                    "domain": labels["domain"],
+                    "geography": source.geography,
+                    "priority": source.priority_label,
                     "url": entry.get("link"),
                     "title": entry.get("title"),
                     "content": entry.get("summary", ""),
                     "published_at": entry.get("published"),
                     "collected_at": NOW,
-                    "language": source.get("language", "en")
+                    "language": source.language
                 }
                 results.append(item)
                 
         except Exception as e:
-            print(f"[ERROR] Failed to fetch {source['name']}: {e}")
-            failed_sources.append(source['name'])
+            print(f"[ERROR] Failed to fetch {labels['source_name']}: {e}")
+            failed_sources.append(labels["source_name"])
 
     output_path = os.path.join(
         NEWS_DIR, f"news_{datetime.utcnow().date().isoformat()}.json"
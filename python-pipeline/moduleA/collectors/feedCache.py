@@ -0,0 +1,60 @@
+"""
+feedCache.py
+
+Module A - Collector
+- 피드 URL별 HTTP validator(ETag / Last-Modified) 로컬 캐시
+- 다음 수집 시 If-None-Match / If-Modified-Since 헤더 생성 → 304면 파싱 생략
+- 갱신 내용은 commit() 전까지 메모리에만 보관
+  (파이프라인 실패 시 validator가 먼저 갱신되어 항목을 잃는 것 방지)
+"""
+
+import os
+from typing import Dict, Optional
+
+from common.utils.stateStore import StagedJsonState
+
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+STATE_DIR = os.path.join(BASE_DIR, "data", "state")
+VALIDATOR_PATH = os.path.join(STATE_DIR, "feed_validators.json")
+
+
+class ValidatorCache(StagedJsonState):
+    """
+    url → { etag, last_modified }
+    """
+
+    def __init__(self, path: str = VALIDATOR_PATH):
+        super().__init__(path)
+
+    def headers_for(self, url: str) -> Dict[str, str]:
+        """
+        조건부 GET 요청 헤더 (캐시 없으면 빈 dict)
+        """
+        entry = self.get(url)
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def record(self, url: str, response_headers: Dict[str, str]) -> None:
+        """
+        200 응답의 validator를 staging (lower-case 헤더 dict 기준)
+        """
+        etag = response_headers.get("etag")
+        last_modified = response_headers.get("last-modified")
+        if not etag and not last_modified:
+            return
+        self.stage(url, {"etag": etag, "last_modified": last_modified})
+
+
+_cache: Optional[ValidatorCache] = None
+
+
+def get_validator_cache() -> ValidatorCache:
+    global _cache
+    if _cache is None:
+        _cache = ValidatorCache()
+    return _cache
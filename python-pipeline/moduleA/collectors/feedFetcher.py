@@ -0,0 +1,217 @@
+"""
+feedFetcher.py
+
+Module A - Collector 공용 fetch 엔진
+- 피드 URL 목록을 스레드 풀로 동시 다운로드 (bytes만 반환)
+- 전역 동시성 제한 + 호스트별 동시성 제한
+- 소스별 connect / read 데드라인, 전체 수집 예산(total budget)
+- 파싱 / 분류 / 저장 금지 — 호출 측(rssCollector 등)이 feedparser로 처리
+"""
+
+import gzip
+import time
+import zlib
+import threading
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+
+GLOBAL_CONCURRENCY = 16      # 동시에 열려 있는 요청 수 상한
+PER_HOST_CONCURRENCY = 2     # 같은 호스트에 대한 동시 요청 수 상한
+CONNECT_TIMEOUT = 10.0       # 소켓 연결 / 개별 recv 타임아웃 (초)
+READ_DEADLINE = 20.0         # 소스 1개 본문 수신 전체 데드라인 (초)
+TOTAL_BUDGET = 90.0          # 전체 수집 예산 (초)
+BUDGET_EXCEEDED = "collection budget exceeded"   # 예산 내 미완료 URL의 error (소스 실패 아님)
+MAX_BODY_BYTES = 10 * 1024 * 1024
+READ_CHUNK = 64 * 1024
+
+USER_AGENT = "Mozilla/5.0 (compatible; OTB-Research-Bot/2.0; +feedparser)"
+ACCEPT = "application/rss+xml, application/atom+xml, application/xml;q=0.9, text/xml;q=0.8, */*;q=0.5"
+
+
+# =========================
+# Utils
+# =========================
+
+def host_of(url: str) -> str:
+    return urlsplit(url).netloc.lower()
+
+
+def _empty_result(url: str) -> Dict:
+    return {
+        "url": url,
+        "status": None,
+        "body": None,
+        "headers": {},
+        "latency_ms": 0,
+        "error": None,
+    }
+
+
+def _decode_body(raw: bytes, encoding: str) -> bytes:
+    encoding = (encoding or "").lower()
+    if encoding == "gzip":
+        return gzip.decompress(raw)
+    if encoding == "deflate":
+        try:
+            return zlib.decompress(raw)
+        except zlib.error:
+            return zlib.decompress(raw, -zlib.MAX_WBITS)
+    return raw
+
+
+def _read_with_deadline(resp, deadline: float) -> bytes:
+    buf = bytearray()
+    while True:
+        if time.monotonic() > deadline:
+            raise TimeoutError("read deadline exceeded")
+        chunk = resp.read(READ_CHUNK)
+        if not chunk:
+            break
+        buf.extend(chunk)
+        if len(buf) > MAX_BODY_BYTES:
+            raise ValueError(f"body exceeds {MAX_BODY_BYTES} bytes")
+    return bytes(buf)
+
+
+# =========================
+# Core
+# =========================
+
+def fetch_one(
+    url: str,
+    connect_timeout: float = CONNECT_TIMEOUT,
+    read_deadline: float = READ_DEADLINE,
+    headers: Optional[Dict[str, str]] = None,
+) -> Dict:
+    """
+    단일 URL 다운로드. 예외를 던지지 않고 result dict의 error에 기록한다.
+    """
+    result = _empty_result(url)
+    req_headers = {
+        "User-Agent": USER_AGENT,
+        "Accept": ACCEPT,
+        "Accept-Encoding": "gzip, deflate",
+    }
+    if headers:
+        req_headers.update(headers)
+
+    started = time.monotonic()
+    try:
+        req = urllib.request.Request(url, headers=req_headers)
+        with urllib.request.urlopen(req, timeout=connect_timeout) as resp:
+            raw = _read_with_deadline(resp, started + connect_timeout + read_deadline)
+            result["status"] = resp.status
+            result["headers"] = {k.lower(): v for k, v in resp.headers.items()}
+            result["body"] = _decode_body(raw, result["headers"].get("content-encoding"))
+            # 리다이렉트 후 최종 URL — 상대 링크 해석용
+            result["headers"].setdefault("content-location", resp.geturl())
+    except urllib.error.HTTPError as e:
+        result["status"] = e.code
+        result["headers"] = {k.lower(): v for k, v in (e.headers or {}).items()}
+        # 304 Not Modified는 오류가 아님 — 본문 없이 반환
+        if e.code != 304:
+            result["error"] = f"HTTP {e.code}"
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+    finally:
+        result["latency_ms"] = int((time.monotonic() - started) * 1000)
+
+    return result
+
+
+def _interleave_by_host(urls: Iterable[str]) -> List[str]:
+    """
+    호스트별 라운드로빈 순서로 재배열 — 같은 호스트 요청이 워커를 독점하지 않도록
+    """
+    groups: Dict[str, List[str]] = {}
+    for url in urls:
+        groups.setdefault(host_of(url), []).append(url)
+
+    ordered: List[str] = []
+    queues = list(groups.values())
+    while queues:
+        next_round = []
+        for q in queues:
+            ordered.append(q.pop(0))
+            if q:
+                next_round.append(q)
+        queues = next_round
+    return ordered
+
+
+def fetch_all(
+    urls: Iterable[str],
+    max_workers: int = GLOBAL_CONCURRENCY,
+    per_host: int = PER_HOST_CONCURRENCY,
+    connect_timeout: float = CONNECT_TIMEOUT,
+    read_deadline: float = READ_DEADLINE,
+    total_budget: float = TOTAL_BUDGET,
+    request_headers: Optional[Dict[str, Dict[str, str]]] = None,
+    on_result: Optional[Callable[[Dict], None]] = None,
+    timeouts: Optional[Dict[str, Tuple[float, float]]] = None,
+    planned: bool = False,
+) -> Dict[str, Dict]:
+    """
+    URL 목록 동시 다운로드.
+
+    request_headers: url → 추가 요청 헤더 (선택)
+    timeouts: url → (connect_timeout, read_deadline) 개별 지정 (예: circuit breaker probe)
+    planned: True면 호출 측 순서 유지 (SourceCatalog.plan() 결과 — 이미 호스트 분산됨)
+    on_result: URL 1개 다운로드가 끝날 때마다 워커 스레드에서 호출 (예: FeedParsePool.submit)
+    returns: url → { url, status, body, headers, latency_ms, error }
+             status=304 이면 body=None, error=None
+             예산 내에 끝나지 않은 URL은 error=BUDGET_EXCEEDED
+    """
+    unique = list(dict.fromkeys(urls))
+    ordered = unique if planned else _interleave_by_host(unique)
+    if not ordered:
+        return {}
+
+    request_headers = request_headers or {}
+    timeouts = timeouts or {}
+    host_slots = {
+        host: threading.BoundedSemaphore(per_host)
+        for host in {host_of(u) for u in ordered}
+    }
+
+    def _task(url: str) -> Dict:
+        connect, read = timeouts.get(url, (connect_timeout, read_deadline))
+        with host_slots[host_of(url)]:
+            result = fetch_one(
+                url,
+                connect_timeout=connect,
+                read_deadline=read,
+                headers=request_headers.get(url),
+            )
+        if on_result is not None:
+            try:
+                on_result(result)
+            except Exception as e:
+                print(f"[FETCH] on_result 실패 ({url}): {e}")
+        return result
+
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="feed-fetch")
+    futures = {executor.submit(_task, url): url for url in ordered}
+    done, not_done = wait(futures, timeout=total_budget)
+
+    # 진행 중인 요청은 자체 데드라인으로 종료됨 — 대기하지 않음
+    executor.shutdown(wait=False, cancel_futures=True)
+
+    results: Dict[str, Dict] = {}
+    for future, url in futures.items():
+        if future in done:
+            results[url] = future.result()
+        else:
+            result = _empty_result(url)
+            result["error"] = BUDGET_EXCEEDED
+            result["latency_ms"] = int(total_budget * 1000)
+            results[url] = result
+
+    if not_done:
+        print(f"[FETCH] 예산 {total_budget:.0f}s 초과 — {len(not_done)}개 소스 미완료")
+
+    return results
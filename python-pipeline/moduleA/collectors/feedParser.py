@@ -0,0 +1,139 @@
+"""
+feedParser.py
+
+Module A - Collector
+- feedFetcher가 받은 피드 본문(bytes) → 간소화된 entry dict 리스트
+- 큰 피드(TechCrunch, WWD 등)는 프로세스 풀에서 파싱 (feedparser XML/sanitize는 CPU 작업)
+- 작은 피드는 프로세스 왕복 비용이 더 크므로 호출 스레드에서 바로 파싱
+- 다운로드가 끝나는 즉시 submit → 네트워크 I/O와 파싱이 겹쳐서 진행
+- 풀은 fetch / 수집기 스레드가 도는 중에 생성되므로 fork 대신 forkserver(없으면 spawn)로 워커 기동
+
+반환 형식 (compact feed):
+  { "bozo": bool, "bozo_exception": str | None,
+    "entries": [{ id, link, title, summary, published }, ...] }
+"""
+
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Dict, Optional
+
+import feedparser
+
+
+ENTRY_FIELDS = ("id", "link", "title", "summary", "published")
+PROCESS_POOL_MIN_BYTES = 256 * 1024   # 이 크기 이상만 프로세스 풀로 보냄
+MAX_PARSE_WORKERS = os.cpu_count() or 2
+
+# 멀티스레드 프로세스를 fork하면 다른 스레드가 잡고 있던 잠금(urllib / SSL / logging)이 자식에 복사되어 교착 위험
+START_METHOD = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
+
+# =========================
+# Core
+# =========================
+
+def parse_compact(
+    body: bytes,
+    headers: Optional[Dict[str, str]] = None,
+    max_entries: Optional[int] = None,
+) -> Dict:
+    """
+    피드 본문 파싱 후 파이프라인이 쓰는 필드만 남긴 dict 반환
+    (프로세스 간 전송량 최소화 — FeedParserDict 전체를 pickle하지 않음)
+    """
+    feed = feedparser.parse(body, response_headers=headers or {})
+    entries = feed.entries[:max_entries] if max_entries else feed.entries
+    exc = feed.get("bozo_exception")
+    return {
+        "bozo": bool(feed.bozo),
+        "bozo_exception": str(exc) if exc else None,
+        "entries": [
+            {field: entry.get(field, "") for field in ENTRY_FIELDS}
+            for entry in entries
+        ],
+    }
+
+
+class FeedParsePool:
+    """
+    with FeedParsePool(max_entries=20) as parser:
+        fetched = fetch_all(urls, on_result=parser.submit)
+        parsed = parser.drain()
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        max_workers: int = MAX_PARSE_WORKERS,
+        min_bytes: int = PROCESS_POOL_MIN_BYTES,
+    ):
+        self.max_entries = max_entries
+        self.max_workers = max_workers
+        self.min_bytes = min_bytes
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._futures: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        with self._lock:
+            self._closed = True
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def _pool(self) -> Optional[ProcessPoolExecutor]:
+        # 큰 피드가 하나도 없으면 프로세스를 띄우지 않음
+        with self._lock:
+            if self._closed:
+                return None
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context(START_METHOD),
+                )
+            return self._executor
+
+    def submit(self, fetch_result: Dict) -> None:
+        """
+        feedFetcher 결과 1개 접수 (본문 없는 결과 — 오류 / 304 — 는 무시)
+        """
+        body = fetch_result.get("body")
+        if not body or self._closed:
+            # 예산 초과 후 늦게 도착한 결과도 무시
+            return
+
+        url = fetch_result["url"]
+        args = (body, fetch_result.get("headers"), self.max_entries)
+        if len(body) >= self.min_bytes:
+            pool = self._pool()
+            if pool is None:
+                return
+            future = pool.submit(parse_compact, *args)
+        else:
+            future = Future()
+            try:
+                future.set_result(parse_compact(*args))
+            except Exception as e:
+                future.set_exception(e)
+
+        with self._lock:
+            self._futures[url] = future
+
+    def drain(self) -> Dict[str, object]:
+        """
+        접수된 전체 결과 대기 후 url → compact feed (실패한 URL은 예외 객체)
+        """
+        with self._lock:
+            futures = dict(self._futures)
+        results: Dict[str, object] = {}
+        for url, future in futures.items():
+            try:
+                results[url] = future.result()
+            except Exception as e:
+                results[url] = e
+        return results
@@ -6,17 +6,25 @@ INTENT 신호: 사람들이 이 키워드를 검색하기 시작했는가
 → trend_signals 테이블에 저장
 
 pytrends 라이브러리 사용 (pip install pytrends)
+- 요청 스케줄링: token bucket + 429 지수 백오프 (고정 sleep 제거)
+- trendsCache: (keywords, timeframe, geo)별 프레임 캐시, 새 tail 구간만 조회
+- 여러 geo(market)를 한 번에 수집
 """
 
 import time
 from datetime import datetime
-from typing import List, Dict
+from typing import List, Dict, Optional
 
 try:
     from pytrends.request import TrendReq
 except ImportError:
     TrendReq = None
 
+from common.utils.rateLimit import TokenBucket, backoff_delays
+from moduleA.collectors.trendsCache import (
+    cache_key, load_frame, save_frame, tail_timeframe, merge_tail, WINDOW_DAYS,
+)
+
 INDUSTRY_KEYWORDS = {
     "fashion":   ["패션 브랜드", "fashion UX", "fashion ecommerce design", "온라인 쇼핑몰"],
     "beauty":    ["뷰티 브랜드", "beauty website design", "skincare UX", "화장품 웹"],
@@ -27,11 +35,79 @@ INDUSTRY_KEYWORDS = {
 }
 
 TIMEFRAMES = "today 3-m"
+GEOS = ["KR"]
+
+REQUESTS_PER_MINUTE = 20   # 지속 요청 속도
+BURST = 5                  # 순간 최대 요청 수
+MAX_RETRIES = 4            # 429 재시도 횟수
+
+_bucket = TokenBucket(rate=REQUESTS_PER_MINUTE / 60, capacity=BURST)
+
+
+# =========================
+# Request Scheduling
+# =========================
 
+def _is_rate_limited(e: Exception) -> bool:
+    if type(e).__name__ == "TooManyRequestsError":
+        return True
+    response = getattr(e, "response", None)
+    return getattr(response, "status_code", None) == 429
 
-def collect_trends(run_id: str) -> List[Dict]:
+
+def _request(pytrends, keywords: List[str], timeframe: str, geo: str):
     """
-    Returns: trend_signals 테이블 구조의 row 리스트
+    token bucket 대기 후 조회. 429면 버킷을 비우고 백오프 후 재시도
+    """
+    delays = backoff_delays(MAX_RETRIES)
+    while True:
+        _bucket.acquire()
+        try:
+            pytrends.build_payload(keywords, timeframe=timeframe, geo=geo)
+            return pytrends.interest_over_time()
+        except Exception as e:
+            delay = next(delays, None)
+            if not _is_rate_limited(e) or delay is None:
+                raise
+            print(f"[TRENDS] 429 — {delay:.1f}s 후 재시도")
+            _bucket.penalize(delay)
+            time.sleep(delay)
+
+
+def _interest_over_time(pytrends, keywords: List[str], geo: str):
+    """
+    캐시 최신 → 그대로 사용 / 캐시 있음 → tail만 조회 후 병합 / 없음 → 전체 조회
+    """
+    key = cache_key(keywords, TIMEFRAMES, geo)
+    cached = load_frame(key)
+
+    if cached is not None and not cached.empty:
+        tail_tf = tail_timeframe(cached)
+        if tail_tf is None:
+            return cached
+        tail = _request(pytrends, keywords, tail_tf, geo)
+        if tail.empty:
+            return cached
+        merged = merge_tail(cached, tail, WINDOW_DAYS.get(TIMEFRAMES, 90))
+        if merged is not None:
+            save_frame(key, merged)
+            return merged
+
+    interest = _request(pytrends, keywords, TIMEFRAMES, geo)
+    if not interest.empty:
+        save_frame(key, interest)
+    return interest
+
+
+# =========================
+# Core
+# =========================
+
+def collect_trends(run_id: str, geos: Optional[List[str]] = None) -> List[Dict]:
+    """
+    geos: 수집할 market 목록 (기본 GEOS)
+
+    Returns: trend_signals 테이블 구조의 row 리스트 (industry × geo)
     """
     if TrendReq is None:
         print("[TRENDS] pytrends 미설치 → 건너뜀 (pip install pytrends)")
@@ -41,36 +117,35 @@ def collect_trends(run_id: str) -> List[Dict]:
     rows = []
     now = datetime.utcnow().isoformat()
 
-    for industry, keywords in INDUSTRY_KEYWORDS.items():
-        try:
-            pytrends.build_payload(keywords[:5], timeframe=TIMEFRAMES, geo="KR")
-            interest = pytrends.interest_over_time()
+    for geo in geos or GEOS:
+        for industry, keywords in INDUSTRY_KEYWORDS.items():
+            try:
+                interest = _interest_over_time(pytrends, keywords[:5], geo)
 
-            if interest.empty:
-                continue
+                if interest.empty:
+                    continue
 
-            avg = interest.mean().to_dict()
-            top_kw = [(k, v) for k, v in sorted(avg.items(), key=lambda x: x[1], reverse=True)
-                      if k != "isPartial"]
+                avg = interest.mean().to_dict()
+                top_kw = [(k, v) for k, v in sorted(avg.items(), key=lambda x: x[1], reverse=True)
+                          if k != "isPartial"]
 
-            summary = ", ".join([f"{k}({int(v)})" for k, v in top_kw])
+                summary = ", ".join([f"{k}({int(v)})" for k, v in top_kw])
 
-            rows.append({
-                "run_id":       run_id,
-                "industry":     industry,
-                "keyword":      top_kw[0][0] if top_kw else keywords[0],
-                "interest_avg": round(top_kw[0][1], 2) if top_kw else 0,
-                "top_keywords": [k for k, _ in top_kw[:5]],
-                "summary":      summary,
-                "timeframe":    TIMEFRAMES,
-                "geo":          "KR",
-                "collected_at": now,
-            })
+                rows.append({
+                    "run_id":       run_id,
+                    "industry":     industry,
+                    "keyword":      top_kw[0][0] if top_kw else keywords[0],
+                    "interest_avg": round(top_kw[0][1], 2) if top_kw else 0,
+                    "top_keywords": [k for k, _ in top_kw[:5]],
+                    "summary":      summary,
+                    "timeframe":    TIMEFRAMES,
+                    "geo":          geo,
+                    "collected_at": now,
+                })
 
-            print(f"[TRENDS] {industry}: {summary}")
-            time.sleep(1)
+                print(f"[TRENDS] {geo}/{industry}: {summary}")
 
-        except Exception as e:
-            print(f"[TRENDS] {industry} 실패: {e}")
+            except Exception as e:
+                print(f"[TRENDS] {geo}/{industry} 실패: {e}")
 
     return rows
@@ -0,0 +1,183 @@
+"""
+httpPool.py
+
+Module A - Collector 공용 HTTP 클라이언트
+- 호스트별 keep-alive 연결 재사용 (http.client) — 기사 본문처럼 같은 호스트에
+  요청이 몰리는 경우 TCP / TLS 핸드셰이크 반복 제거
+- 호스트별 동시 요청 수 제한 (BoundedSemaphore)
+- 재사용한 연결이 서버 측에서 끊겼으면 새 연결로 1회 재시도
+- 리다이렉트는 직접 추적 (호스트가 바뀌면 해당 호스트 슬롯 / 연결 사용)
+- 결과 형식은 feedFetcher.fetch_one과 동일한 result dict (예외를 던지지 않음)
+"""
+
+import http.client
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urljoin, urlsplit
+
+from moduleA.collectors.feedFetcher import (
+    CONNECT_TIMEOUT, READ_DEADLINE, USER_AGENT,
+    _decode_body, _empty_result, _read_with_deadline,
+)
+
+
+PER_HOST_CONCURRENCY = 2
+MAX_IDLE_PER_HOST = 2        # 호스트별로 보관하는 유휴 연결 수
+MAX_REDIRECTS = 5
+REDIRECT_CODES = {301, 302, 303, 307, 308}
+
+# 재사용 연결이 이미 닫혀 있을 때 나는 오류 — 새 연결로 재시도
+_STALE_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.BadStatusLine,
+    ConnectionResetError,
+    BrokenPipeError,
+)
+
+_Key = Tuple[str, str]   # (scheme, netloc)
+
+
+class HostConnectionPool:
+    """
+    with HostConnectionPool() as pool:
+        result = pool.request("https://example.com/article")
+    """
+
+    def __init__(
+        self,
+        per_host: int = PER_HOST_CONCURRENCY,
+        connect_timeout: float = CONNECT_TIMEOUT,
+        read_deadline: float = READ_DEADLINE,
+        user_agent: str = USER_AGENT,
+    ):
+        self.per_host = per_host
+        self.connect_timeout = connect_timeout
+        self.read_deadline = read_deadline
+        self.user_agent = user_agent
+        self._idle: Dict[_Key, List[http.client.HTTPConnection]] = {}
+        self._slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+        self.connections_opened = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ── connections ─────────────────────────────────
+
+    def _slot(self, netloc: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            if netloc not in self._slots:
+                self._slots[netloc] = threading.BoundedSemaphore(self.per_host)
+            return self._slots[netloc]
+
+    def _checkout(self, key: _Key) -> Tuple[http.client.HTTPConnection, bool]:
+        """(연결, 재사용 여부)"""
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                return idle.pop(), True
+            self.connections_opened += 1
+
+        scheme, netloc = key
+        cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        return cls(netloc, timeout=self.connect_timeout), False
+
+    def _checkin(self, key: _Key, conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < MAX_IDLE_PER_HOST:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for conns in idle.values():
+            for conn in conns:
+                conn.close()
+
+    # ── request ─────────────────────────────────────
+
+    def _send(self, key: _Key, path: str, headers: Dict[str, str], deadline: float):
+        """
+        요청 1회 (리다이렉트 미추적). 재사용 연결이 끊겨 있으면 새 연결로 1회 재시도
+        """
+        for attempt in range(2):
+            conn, reused = self._checkout(key)
+            try:
+                conn.request("GET", path, headers=headers)
+                resp = conn.getresponse()
+                raw = _read_with_deadline(resp, deadline)
+            except _STALE_ERRORS:
+                conn.close()
+                if reused and attempt == 0:
+                    continue
+                raise
+            except Exception:
+                conn.close()
+                raise
+
+            resp_headers = {k.lower(): v for k, v in resp.getheaders()}
+            if resp.will_close:
+                conn.close()
+            else:
+                self._checkin(key, conn)
+            return resp.status, resp_headers, raw
+
+    def request(self, url: str, headers: Optional[Dict[str, str]] = None) -> Dict:
+        """
+        GET 1건 → { url, status, body, headers, latency_ms, error }
+        headers["content-location"]: 리다이렉트 후 최종 URL
+        """
+        result = _empty_result(url)
+        req_headers = {
+            "User-Agent": self.user_agent,
+            "Accept": "text/html,application/xhtml+xml;q=0.9,*/*;q=0.5",
+            "Accept-Encoding": "gzip, deflate",
+        }
+        if headers:
+            req_headers.update(headers)
+
+        started = time.monotonic()
+        deadline = started + self.connect_timeout + self.read_deadline
+        current = url
+        try:
+            for _ in range(MAX_REDIRECTS + 1):
+                parts = urlsplit(current)
+                if parts.scheme not in ("http", "https"):
+                    raise ValueError(f"unsupported scheme: {parts.scheme}")
+                key = (parts.scheme, parts.netloc.lower())
+                path = parts.path or "/"
+                if parts.query:
+                    path = f"{path}?{parts.query}"
+
+                with self._slot(key[1]):
+                    status, resp_headers, raw = self._send(key, path, req_headers, deadline)
+
+                if status in REDIRECT_CODES and resp_headers.get("location"):
+                    current = urljoin(current, resp_headers["location"])
+                    continue
+
+                result["status"] = status
+                result["headers"] = resp_headers
+                result["headers"].setdefault("content-location", current)
+                if status == 304:
+                    break
+                if status >= 400:
+                    result["error"] = f"HTTP {status}"
+                    break
+                result["body"] = _decode_body(raw, resp_headers.get("content-encoding"))
+                break
+            else:
+                result["error"] = "too many redirects"
+        except Exception as e:
+            result["error"] = f"{type(e).__name__}: {e}"
+        finally:
+            result["latency_ms"] = int((time.monotonic() - started) * 1000)
+
+        return result
@@ -4,14 +4,19 @@ pinterestCollector.py
 Pinterest XHR 인터셉션 방식으로 키워드 검색 결과 이미지 수집.
 - Playwright 비동기 API
 - Pinterest 내부 API 응답(JSON) 가로채기
+- 브라우저 1개 + 페이지 풀 공유 (PinterestBrowserPool), 동시 페이지 수 제한
+- 이미지/폰트/미디어/분석 스크립트 요청은 route 단계에서 차단 (XHR JSON만 사용)
 - 핀 데이터: 이미지 URL, 타이틀, 설명, 원본 링크
+- collect_pinterest_trends: collectorRegistry용 동기 진입점 (visual_trends row 반환)
 """
 
 import asyncio
 import json
 import re
+from contextlib import asynccontextmanager
+from datetime import datetime
 from typing import Optional
-from playwright.async_api import async_playwright, Response
+from playwright.async_api import async_playwright, Response, Route
 
 
 # ── Pinterest 응답에서 핀 데이터 추출 ─────────────────────────
@@ -64,6 +69,118 @@ def _extract_pins(data: dict) -> list[dict]:
     return results
 
 
+# ── 공유 브라우저 풀 ──────────────────────────────────────────
+DEFAULT_CONCURRENCY = 4       # 동시에 열어 둘 페이지 수 상한
+INITIAL_WAIT_MS = 3000        # 첫 검색 결과 응답 대기 상한
+SCROLL_WAIT_MS = 1500         # 스크롤 1회당 새 결과 대기 상한
+MAX_SCROLLS = 4
+
+# XHR JSON만 소비하므로 렌더링용 무거운 리소스는 요청 자체를 중단
+BLOCKED_RESOURCE_TYPES = {"image", "media", "font", "texttrack", "manifest"}
+BLOCKED_URL_PARTS = (
+    "google-analytics.com", "googletagmanager.com", "doubleclick.net",
+    "facebook.net", "ct.pinterest.com", "/v3/callback/event/",
+)
+API_URL_PARTS = (
+    "/resource/", "/api/v3/", "/api/v5/",
+    "BaseSearch", "SearchResource",
+)
+
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/124.0.0.0 Safari/537.36"
+)
+
+
+async def _block_heavy_resources(route: Route):
+    request = route.request
+    if (request.resource_type in BLOCKED_RESOURCE_TYPES
+            or any(p in request.url for p in BLOCKED_URL_PARTS)):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+def _is_pin_api_response(response: Response) -> bool:
+    """body()를 읽기 전 URL / 리소스 타입 / content-type으로 후보 응답만 선별"""
+    if response.request.resource_type not in ("xhr", "fetch"):
+        return False
+    if not any(p in response.url for p in API_URL_PARTS):
+        return False
+    return "json" in (response.headers.get("content-type") or "")
+
+
+class PinterestBrowserPool:
+    """
+    Chromium 1개를 띄워 두고 market별 context + 페이지를 재사용하는 풀.
+    동시에 사용 중인 페이지 수는 max_pages로 제한.
+
+    async with PinterestBrowserPool(max_pages=4) as pool:
+        pins = await collect_pinterest("keyword", pool=pool)
+    """
+
+    def __init__(
+        self,
+        max_pages: int = DEFAULT_CONCURRENCY,
+        headless: bool = True,
+        block_resources: bool = True,
+    ):
+        self.max_pages = max_pages
+        self.headless = headless
+        self.block_resources = block_resources
+        self._slots = asyncio.Semaphore(max_pages)
+        self._pw = None
+        self._browser = None
+        self._contexts: dict = {}
+        self._context_lock = asyncio.Lock()
+        self._idle_pages: dict[str, list] = {}
+
+    async def __aenter__(self):
+        self._pw = await async_playwright().start()
+        self._browser = await self._pw.chromium.launch(headless=self.headless)
+        return self
+
+    async def __aexit__(self, *exc):
+        try:
+            await self._browser.close()
+        finally:
+            await self._pw.stop()
+
+    async def _context(self, market: str):
+        # 키워드가 동시에 실행되므로 확인 ~ 생성 사이의 await 동안 같은 market context가 중복 생성되지 않도록 잠금
+        async with self._context_lock:
+            if market not in self._contexts:
+                context = await self._browser.new_context(
+                    user_agent=USER_AGENT,
+                    viewport={"width": 1440, "height": 900},
+                    locale="ja-JP" if market == "JP" else "en-US",
+                )
+                if self.block_resources:
+                    await context.route("**/*", _block_heavy_resources)
+                self._contexts[market] = context
+            return self._contexts[market]
+
+    @asynccontextmanager
+    async def page(self, market: str = "GLOBAL"):
+        async with self._slots:
+            idle = self._idle_pages.setdefault(market, [])
+            page = idle.pop() if idle else await (await self._context(market)).new_page()
+            try:
+                yield page
+            finally:
+                # 닫히지 않은 페이지만 다음 키워드에 재사용
+                if not page.is_closed():
+                    idle.append(page)
+
+
+async def _wait_event(event: asyncio.Event, timeout_ms: int) -> None:
+    try:
+        await asyncio.wait_for(event.wait(), timeout=timeout_ms / 1000)
+    except asyncio.TimeoutError:
+        pass
+
+
 # ── 단일 키워드 수집 ──────────────────────────────────────────
 async def collect_pinterest(
     keyword: str,
@@ -71,23 +188,29 @@ async def collect_pinterest(
     market: str = "GLOBAL",
     headless: bool = True,
     timeout_ms: int = 15000,
+    pool: Optional[PinterestBrowserPool] = None,
 ) -> list[dict]:
     """
     keyword: 검색어 (영문 권장)
     market: "JP" → pinterest.co.jp 사용, 나머지 → pinterest.com
+    pool: 공유 브라우저 풀 (없으면 이 호출 전용 풀을 열고 닫음)
     """
+    if pool is None:
+        async with PinterestBrowserPool(max_pages=1, headless=headless) as own_pool:
+            return await collect_pinterest(
+                keyword, limit=limit, market=market, timeout_ms=timeout_ms, pool=own_pool,
+            )
+
     search_url = f"https://www.pinterest.com/search/pins/?q={keyword.replace(' ', '+')}&rs=typed"
 
     collected: list[dict] = []
     seen_ids: set[str] = set()
+    progress = asyncio.Event()   # 새 핀이 들어올 때마다 set
+    enough = asyncio.Event()     # limit 도달 시 set
 
     async def handle_response(response: Response):
-        url = response.url
-        # Pinterest 내부 API 엔드포인트 필터링
-        if not any(p in url for p in [
-            "/resource/", "/api/v3/", "/api/v5/",
-            "BaseSearch", "SearchResource",
-        ]):
+        # Pinterest 내부 API JSON 응답만 본문 읽기
+        if not _is_pin_api_response(response):
             return
         try:
             body = await response.body()
@@ -97,39 +220,31 @@ async def collect_pinterest(
                 if pin["id"] not in seen_ids and pin["image_url"]:
                     seen_ids.add(pin["id"])
                     collected.append(pin)
+                    progress.set()
+            if len(collected) >= limit:
+                enough.set()
         except Exception:
             pass
 
-    async with async_playwright() as pw:
-        browser = await pw.chromium.launch(headless=headless)
-        ctx = await browser.new_context(
-            user_agent=(
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/124.0.0.0 Safari/537.36"
-            ),
-            viewport={"width": 1440, "height": 900},
-            locale="ja-JP" if market == "JP" else "en-US",
-        )
-        page = await ctx.new_page()
+    async with pool.page(market) as page:
         page.on("response", handle_response)
-
         try:
             await page.goto(search_url, timeout=timeout_ms, wait_until="domcontentloaded")
-            # 초기 렌더링 대기
-            await page.wait_for_timeout(3000)
+            # 첫 결과 응답 대기 (도착하면 즉시 진행)
+            await _wait_event(progress, INITIAL_WAIT_MS)
 
-            # 더 많은 결과가 필요하면 스크롤
+            # 더 많은 결과가 필요하면 스크롤 — 새 결과가 오거나 limit 도달 시 즉시 다음 단계
             scrolls = 0
-            while len(collected) < limit and scrolls < 4:
+            while not enough.is_set() and scrolls < MAX_SCROLLS:
+                progress.clear()
                 await page.evaluate("window.scrollBy(0, window.innerHeight * 2)")
-                await page.wait_for_timeout(1500)
+                await _wait_event(progress, SCROLL_WAIT_MS)
                 scrolls += 1
 
         except Exception as e:
             print(f"[PINTEREST] 페이지 로드 오류: {e}")
         finally:
-            await browser.close()
+            page.remove_listener("response", handle_response)
 
     return collected[:limit]
 
@@ -139,13 +254,18 @@ async def collect_pinterest_batch(
     keywords: list[str],
     limit_per_keyword: int = 5,
     market: str = "GLOBAL",
+    max_concurrency: int = DEFAULT_CONCURRENCY,
 ) -> list[dict]:
-    """여러 키워드를 병렬 수집 후 합산 (중복 image_url 제거)"""
-    tasks = [
-        collect_pinterest(kw, limit=limit_per_keyword, market=market)
-        for kw in keywords
-    ]
-    results_per_kw = await asyncio.gather(*tasks, return_exceptions=True)
+    """
+    여러 키워드를 공유 브라우저 풀에서 병렬 수집 후 합산 (중복 image_url 제거)
+    max_concurrency: 동시에 사용하는 페이지 수 상한 (브라우저는 항상 1개)
+    """
+    async with PinterestBrowserPool(max_pages=max_concurrency) as pool:
+        tasks = [
+            collect_pinterest(kw, limit=limit_per_keyword, market=market, pool=pool)
+            for kw in keywords
+        ]
+        results_per_kw = await asyncio.gather(*tasks, return_exceptions=True)
 
     seen_urls: set[str] = set()
     merged = []
@@ -162,6 +282,52 @@ async def collect_pinterest_batch(
     return merged
 
 
+# ── 파이프라인 수집기 (collectorRegistry 등록용) ─────────────
+PINTEREST_KEYWORDS = {
+    "general": ["web design trend", "brand identity design", "ui design inspiration"],
+    "fashion": ["fashion brand website", "fashion lookbook layout"],
+    "beauty":  ["beauty brand packaging", "skincare website design"],
+    "f&b":     ["cafe branding design", "restaurant menu design"],
+}
+
+
+def collect_pinterest_trends(
+    run_id: str,
+    keywords_by_industry: dict = PINTEREST_KEYWORDS,
+    limit_per_keyword: int = 5,
+) -> list[dict]:
+    """
+    Returns: visual_trends 테이블 구조의 row 리스트
+    """
+    industry_of = {
+        kw: industry
+        for industry, keywords in keywords_by_industry.items()
+        for kw in keywords
+    }
+    pins = asyncio.run(collect_pinterest_batch(list(industry_of), limit_per_keyword=limit_per_keyword))
+    now = datetime.utcnow().isoformat()
+
+    rows = []
+    for pin in pins:
+        if not pin["id"]:
+            continue
+        kw = pin["source_keyword"]
+        rows.append({
+            "run_id":       run_id,
+            "source_name":  f"Pinterest / {kw}",
+            "source_url":   f"https://www.pinterest.com/pin/{pin['id']}/",
+            "title":        pin["title"],
+            "description":  pin["description"],
+            "industry":     industry_of.get(kw, "general"),
+            "tags":         ["visual", "pinterest", kw],
+            "embedding":    None,
+            "collected_at": now,
+        })
+
+    print(f"[PINTEREST] {len(rows)}개 핀 수집 ({len(industry_of)}개 키워드)")
+    return rows
+
+
 # ── 직접 실행 테스트 ─────────────────────────────────────────
 if __name__ == "__main__":
     import sys
@@ -3,117 +3,191 @@ rssCollector.py
 
 Module A - Collector
 - RSS 피드 수집
-- crawl_status: success / partial / blocked
+- crawl_status: success / partial / blocked / not_modified
+- 다운로드는 feedFetcher가 동시 수행, 파싱은 feedParser(큰 피드는 프로세스 풀)
+- 조건부 GET(feedCache): 304 응답은 파싱 없이 not_modified로 기록
+- seenIndex: 이전 실행에서 처리한 entry는 items에서 제외 (new / seen 개수 로그)
+- sourceSchedule: 소스별 학습된 폴링 주기에 따라 due 소스만 수집
+- circuitBreaker: 연속 blocked 소스는 cooldown 동안 건너뛰고 짧은 probe로만 재확인
+- 전체 예산 초과로 받지 못한 소스는 blocked로 기록하되 schedule / breaker에는 반영하지 않음
+- 소스 목록: sourceCatalog(settings.yaml)의 rss 그룹, fetch 순서는 catalog.plan()
 - 전략/분류/요약 금지. 원문 수집만.
 """
 
 import uuid
-import feedparser
+from contextlib import nullcontext
 from datetime import datetime
 from typing import List, Dict, Tuple
 
+from common.config.sourceCatalog import get_source_catalog, SourceRecord
+from moduleA.collectors.circuitBreaker import (
+    get_circuit_breaker, PROBE_CONNECT_TIMEOUT, PROBE_READ_DEADLINE,
+)
+from moduleA.collectors.feedCache import get_validator_cache
+from moduleA.collectors.feedFetcher import fetch_all, BUDGET_EXCEEDED, TOTAL_BUDGET
+from moduleA.collectors.feedParser import FeedParsePool
+from moduleA.collectors.seenIndex import get_seen_index
+from moduleA.collectors.sourceSchedule import get_source_schedule
 
-RSS_SOURCES = [
-    # ── 디자인 종합 ──────────────────────────────────
-    {"name": "DesignBoom",        "url": "https://www.designboom.com/feed/",              "category": "Design General",       "language": "en"},
-    {"name": "Dezeen",            "url": "https://www.dezeen.com/feed/",                  "category": "Design General",       "language": "en"},
-    {"name": "Design Milk",       "url": "https://design-milk.com/feed/",                 "category": "Design General",       "language": "en"},
-    {"name": "It's Nice That",    "url": "https://www.itsnicethat.com/feed",              "category": "Design General",       "language": "en"},
-    {"name": "Creative Bloq",     "url": "https://www.creativebloq.com/feed",             "category": "Design General",       "language": "en"},
-    {"name": "Abduzeedo",         "url": "https://abduzeedo.com/rss.xml",                 "category": "Design Inspiration",   "language": "en"},
-    {"name": "Colossal",          "url": "https://www.thisiscolossal.com/feed/",          "category": "Art + Design",         "language": "en"},
-
-    # ── UX/UI ────────────────────────────────────────
-    {"name": "Nielsen Norman Group", "url": "https://www.nngroup.com/feed/rss/",          "category": "UX Research",          "language": "en", "priority": "high"},
-    {"name": "UX Collective",     "url": "https://uxdesign.cc/feed",                      "category": "UX Design",            "language": "en", "priority": "high"},
-    {"name": "Smashing Magazine", "url": "https://www.smashingmagazine.com/feed/",        "category": "Web Design + UX",      "language": "en", "priority": "high"},
-    {"name": "UX Matters",        "url": "https://www.uxmatters.com/index.xml",           "category": "UX Strategy",          "language": "en"},
-    {"name": "A List Apart",      "url": "https://alistapart.com/main/feed/",             "category": "Web Standards + UX",   "language": "en"},
-
-    # ── 브랜딩 ───────────────────────────────────────
-    {"name": "Brand New",         "url": "https://www.underconsideration.com/brandnew/feed/", "category": "Brand Identity",  "language": "en", "priority": "high"},
-    {"name": "The Dieline",       "url": "https://thedieline.com/feed/",                  "category": "Packaging Design",     "language": "en"},
-    {"name": "BP&O",              "url": "https://bpando.org/feed/",                      "category": "Brand Packaging",      "language": "en"},
-
-    # ── 웹 디자인 ────────────────────────────────────
-    {"name": "Awwwards Blog",     "url": "https://www.awwwards.com/blog/feed/",           "category": "Web Design",           "language": "en"},
-    {"name": "CSS Design Awards", "url": "https://www.cssdesignawards.com/blog/feed/",    "category": "CSS + Web Design",     "language": "en"},
-
-    # ── 테크/AI ──────────────────────────────────────
-    {"name": "Fast Company Design", "url": "https://www.fastcompany.com/section/design/rss", "category": "Design + Innovation", "language": "en"},
-    {"name": "Wired Design",      "url": "https://www.wired.com/feed/category/design/latest/rss", "category": "Future Design", "language": "en"},
-
-    # ── 한국어 ───────────────────────────────────────
-    {"name": "디자인정글",          "url": "http://www.jungle.co.kr/rss/magazine_list",    "category": "Korean Design",        "language": "ko", "geography": "KR"},
-    {"name": "월간 디자인",         "url": "https://mdesign.designhouse.co.kr/feed",       "category": "Korean Design",        "language": "ko", "geography": "KR"},
-
-    # ── 도메인별 ─────────────────────────────────────
-    {"name": "WWD",               "url": "https://wwd.com/feed/",                         "category": "Fashion News",         "language": "en", "domain": "fashion"},
-    {"name": "BoF",               "url": "https://www.businessoffashion.com/feed",        "category": "Fashion Business",     "language": "en", "domain": "fashion"},
-    {"name": "Cosmetics Design",  "url": "https://www.cosmeticsdesign.com/rss",           "category": "Beauty + Packaging",   "language": "en", "domain": "beauty"},
-]
-
-
-def _classify_status(feed, entry_count: int) -> str:
-    """수집 결과를 success / partial / blocked 로 분류"""
-    if feed.bozo and entry_count == 0:
+
+def classify_status(feed, entry_count: int) -> str:
+    """수집 결과를 success / partial / blocked 로 분류 (feed: feedParser compact dict)"""
+    if feed["bozo"] and entry_count == 0:
         return "blocked"
     if entry_count == 0:
         return "blocked"
-    if feed.bozo or entry_count < 3:
+    if feed["bozo"] or entry_count < 3:
         return "partial"
     return "success"
 
 
-def collect_rss(run_id: str, max_per_source: int = 20) -> Tuple[List[Dict], List[Dict]]:
+def _collect_source(
+    source: SourceRecord,
+    result: Dict,
+    feed,
+    run_id: str,
+    now: str,
+    validators,
+    seen_index,
+) -> Tuple[List[Dict], Dict]:
+    """
+    소스 1개의 fetch / parse 결과 → (items, retrieval_log)
     """
+    items: List[Dict] = []
+    log = {
+        "run_id": run_id,
+        "source_url": source.url,
+        "crawl_status": "blocked",
+        "retrieved_count": 0,
+        "error_message": None,
+        "latency_ms": result["latency_ms"],
+        "new_count": 0,
+        "seen_count": 0,
+    }
+
+    if result["error"]:
+        log["error_message"] = result["error"]
+        print(f"[RSS] {source.name}: blocked — {result['error']}")
+        return items, log
+
+    if result["status"] == 304:
+        log["crawl_status"] = "not_modified"
+        print(f"[RSS] {source.name}: not_modified ({log['latency_ms']}ms)")
+        return items, log
+
+    try:
+        if isinstance(feed, Exception):
+            raise feed
+        if feed is None:
+            raise ValueError("parse result missing")
+        entries = feed["entries"]
+        log["crawl_status"] = classify_status(feed, len(entries))
+        log["retrieved_count"] = len(entries)
+        validators.record(source.url, result["headers"])
+
+        if seen_index is not None:
+            entries, log["seen_count"] = seen_index.partition(source.url, entries)
+        log["new_count"] = len(entries)
+
+        for entry in entries:
+            items.append({
+                "id": str(uuid.uuid4()),
+                "run_id": run_id,
+                "source_name": source.name,
+                "source_url": entry.get("link", ""),
+                "title": entry.get("title", ""),
+                "body_text": entry.get("summary", ""),
+                "industry": source.domain,      # fashion / beauty / etc.
+                "domain": source.category,
+                "tags": [],
+                "crawl_status": log["crawl_status"],
+                "language": source.language,
+                "priority": source.priority_label,
+                "collected_at": now,
+            })
+
+        print(
+            f"[RSS] {source.name}: {log['crawl_status']} "
+            f"({log['new_count']} new / {log['seen_count']} seen, {log['latency_ms']}ms)"
+        )
+
+    except Exception as e:
+        items = []
+        log["crawl_status"] = "blocked"
+        log["error_message"] = str(e)
+        print(f"[RSS] {source.name}: blocked — {e}")
+
+    return items, log
+
+
+def collect_rss(
+    run_id: str,
+    max_per_source: int = 20,
+    total_budget: float = TOTAL_BUDGET,
+    only_new: bool = True,
+    respect_schedule: bool = True,
+    guard=None,
+) -> Tuple[List[Dict], List[Dict]]:
+    """
+    only_new: True면 seenIndex 기준 새 entry만 반환 (백필 시 False)
+    respect_schedule: True면 sourceSchedule 기준 due 소스만 폴링
+    guard: collectorRegistry.StagingGuard — 데드라인을 넘기면 상태 staging 없이 CollectorCancelled
+
     Returns:
         items: 수집된 레퍼런스 리스트
         logs:  소스별 crawl_status 로그 리스트
+               (latency_ms, new_count, seen_count, next_due_at, breaker_state 포함)
     """
     items: List[Dict] = []
     logs: List[Dict] = []
     now = datetime.utcnow().isoformat()
 
-    for source in RSS_SOURCES:
-        log = {
-            "run_id": run_id,
-            "source_url": source["url"],
-            "crawl_status": "blocked",
-            "retrieved_count": 0,
-            "error_message": None,
-        }
-
-        try:
-            feed = feedparser.parse(source["url"])
-            entries = feed.entries[:max_per_source]
-            log["crawl_status"] = _classify_status(feed, len(entries))
-            log["retrieved_count"] = len(entries)
-
-            for entry in entries:
-                items.append({
-                    "id": str(uuid.uuid4()),
-                    "run_id": run_id,
-                    "source_name": source["name"],
-                    "source_url": entry.get("link", ""),
-                    "title": entry.get("title", ""),
-                    "body_text": entry.get("summary", ""),
-                    "industry": source.get("domain"),      # fashion / beauty / etc.
-                    "domain": source.get("category"),
-                    "tags": [],
-                    "crawl_status": log["crawl_status"],
-                    "language": source.get("language", "en"),
-                    "priority": source.get("priority", "normal"),
-                    "collected_at": now,
-                })
-
-            print(f"[RSS] {source['name']}: {log['crawl_status']} ({len(entries)} items)")
-
-        except Exception as e:
-            log["crawl_status"] = "blocked"
-            log["error_message"] = str(e)
-            print(f"[RSS] {source['name']}: blocked — {e}")
-
-        logs.append(log)
+    validators = get_validator_cache()
+    seen_index = get_seen_index() if only_new else None
+    schedule = get_source_schedule()
+    breaker = get_circuit_breaker()
+    catalog = get_source_catalog()
+
+    catalog_sources = catalog.sources("rss")
+    sources = schedule.filter_due(catalog_sources) if respect_schedule else list(catalog_sources)
+    if len(sources) < len(catalog_sources):
+        print(f"[RSS] {len(catalog_sources) - len(sources)}개 소스 폴링 주기 미도래 → 건너뜀")
+
+    # split의 open → half_open staging은 guard 밖: commit돼도 다음 실행의 split과 같은 결과
+    sources, probes, skipped = breaker.split(sources)
+    for source in skipped:
+        print(f"[RSS] {source.name}: circuit open → 건너뜀")
+
+    urls = catalog.plan(sources)
+    with FeedParsePool(max_entries=max_per_source) as parser:
+        fetched = fetch_all(
+            urls,
+            planned=True,
+            total_budget=total_budget,
+            request_headers={url: validators.headers_for(url) for url in urls},
+            on_result=parser.submit,
+            timeouts={url: (PROBE_CONNECT_TIMEOUT, PROBE_READ_DEADLINE) for url in probes},
+        )
+        parsed = parser.drain()
+
+    # 결과 반영(seen / validator / schedule / breaker staging)은 한 구간에서 — 데드라인 이후면 전부 건너뜀
+    with guard.staging() if guard is not None else nullcontext():
+        for source in sources:
+            source_items, log = _collect_source(
+                source, fetched[source.url], parsed.get(source.url),
+                run_id, now, validators, seen_index,
+            )
+            if log["error_message"] == BUDGET_EXCEEDED:
+                # 소스 실패가 아니라 예산 부족 (plan 순서상 매번 같은 꼬리 소스) → 다음 실행에서 재시도
+                log["next_due_at"] = now
+                log["breaker_state"] = breaker.state_of(source.url)
+            else:
+                next_due = schedule.observe(
+                    source.url, log["crawl_status"], log["new_count"], page_size=max_per_source,
+                )
+                log["next_due_at"] = next_due.isoformat()
+                log["breaker_state"] = breaker.record(source.url, log["crawl_status"])
+            items.extend(source_items)
+            logs.append(log)
 
     return items, logs
@@ -0,0 +1,133 @@
+"""
+seenIndex.py
+
+Module A - Collector
+- 이전 실행에서 이미 처리한 피드 entry 로컬 인덱스 (SQLite)
+- key: entry GUID(id) → 없으면 link
+- content_hash: title + summary 해시 → 내용이 바뀐 entry는 새 항목으로 취급
+- 새 항목 판정 결과는 commit() 전까지 메모리에만 보관
+  (파이프라인 실패 시 미처리 entry가 seen으로 남는 것 방지)
+"""
+
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from common.utils.hashUtils import hash_from_fields
+
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+STATE_DIR = os.path.join(BASE_DIR, "data", "state")
+SEEN_INDEX_PATH = os.path.join(STATE_DIR, "seen_entries.db")
+
+_LOOKUP_BATCH = 500  # SQLite 변수 개수 제한 대비
+
+
+# =========================
+# Utils
+# =========================
+
+def entry_key(entry: Dict) -> str:
+    return (entry.get("id") or entry.get("link") or "").strip()
+
+
+def entry_content_hash(entry: Dict) -> str:
+    return hash_from_fields({
+        "title": entry.get("title", ""),
+        "summary": entry.get("summary", ""),
+    })
+
+
+# =========================
+# Core
+# =========================
+
+class SeenIndex:
+    """
+    entry_key → (source, content_hash, first_seen, last_seen)
+    """
+
+    def __init__(self, path: str = SEEN_INDEX_PATH):
+        self.path = path
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS seen_entries (
+                entry_key    TEXT PRIMARY KEY,
+                source       TEXT NOT NULL,
+                content_hash TEXT NOT NULL,
+                first_seen   TEXT NOT NULL,
+                last_seen    TEXT NOT NULL
+            )
+        """)
+        self._conn.commit()
+        self._pending: Dict[str, Tuple[str, str]] = {}
+        self._lock = threading.Lock()
+
+    def _lookup(self, keys: List[str]) -> Dict[str, str]:
+        found: Dict[str, str] = {}
+        for i in range(0, len(keys), _LOOKUP_BATCH):
+            batch = keys[i: i + _LOOKUP_BATCH]
+            marks = ",".join("?" * len(batch))
+            rows = self._conn.execute(
+                f"SELECT entry_key, content_hash FROM seen_entries WHERE entry_key IN ({marks})",
+                batch,
+            ).fetchall()
+            found.update(rows)
+        return found
+
+    def partition(self, source: str, entries: List[Dict]) -> Tuple[List[Dict], int]:
+        """
+        entries → (새 항목 리스트, 이미 본 항목 수)
+        key가 없는 entry는 판정 불가 → 새 항목으로 통과
+        """
+        keyed = [(entry_key(e), entry_content_hash(e), e) for e in entries]
+
+        with self._lock:
+            stored = self._lookup([k for k, _, _ in keyed if k])
+            new_entries: List[Dict] = []
+            seen = 0
+            for key, content_hash, entry in keyed:
+                if key:
+                    known = self._pending.get(key, (None, None))[1] or stored.get(key)
+                    if known == content_hash:
+                        seen += 1
+                        continue
+                    self._pending[key] = (source, content_hash)
+                new_entries.append(entry)
+
+        return new_entries, seen
+
+    def commit(self) -> None:
+        with self._lock:
+            if not self._pending:
+                return
+            now = datetime.utcnow().isoformat()
+            self._conn.executemany(
+                """
+                INSERT INTO seen_entries (entry_key, source, content_hash, first_seen, last_seen)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(entry_key) DO UPDATE SET
+                    content_hash = excluded.content_hash,
+                    last_seen    = excluded.last_seen
+                """,
+                [(k, src, h, now, now) for k, (src, h) in self._pending.items()],
+            )
+            self._conn.commit()
+            self._pending = {}
+
+    def rollback(self) -> None:
+        with self._lock:
+            self._pending = {}
+
+
+_index: Optional[SeenIndex] = None
+
+
+def get_seen_index() -> SeenIndex:
+    global _index
+    if _index is None:
+        _index = SeenIndex()
+    return _index
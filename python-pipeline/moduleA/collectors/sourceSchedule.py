@@ -0,0 +1,124 @@
+"""
+sourceSchedule.py
+
+Module A - Collector
+- 소스(피드 URL)별 적응형 폴링 주기
+- retrieval_logs 결과(crawl_status, new_count)로 소스별 새 entry 발생률(시간당)을 EWMA로 학습
+- 다음 폴링까지 새 entry가 TARGET_NEW_ENTRIES개 정도 쌓이도록 주기 계산
+  → 자주 갱신되는 소스는 매 실행, 드문 소스는 최대 MAX_INTERVAL_HOURS까지 간격 확대
+- 상태 갱신은 commit() 전까지 메모리에만 보관 (실패한 실행은 반영하지 않음)
+"""
+
+import os
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Sequence
+
+from common.utils.stateStore import StagedJsonState
+
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+STATE_DIR = os.path.join(BASE_DIR, "data", "state")
+SCHEDULE_PATH = os.path.join(STATE_DIR, "source_schedule.json")
+
+RUN_INTERVAL_HOURS = 12.0      # runScheduler 실행 간격
+DEFAULT_INTERVAL_HOURS = 12.0
+MIN_INTERVAL_HOURS = 1.0
+MAX_INTERVAL_HOURS = 24.0 * 7
+TARGET_NEW_ENTRIES = 5.0       # 폴링 1회당 기대 새 entry 수
+RATE_ALPHA = 0.4               # EWMA 가중치 (최근 관측 비중)
+IDLE_BACKOFF = 1.5             # 새 entry가 계속 없을 때 간격 증가 배수
+
+
+def _parse(ts: Optional[str]) -> Optional[datetime]:
+    return datetime.fromisoformat(ts) if ts else None
+
+
+class SourceSchedule(StagedJsonState):
+    """
+    url → { interval_hours, rate_per_hour, last_polled, next_due }
+    """
+
+    def __init__(self, path: str = SCHEDULE_PATH):
+        super().__init__(path)
+
+    def next_due(self, url: str) -> Optional[datetime]:
+        return _parse(self.get(url).get("next_due"))
+
+    def is_due(self, url: str, now: Optional[datetime] = None) -> bool:
+        """
+        다음 실행 시각보다 이번 실행이 next_due에 더 가까우면 due
+        (고정 시각 스케줄러 기준 반올림 — 몇 분 차이로 12시간 밀리지 않도록)
+        """
+        now = now or datetime.utcnow()
+        due = self.next_due(url)
+        if due is None:
+            return True
+        return due - now < timedelta(hours=RUN_INTERVAL_HOURS / 2)
+
+    def filter_due(self, sources: Sequence, now: Optional[datetime] = None) -> List:
+        """sources: SourceRecord 목록"""
+        return [s for s in sources if self.is_due(s.url, now)]
+
+    def observe(
+        self,
+        url: str,
+        crawl_status: str,
+        new_count: int,
+        page_size: Optional[int] = None,
+        now: Optional[datetime] = None,
+    ) -> datetime:
+        """
+        폴링 결과 1건 반영 후 다음 due 시각 반환
+
+        page_size: 요청한 최대 entry 수 — 새 entry가 이만큼 나오면 놓친 항목이
+                   있을 수 있으므로 간격을 경과 시간의 절반 이하로 줄임
+        """
+        now = now or datetime.utcnow()
+        with self._lock:
+            state = self.get(url)
+            interval = state.get("interval_hours", DEFAULT_INTERVAL_HOURS)
+            last_polled = _parse(state.get("last_polled"))
+            elapsed = (now - last_polled).total_seconds() / 3600 if last_polled else interval
+            elapsed = max(elapsed, MIN_INTERVAL_HOURS)
+
+            if crawl_status == "blocked":
+                # 실패는 발생률 정보가 없음 — 주기 유지, 다음 실행에서 재시도
+                next_due = now
+            else:
+                observed = new_count / elapsed
+                prev_rate = state.get("rate_per_hour")
+                rate = observed if prev_rate is None else RATE_ALPHA * observed + (1 - RATE_ALPHA) * prev_rate
+
+                if rate > 0:
+                    interval = TARGET_NEW_ENTRIES / rate
+                if new_count == 0:
+                    interval = max(interval, state.get("interval_hours", DEFAULT_INTERVAL_HOURS) * IDLE_BACKOFF)
+                if page_size and new_count >= page_size:
+                    interval = min(interval, elapsed / 2)
+
+                interval = min(max(interval, MIN_INTERVAL_HOURS), MAX_INTERVAL_HOURS)
+                state["rate_per_hour"] = round(rate, 4)
+                next_due = now + timedelta(hours=interval)
+
+            state["interval_hours"] = round(interval, 2)
+            state["last_polled"] = now.isoformat()
+            state["next_due"] = next_due.isoformat()
+            self.stage(url, state)
+            return next_due
+
+    def report(self) -> List[Dict]:
+        """
+        소스별 현재 주기 / 다음 due (next_due 오름차순)
+        """
+        rows = [{"source_url": url, **state} for url, state in self.snapshot().items()]
+        return sorted(rows, key=lambda r: r.get("next_due") or "")
+
+
+_schedule: Optional[SourceSchedule] = None
+
+
+def get_source_schedule() -> SourceSchedule:
+    global _schedule
+    if _schedule is None:
+        _schedule = SourceSchedule()
+    return _schedule
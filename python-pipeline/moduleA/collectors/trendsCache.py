@@ -0,0 +1,117 @@
+"""
+trendsCache.py
+
+Module A - Collector
+- Google Trends interest-over-time 프레임 로컬 캐시
+- key: (keywords, timeframe, geo)
+- 캐시가 있으면 마지막 확정 날짜 이후 tail 구간만 조회 → 겹치는 구간 비율로
+  tail 스케일을 캐시 기준에 맞춘 뒤 병합
+  (Trends 값은 조회 구간마다 0~100으로 재정규화되므로 단순 이어붙이기 불가)
+- 스케일 보정이 불가능하면 None → 호출 측이 전체 구간 재조회
+"""
+
+import os
+from datetime import date, timedelta
+from io import StringIO
+from typing import List, Optional
+
+import pandas as pd
+
+from common.utils.hashUtils import hash_from_fields
+from common.utils.stateStore import load_json_state, save_json_state
+
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CACHE_DIR = os.path.join(BASE_DIR, "data", "state", "trends")
+
+WINDOW_DAYS = {"today 1-m": 30, "today 3-m": 90, "today 12-m": 365}
+TAIL_OVERLAP_DAYS = 14   # 스케일 보정에 사용할 겹침 구간
+FRESH_LAG_DAYS = 1       # Trends 일별 데이터는 하루 늦게 확정됨
+
+
+# =========================
+# Storage
+# =========================
+
+def cache_key(keywords: List[str], timeframe: str, geo: str) -> str:
+    return hash_from_fields({
+        "keywords": "|".join(keywords),
+        "timeframe": timeframe,
+        "geo": geo,
+    })
+
+
+def _path(key: str) -> str:
+    return os.path.join(CACHE_DIR, f"{key}.json")
+
+
+def load_frame(key: str) -> Optional[pd.DataFrame]:
+    state = load_json_state(_path(key))
+    if not state:
+        return None
+    frame = pd.read_json(StringIO(state["frame"]), orient="split")
+    frame.index = pd.to_datetime(frame.index)
+    return frame
+
+
+def save_frame(key: str, frame: pd.DataFrame) -> None:
+    save_json_state(_path(key), {
+        "frame": frame.to_json(orient="split", date_format="iso"),
+    })
+
+
+# =========================
+# Tail Merge
+# =========================
+
+def _settled(frame: pd.DataFrame) -> pd.DataFrame:
+    """isPartial(집계 중인 마지막 날) 행 제외"""
+    if "isPartial" in frame.columns:
+        return frame[~frame["isPartial"].astype(bool)]
+    return frame
+
+
+def tail_timeframe(cached: pd.DataFrame, today: Optional[date] = None) -> Optional[str]:
+    """
+    추가로 조회해야 할 구간 ("YYYY-MM-DD YYYY-MM-DD"). 최신이면 None
+    """
+    today = today or date.today()
+    settled = _settled(cached)
+    if settled.empty:
+        return f"{today - timedelta(days=TAIL_OVERLAP_DAYS)} {today}"
+
+    last = settled.index.max().date()
+    if last >= today - timedelta(days=FRESH_LAG_DAYS):
+        return None
+    return f"{last - timedelta(days=TAIL_OVERLAP_DAYS)} {today}"
+
+
+def merge_tail(
+    cached: pd.DataFrame,
+    tail: pd.DataFrame,
+    window_days: int,
+) -> Optional[pd.DataFrame]:
+    """
+    겹치는 날짜의 합 비율로 tail을 캐시 스케일에 맞춰 병합.
+    겹침이 없거나 어느 키워드든 합이 0이면 None
+    """
+    base = _settled(cached)
+    overlap = base.index.intersection(tail.index)
+    if len(overlap) == 0:
+        return None
+
+    keywords = [c for c in base.columns if c != "isPartial"]
+    scaled = tail.copy()
+    for kw in keywords:
+        if kw not in tail.columns:
+            return None
+        base_sum = base.loc[overlap, kw].sum()
+        tail_sum = tail.loc[overlap, kw].sum()
+        if base_sum == 0 or tail_sum == 0:
+            return None
+        scaled[kw] = tail[kw] * (base_sum / tail_sum)
+
+    new_rows = scaled[scaled.index > base.index.max()]
+    merged = pd.concat([base, new_rows])
+    cutoff = merged.index.max() - pd.Timedelta(days=window_days)
+    return merged[merged.index > cutoff]
@@ -6,60 +6,129 @@ HOW 신호: 디자인/형태로 어떻게 번졌는가
 → visual_trends 테이블에 저장
 
 Behance RSS + Dribbble RSS + Awwwards 활용
+- feedFetcher 동시 수집 + feedCache 조건부 GET (304면 파싱 생략)
+- seenIndex: 이전 실행에서 처리한 entry 제외
+- sourceSchedule: 소스별 학습된 폴링 주기에 따라 due 소스만 수집
+- 소스 목록: sourceCatalog(settings.yaml)의 visual 그룹
+- circuitBreaker: 연속 blocked 소스는 cooldown 동안 건너뛰고 짧은 probe로만 재확인
+- 상태 분류는 rssCollector.classify_status와 동일, 예산 초과 소스는 schedule / breaker 미반영
 """
 
 import uuid
-import feedparser
+from contextlib import nullcontext
 from datetime import datetime
 from typing import List, Dict
 
-VISUAL_SOURCES = [
-    {"name": "Behance / Branding",    "url": "https://www.behance.net/feeds/projects?field=branding",       "industry": "general"},
-    {"name": "Behance / UI UX",       "url": "https://www.behance.net/feeds/projects?field=ui%2Fux",        "industry": "general"},
-    {"name": "Behance / Web Design",  "url": "https://www.behance.net/feeds/projects?field=web+design",     "industry": "general"},
-    {"name": "Behance / Fashion",     "url": "https://www.behance.net/feeds/projects?field=fashion",        "industry": "fashion"},
-    {"name": "Behance / Typography",  "url": "https://www.behance.net/feeds/projects?field=typography",     "industry": "general"},
-    {"name": "Dribbble / Popular",    "url": "https://dribbble.com/shots/popular.rss",                      "industry": "general"},
-    {"name": "Dribbble / Branding",   "url": "https://dribbble.com/shots/popular/branding.rss",             "industry": "general"},
-    {"name": "Dribbble / Web Design", "url": "https://dribbble.com/shots/popular/web-design.rss",           "industry": "general"},
-    {"name": "Awwwards / Winners",    "url": "https://www.awwwards.com/awwwards/rss/",                      "industry": "general"},
-]
+from common.config.sourceCatalog import get_source_catalog
+from moduleA.collectors.circuitBreaker import (
+    get_circuit_breaker, PROBE_CONNECT_TIMEOUT, PROBE_READ_DEADLINE,
+)
+from moduleA.collectors.feedCache import get_validator_cache
+from moduleA.collectors.feedFetcher import fetch_all, BUDGET_EXCEEDED
+from moduleA.collectors.feedParser import FeedParsePool
+from moduleA.collectors.rssCollector import classify_status
+from moduleA.collectors.seenIndex import get_seen_index
+from moduleA.collectors.sourceSchedule import get_source_schedule
 
 MAX_PER_SOURCE = 10
 
 
-def collect_visual_trends(run_id: str) -> List[Dict]:
+def collect_visual_trends(
+    run_id: str,
+    only_new: bool = True,
+    respect_schedule: bool = True,
+    guard=None,
+) -> List[Dict]:
     """
+    only_new: True면 seenIndex 기준 새 entry만 반환
+    respect_schedule: True면 sourceSchedule 기준 due 소스만 폴링
+    guard: collectorRegistry.StagingGuard — 데드라인을 넘기면 상태 staging 없이 CollectorCancelled
+
     Returns: visual_trends 테이블 구조의 row 리스트 (embedding은 textEmbedder가 이후 처리)
     """
     rows = []
     now = datetime.utcnow().isoformat()
 
-    for source in VISUAL_SOURCES:
-        try:
-            feed = feedparser.parse(source["url"])
-            entries = feed.entries[:MAX_PER_SOURCE]
-
-            for entry in entries:
-                url = entry.get("link", "")
-                if not url:
-                    continue
-                rows.append({
-                    "id":           str(uuid.uuid4()),
-                    "run_id":       run_id,
-                    "source_name":  source["name"],
-                    "source_url":   url,
-                    "title":        entry.get("title", ""),
-                    "description":  entry.get("summary", "")[:500],
-                    "industry":     source["industry"],
-                    "tags":         ["visual", "design", "trend"],
-                    "embedding":    None,   # textEmbedder에서 채움
-                    "collected_at": now,
-                })
-
-            print(f"[VISUAL] {source['name']}: {len(entries)}개")
-
-        except Exception as e:
-            print(f"[VISUAL] {source['name']} 실패: {e}")
+    validators = get_validator_cache()
+    seen_index = get_seen_index() if only_new else None
+    schedule = get_source_schedule()
+    breaker = get_circuit_breaker()
+    catalog = get_source_catalog()
+
+    catalog_sources = catalog.sources("visual")
+    sources = schedule.filter_due(catalog_sources) if respect_schedule else list(catalog_sources)
+    if len(sources) < len(catalog_sources):
+        print(f"[VISUAL] {len(catalog_sources) - len(sources)}개 소스 폴링 주기 미도래 → 건너뜀")
+
+    # split의 open → half_open staging은 guard 밖: commit돼도 다음 실행의 split과 같은 결과
+    sources, probes, skipped = breaker.split(sources)
+    for source in skipped:
+        print(f"[VISUAL] {source.name}: circuit open → 건너뜀")
+
+    urls = catalog.plan(sources)
+    with FeedParsePool(max_entries=MAX_PER_SOURCE) as parser:
+        fetched = fetch_all(
+            urls,
+            planned=True,
+            request_headers={url: validators.headers_for(url) for url in urls},
+            on_result=parser.submit,
+            timeouts={url: (PROBE_CONNECT_TIMEOUT, PROBE_READ_DEADLINE) for url in probes},
+        )
+        parsed = parser.drain()
+
+    # 결과 반영(seen / validator / schedule / breaker staging)은 한 구간에서 — 데드라인 이후면 전부 건너뜀
+    with guard.staging() if guard is not None else nullcontext():
+        for source in sources:
+            result = fetched[source.url]
+            status, new_count = "blocked", 0
+
+            if result["error"]:
+                print(f"[VISUAL] {source.name} 실패: {result['error']}")
+            elif result["status"] == 304:
+                status = "not_modified"
+                print(f"[VISUAL] {source.name}: not_modified")
+            else:
+                try:
+                    feed = parsed.get(source.url)
+                    if isinstance(feed, Exception):
+                        raise feed
+                    if feed is None:
+                        raise ValueError("parse result missing")
+                    entries = feed["entries"]
+                    status = classify_status(feed, len(entries))
+                    validators.record(source.url, result["headers"])
+
+                    seen = 0
+                    if seen_index is not None:
+                        entries, seen = seen_index.partition(source.url, entries)
+                    new_count = len(entries)
+
+                    for entry in entries:
+                        url = entry.get("link", "")
+                        if not url:
+                            continue
+                        rows.append({
+                            "id":           str(uuid.uuid4()),
+                            "run_id":       run_id,
+                            "source_name":  source.name,
+                            "source_url":   url,
+                            "title":        entry.get("title", ""),
+                            "description":  entry.get("summary", "")[:500],
+                            "industry":     source.domain,
+                            "tags":         ["visual", "design", "trend"],
+                            "embedding":    None,   # textEmbedder에서 채움
+                            "collected_at": now,
+                        })
+
+                    print(f"[VISUAL] {source.name}: {status} {len(entries)}개 (seen {seen}개 제외)")
+
+                except Exception as e:
+                    status, new_count = "blocked", 0
+                    print(f"[VISUAL] {source.name} 실패: {e}")
+
+            if result["error"] == BUDGET_EXCEEDED:
+                continue        # 예산 부족은 소스 실패가 아님 → 다음 실행에서 재시도
+            schedule.observe(source.url, status, new_count, page_size=MAX_PER_SOURCE)
+            breaker.record(source.url, status)
 
     return rows
@@ -0,0 +1,117 @@
+"""
+embeddingStore.py
+
+Module A - Embedder
+- 로컬 content-addressed 임베딩 저장소 (SQLite, float32 blob)
+- 키: hashUtils.generate_embedding_hash(text, model) → 같은 텍스트면 레퍼런스가 달라도 벡터 재사용
+- 메모리에는 최근 사용 HOT_SET_SIZE개만 LRU로 유지, 나머지는 디스크 조회 (IN 쿼리 배치)
+- 실행 시작 시 전체 로드 / reference_chunks 테이블 스캔 없음
+- 같은 입력이면 결과가 같으므로 staging 없이 즉시 기록 (실패한 실행의 임베딩도 다음 실행에서 재사용)
+"""
+
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+STATE_DIR = os.path.join(BASE_DIR, "data", "state")
+EMBEDDING_STORE_PATH = os.path.join(STATE_DIR, "embeddings.db")
+
+HOT_SET_SIZE = 5000           # 1536차원 float32 기준 약 30MB
+
+
+class EmbeddingStore:
+    """
+    embedding_key → (model, dim, float32 vector)
+    """
+
+    _LOOKUP_BATCH = 500
+
+    def __init__(self, path: str = EMBEDDING_STORE_PATH, hot_set_size: int = HOT_SET_SIZE):
+        self.path = path
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS embeddings (
+                embedding_key TEXT PRIMARY KEY,
+                model         TEXT NOT NULL,
+                dim           INTEGER NOT NULL,
+                vector        BLOB NOT NULL
+            )
+        """)
+        self._conn.commit()
+        self._hot: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self.hot_set_size = hot_set_size
+        self._lock = threading.Lock()
+        self._counts = {"memory_hits": 0, "disk_hits": 0, "misses": 0}
+
+    def _remember(self, key: str, vector: np.ndarray) -> None:
+        self._hot[key] = vector
+        self._hot.move_to_end(key)
+        while len(self._hot) > self.hot_set_size:
+            self._hot.popitem(last=False)
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, np.ndarray]:
+        """있는 키만 반환 (읽기 전용 float32 벡터). 메모리 LRU → 디스크 순으로 조회"""
+        found: Dict[str, np.ndarray] = {}
+        with self._lock:
+            missing = []
+            for key in dict.fromkeys(keys):
+                vector = self._hot.get(key)
+                if vector is None:
+                    missing.append(key)
+                else:
+                    self._hot.move_to_end(key)
+                    found[key] = vector
+            self._counts["memory_hits"] += len(found)
+
+            for i in range(0, len(missing), self._LOOKUP_BATCH):
+                batch = missing[i:i + self._LOOKUP_BATCH]
+                rows = self._conn.execute(
+                    "SELECT embedding_key, vector FROM embeddings "
+                    f"WHERE embedding_key IN ({','.join('?' * len(batch))})",
+                    batch,
+                ).fetchall()
+                for key, blob in rows:
+                    vector = np.frombuffer(blob, dtype=np.float32)
+                    found[key] = vector
+                    self._remember(key, vector)
+                self._counts["disk_hits"] += len(rows)
+            self._counts["misses"] += len(missing) - sum(1 for key in missing if key in found)
+        return found
+
+    def put_many(self, vectors: Dict[str, Sequence[float]], model: str) -> None:
+        if not vectors:
+            return
+        rows = []
+        with self._lock:
+            for key, vector in vectors.items():
+                vector = np.asarray(vector, dtype=np.float32)
+                rows.append((key, model, len(vector), vector.tobytes()))
+                self._remember(key, vector)
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (embedding_key, model, dim, vector) VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            self._conn.commit()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            stored = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+            return {"stored": stored, "hot": len(self._hot), **self._counts}
+
+
+_store: Optional[EmbeddingStore] = None
+
+
+def get_embedding_store() -> EmbeddingStore:
+    global _store
+    if _store is None:
+        _store = EmbeddingStore()
+    return _store
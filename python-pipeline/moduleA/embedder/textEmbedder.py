@@ -6,63 +6,157 @@ Module A - Embedder
 - pgvector 스키마와 차원 일치
 - 해석 / 요약 / 분류 금지
 
-배치 처리로 API 호출 최소화 (최대 100개/배치)
+배치 처리로 API 호출 최소화 (최대 100개 · MAX_BATCH_TOKENS 토큰/배치)
+- 청크의 token_count(documentChunker)로 배치 크기를 맞춤, 없으면 글자 수로 추정
+- embed_batch: ChunkBatch에 직접 기록 — 응답 벡터는 float32 버퍼로 바로 복사 (청크 dict 복사 없음)
+- 로컬 임베딩 저장소 (embeddingStore, generate_embedding_hash(text, model) 키):
+  같은 텍스트는 레퍼런스 / 실행이 달라도 재임베딩 없이 저장된 벡터 사용
 """
 
-import hashlib
 import os
-from typing import List, Dict
+from typing import List, Dict, Optional, Sequence
 
 from openai import OpenAI
 
+from common.utils.hashUtils import generate_embedding_hash, hash_many, sha256_hash
+from moduleA.chunker.chunkBatch import ChunkBatch
+from moduleA.embedder.embeddingStore import EmbeddingStore, get_embedding_store
+
 client = OpenAI(api_key=os.environ["OPENAI_API_KEY"])
 
 MODEL = "text-embedding-3-small"
 BATCH_SIZE = 100
+MAX_BATCH_TOKENS = 16000
+CHARS_PER_TOKEN = 3        # token_count 없는 청크(chars 모드)의 보수적 추정
 
 
 def _text_hash(text: str) -> str:
-    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+    return sha256_hash(text)
 
 
-def embed_chunks(chunks: List[Dict], existing_hashes: set = None) -> List[Dict]:
-    """
-    청크 리스트에 embedding 필드 추가하여 반환.
-    existing_hashes: 이미 DB에 저장된 chunk_text 해시 집합 → 중복 API 호출 스킵.
+def _chunk_tokens(chunk: Dict) -> int:
+    return chunk.get("token_count") or len(chunk["chunk_text"]) // CHARS_PER_TOKEN + 1
 
-    chunks: [{ reference_id, chunk_index, chunk_text }, ...]
-    returns: [{ ..., embedding: List[float], chunk_hash: str }, ...]
-    """
-    if existing_hashes is None:
-        existing_hashes = set()
 
-    # 중복 스킵: 이미 임베딩된 청크는 embedding=None 으로 패스스루
-    to_embed, skipped = [], []
-    for chunk in chunks:
-        h = _text_hash(chunk["chunk_text"])
-        if h in existing_hashes:
-            skipped.append({**chunk, "embedding": None, "chunk_hash": h, "_skipped": True})
-        else:
-            to_embed.append({**chunk, "chunk_hash": h})
+def _pack_indices(tokens: Sequence[int]) -> List[List[int]]:
+    """순서 유지, 배치당 BATCH_SIZE개 · MAX_BATCH_TOKENS 토큰 이하 (단일 청크 초과분은 단독 배치)"""
+    batches, batch, total = [], [], 0
+    for i, n in enumerate(tokens):
+        if batch and (len(batch) >= BATCH_SIZE or total + n > MAX_BATCH_TOKENS):
+            batches.append(batch)
+            batch, total = [], 0
+        batch.append(i)
+        total += n
+    if batch:
+        batches.append(batch)
+    return batches
 
-    if skipped:
-        print(f"[EMBED] {len(skipped)} chunks skipped (already embedded)")
 
-    results = list(skipped)
+def _pack_batches(chunks: List[Dict]) -> List[List[Dict]]:
+    return [[chunks[i] for i in batch] for batch in _pack_indices([_chunk_tokens(c) for c in chunks])]
 
-    for i in range(0, len(to_embed), BATCH_SIZE):
-        batch = to_embed[i: i + BATCH_SIZE]
-        texts = [c["chunk_text"] for c in batch]
+
+def embed_batch(
+    batch: ChunkBatch,
+    existing_hashes: set = None,
+    store: Optional[EmbeddingStore] = None,
+) -> ChunkBatch:
+    """
+    ChunkBatch에 chunk_hash / skipped / 임베딩(float32 버퍼)을 in-place로 채우고 같은 배치 반환.
+    store: 로컬 임베딩 저장소 (기본 get_embedding_store()) → 저장된 벡터는 API 호출 없이 사용 (skipped=True)
+           새로 받은 벡터는 즉시 저장. 배치 안 같은 텍스트는 1회만 요청
+    existing_hashes: (하위 호환) 이 chunk_hash는 저장소에 없어도 API 호출 없이 skipped=True, 임베딩 없음
+    실패한 API 배치의 행은 임베딩 없음 (has_embedding=False)
+    """
+    store = store if store is not None else get_embedding_store()
+    existing_hashes = existing_hashes or set()
+
+    # chunk_hash는 DB에 저장되지 않지만 embed_chunks 반환값이고, 호출 측이 _text_hash(sha256)로 만든
+    # existing_hashes와 비교하므로 sha256 유지 (임베딩 재사용 키는 generate_embedding_hash)
+    batch.chunk_hash = hash_many(batch.chunk_text)
+    memo: Dict[str, str] = {}
+    keys = [
+        memo.get(text) or memo.setdefault(text, generate_embedding_hash(text, MODEL))
+        for text in batch.chunk_text
+    ]
+
+    cached = store.get_many(keys)
+    hits = [i for i, key in enumerate(keys) if key in cached]
+    batch.set_embeddings(hits, [cached[keys[i]] for i in hits])
+    skipped = batch.skipped
+    skipped[hits] = True
+
+    pending: Dict[str, List[int]] = {}      # embedding key → 같은 텍스트의 행들
+    for i, (key, h) in enumerate(zip(keys, batch.chunk_hash)):
+        if key in cached:
+            continue
+        if h in existing_hashes:
+            skipped[i] = True
+        else:
+            pending.setdefault(key, []).append(i)
+
+    if hits:
+        print(f"[EMBED] {len(hits)} chunks served from local embedding store")
+    if int(skipped.sum()) > len(hits):
+        print(f"[EMBED] {int(skipped.sum()) - len(hits)} chunks skipped (already embedded)")
+
+    to_embed = [rows[0] for rows in pending.values()]
+    tokens = [
+        batch.token_count[i] or len(batch.chunk_text[i]) // CHARS_PER_TOKEN + 1
+        for i in to_embed
+    ]
+    for n, packed in enumerate(_pack_indices(tokens)):
+        batch_keys = [keys[to_embed[j]] for j in packed]
+        texts = [batch.chunk_text[to_embed[j]] for j in packed]
 
         try:
             response = client.embeddings.create(model=MODEL, input=texts)
-            for chunk, data in zip(batch, response.data):
-                results.append({**chunk, "embedding": data.embedding})
-            print(f"[EMBED] batch {i // BATCH_SIZE + 1}: {len(batch)} chunks embedded")
+            vectors = [data.embedding for data in response.data]
+            store.put_many(dict(zip(batch_keys, vectors)), MODEL)
+            batch.set_embeddings(
+                [i for key in batch_keys for i in pending[key]],
+                [vector for key, vector in zip(batch_keys, vectors) for _ in pending[key]],
+            )
+            print(f"[EMBED] batch {n + 1}: {len(texts)} chunks embedded")
 
         except Exception as e:
-            print(f"[EMBED] batch {i // BATCH_SIZE + 1} failed: {e}")
-            for chunk in batch:
-                results.append({**chunk, "embedding": None})
+            print(f"[EMBED] batch {n + 1} failed: {e}")
 
-    return results
+    return batch
+
+
+def embed_chunks(
+    chunks: List[Dict],
+    existing_hashes: set = None,
+    store: Optional[EmbeddingStore] = None,
+) -> List[Dict]:
+    """
+    청크 리스트에 embedding 필드 추가하여 반환 (embed_batch의 dict 리스트 래퍼, 입력 순서 유지).
+    로컬 임베딩 저장소에 있는 텍스트는 저장된 벡터를 그대로 사용 (_skipped=True).
+    existing_hashes: (하위 호환) 이 chunk_hash는 API 호출 없이 embedding=None으로 패스스루.
+
+    chunks: [{ reference_id, chunk_index, chunk_text, token_count? }, ...]
+    returns: [{ ..., embedding: List[float] | None, chunk_hash: str, _skipped?: True }, ...]
+    """
+    return embed_batch(ChunkBatch.from_dicts(chunks), existing_hashes, store).to_dicts()
+
+
+def cache_hit_report(chunks, reference_ids: set = None) -> Dict:
+    """
+    embed_batch (ChunkBatch) / embed_chunks (dict 리스트) 결과의 캐시 적중 집계 (_skipped = 저장된 벡터 재사용)
+    reference_ids: 주어지면 해당 레퍼런스의 청크만 집계 (예: 재수집 문서)
+    """
+    if isinstance(chunks, ChunkBatch):
+        mask = chunks.skipped
+        if reference_ids is not None:
+            mask = mask[[ref in reference_ids for ref in chunks.reference_id]]
+        total, hits = len(mask), int(mask.sum())
+    else:
+        if reference_ids is not None:
+            chunks = [c for c in chunks if c.get("reference_id") in reference_ids]
+        total, hits = len(chunks), sum(1 for c in chunks if c.get("_skipped"))
+    return {
+        "chunks": total,
+        "hits": hits,
+        "hit_rate": round(hits / total, 3) if total else 0.0,
+    }
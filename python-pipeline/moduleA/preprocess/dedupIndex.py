@@ -0,0 +1,307 @@
+"""
+dedupIndex.py
+
+Module A - Preprocess responsibility:
+- 실행 간(cross-run) 중복 판단용 로컬 인덱스 (SQLite)
+- canonical URL(urlUtils) → text_hash / 텍스트 해시 → source_url / MinHash 서명 + LSH band
+- deduplicate_with_report(index=...)가 조회 후 새 항목만 staging → commit() 전까지 메모리에만 보관
+  (파이프라인 실패 시 미저장 항목이 중복으로 남는 것 방지)
+- 시작 시 전체 로드 없음 (SQLite 연결 + meta 확인만) → 조회는 배치 IN 쿼리
+- compact(): 오래 안 보인 항목 / 고아 band 행 삭제 + VACUUM
+- 의미 판단 없음
+"""
+
+import os
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from moduleA.preprocess.minhash import NUM_PERM, SEED, jaccard_estimate, optimal_bands
+
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+STATE_DIR = os.path.join(BASE_DIR, "data", "state")
+DEDUP_INDEX_PATH = os.path.join(STATE_DIR, "dedup_index.db")
+
+DEFAULT_THRESHOLD = 0.8
+COMPACT_MAX_AGE_DAYS = 180
+_LOOKUP_BATCH = 500  # SQLite 변수 개수 제한 대비
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS dedup_meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS dedup_urls (
+    url_key    TEXT PRIMARY KEY,
+    text_hash  TEXT,
+    source_url TEXT NOT NULL,
+    first_seen TEXT NOT NULL,
+    last_seen  TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS dedup_texts (
+    text_hash  TEXT PRIMARY KEY,
+    url_key    TEXT NOT NULL,
+    source_url TEXT NOT NULL,
+    last_seen  TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS dedup_signatures (
+    url_key    TEXT PRIMARY KEY,
+    source_url TEXT NOT NULL,
+    signature  BLOB NOT NULL,
+    last_seen  TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS dedup_bands (
+    band_key BLOB NOT NULL,
+    url_key  TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_dedup_bands_key ON dedup_bands (band_key);
+CREATE INDEX IF NOT EXISTS idx_dedup_bands_url ON dedup_bands (url_key);
+"""
+
+
+def _band_keys(signature: np.ndarray, bands: int, rows: int) -> List[bytes]:
+    # band 번호를 접두사로 붙여 단일 컬럼 인덱스로 조회
+    return [bytes([b]) + signature[b * rows:(b + 1) * rows].tobytes() for b in range(bands)]
+
+
+class DedupIndex:
+    """
+    index = get_dedup_index()
+    unique, dropped = deduplicate_with_report(items, index=index)
+    ... 파이프라인 성공 후 index.commit()
+    """
+
+    def __init__(
+        self,
+        path: str = DEDUP_INDEX_PATH,
+        threshold: float = DEFAULT_THRESHOLD,
+        num_perm: int = NUM_PERM,
+    ):
+        self.path = path
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands, self.rows = optimal_bands(threshold, num_perm)
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        self._check_signature_config()
+        self._conn.commit()
+
+        self._pending_urls: Dict[str, Tuple[Optional[str], str]] = {}
+        self._pending_texts: Dict[str, Tuple[str, str]] = {}
+        self._pending_sigs: Dict[str, Tuple[str, np.ndarray]] = {}
+        self._touched: set = set()
+        self._lock = threading.RLock()
+
+    # ── config ──────────────────────────────────────
+
+    def _meta(self) -> Dict[str, str]:
+        return dict(self._conn.execute("SELECT key, value FROM dedup_meta").fetchall())
+
+    def _set_meta(self, **values) -> None:
+        self._conn.executemany(
+            "INSERT INTO dedup_meta (key, value) VALUES (?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            [(k, str(v)) for k, v in values.items()],
+        )
+
+    def _check_signature_config(self) -> None:
+        """
+        서명 설정(num_perm / seed)이 바뀌면 기존 서명 폐기,
+        band 분할만 바뀌면 저장된 서명으로 band 행 재구성
+        """
+        meta = self._meta()
+        if meta.get("num_perm") not in (None, str(self.num_perm)) or meta.get("seed") not in (None, str(SEED)):
+            self._conn.execute("DELETE FROM dedup_signatures")
+            self._conn.execute("DELETE FROM dedup_bands")
+        elif meta.get("bands") not in (None, str(self.bands)) or meta.get("rows") not in (None, str(self.rows)):
+            self._conn.execute("DELETE FROM dedup_bands")
+            rows = self._conn.execute("SELECT url_key, signature FROM dedup_signatures").fetchall()
+            self._conn.executemany(
+                "INSERT INTO dedup_bands (band_key, url_key) VALUES (?, ?)",
+                [
+                    (band, url_key)
+                    for url_key, blob in rows
+                    for band in _band_keys(np.frombuffer(blob, dtype=np.uint64), self.bands, self.rows)
+                ],
+            )
+        self._set_meta(num_perm=self.num_perm, seed=SEED, bands=self.bands, rows=self.rows)
+
+    # ── lookup ──────────────────────────────────────
+
+    def _lookup(self, sql: str, keys: List) -> List[tuple]:
+        rows: List[tuple] = []
+        for i in range(0, len(keys), _LOOKUP_BATCH):
+            batch = keys[i: i + _LOOKUP_BATCH]
+            marks = ",".join("?" * len(batch))
+            rows.extend(self._conn.execute(sql.format(marks=marks), batch).fetchall())
+        return rows
+
+    def lookup_urls(self, url_keys: Iterable[str]) -> Dict[str, Tuple[Optional[str], str]]:
+        """url_key → (text_hash, source_url) — 이전 실행에서 저장된 항목만"""
+        keys = sorted({k for k in url_keys if k})
+        with self._lock:
+            rows = self._lookup(
+                "SELECT url_key, text_hash, source_url FROM dedup_urls WHERE url_key IN ({marks})", keys,
+            )
+        return {k: (h, src) for k, h, src in rows}
+
+    def lookup_texts(self, text_hashes: Iterable[str]) -> Dict[str, Tuple[str, str]]:
+        """text_hash → (url_key, source_url)"""
+        hashes = sorted({h for h in text_hashes if h})
+        with self._lock:
+            rows = self._lookup(
+                "SELECT text_hash, url_key, source_url FROM dedup_texts WHERE text_hash IN ({marks})", hashes,
+            )
+        return {h: (k, src) for h, k, src in rows}
+
+    def query_signature(
+        self,
+        signature: np.ndarray,
+        exclude_key: Optional[str] = None,
+        threshold: Optional[float] = None,
+    ) -> Optional[Tuple[str, str, float]]:
+        """
+        저장된 서명 중 threshold 이상 가장 유사한 (url_key, source_url, similarity). 없으면 None
+        exclude_key: 자기 자신(같은 URL의 이전 버전) 제외
+        threshold: 기본은 인덱스 생성 시 값 (band 분할 기준)
+        """
+        threshold = self.threshold if threshold is None else threshold
+        bands = _band_keys(signature, self.bands, self.rows)
+        with self._lock:
+            rows = self._lookup(
+                "SELECT s.url_key, s.source_url, s.signature FROM dedup_signatures s "
+                "WHERE s.url_key IN (SELECT url_key FROM dedup_bands WHERE band_key IN ({marks}))",
+                bands,
+            )
+
+        best: Optional[Tuple[str, str, float]] = None
+        for url_key, source_url, blob in rows:
+            if url_key == exclude_key:
+                continue
+            sim = jaccard_estimate(signature, np.frombuffer(blob, dtype=np.uint64))
+            if sim >= threshold and (best is None or sim > best[2]):
+                best = (url_key, source_url, sim)
+        return best
+
+    # ── staging ─────────────────────────────────────
+
+    def stage(
+        self,
+        url_key: str,
+        source_url: str,
+        text_hash: Optional[str],
+        signature: Optional[np.ndarray] = None,
+    ) -> None:
+        with self._lock:
+            if url_key:
+                self._pending_urls[url_key] = (text_hash, source_url)
+            if text_hash:
+                self._pending_texts[text_hash] = (url_key, source_url)
+            if url_key and signature is not None:
+                self._pending_sigs[url_key] = (source_url, signature)
+
+    def touch(self, url_key: str) -> None:
+        """이전 실행 항목이 다시 보임 → commit 시 last_seen 갱신 (compact 대상에서 제외)"""
+        if url_key:
+            with self._lock:
+                self._touched.add(url_key)
+
+    def commit(self) -> None:
+        with self._lock:
+            if not (self._pending_urls or self._pending_texts or self._pending_sigs or self._touched):
+                return
+            now = datetime.utcnow().isoformat()
+            self._conn.executemany(
+                """
+                INSERT INTO dedup_urls (url_key, text_hash, source_url, first_seen, last_seen)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(url_key) DO UPDATE SET
+                    text_hash  = excluded.text_hash,
+                    source_url = excluded.source_url,
+                    last_seen  = excluded.last_seen
+                """,
+                [(k, h, src, now, now) for k, (h, src) in self._pending_urls.items()],
+            )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO dedup_texts (text_hash, url_key, source_url, last_seen) VALUES (?, ?, ?, ?)",
+                [(h, k, src, now) for h, (k, src) in self._pending_texts.items()],
+            )
+            if self._pending_sigs:
+                keys = list(self._pending_sigs)
+                for i in range(0, len(keys), _LOOKUP_BATCH):
+                    batch = keys[i: i + _LOOKUP_BATCH]
+                    self._conn.execute(
+                        f"DELETE FROM dedup_bands WHERE url_key IN ({','.join('?' * len(batch))})", batch,
+                    )
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO dedup_signatures (url_key, source_url, signature, last_seen) VALUES (?, ?, ?, ?)",
+                    [(k, src, sig.tobytes(), now) for k, (src, sig) in self._pending_sigs.items()],
+                )
+                self._conn.executemany(
+                    "INSERT INTO dedup_bands (band_key, url_key) VALUES (?, ?)",
+                    [
+                        (band, k)
+                        for k, (_, sig) in self._pending_sigs.items()
+                        for band in _band_keys(sig, self.bands, self.rows)
+                    ],
+                )
+            for table in ("dedup_urls", "dedup_texts", "dedup_signatures"):
+                self._conn.executemany(
+                    f"UPDATE {table} SET last_seen = ? WHERE url_key = ?",
+                    [(now, k) for k in self._touched],
+                )
+            self._conn.commit()
+            self.rollback()
+
+    def rollback(self) -> None:
+        with self._lock:
+            self._pending_urls = {}
+            self._pending_texts = {}
+            self._pending_sigs = {}
+            self._touched = set()
+
+    # ── maintenance ─────────────────────────────────
+
+    def compact(self, max_age_days: int = COMPACT_MAX_AGE_DAYS) -> Dict[str, int]:
+        """
+        max_age_days 동안 다시 보이지 않은 항목 삭제 + 고아 band 행 정리 + VACUUM
+        Returns: 테이블별 삭제 행 수
+        """
+        cutoff = (datetime.utcnow() - timedelta(days=max_age_days)).isoformat()
+        removed: Dict[str, int] = {}
+        with self._lock:
+            for table in ("dedup_urls", "dedup_texts", "dedup_signatures"):
+                removed[table] = self._conn.execute(
+                    f"DELETE FROM {table} WHERE last_seen < ?", (cutoff,),
+                ).rowcount
+            removed["dedup_bands"] = self._conn.execute(
+                "DELETE FROM dedup_bands WHERE url_key NOT IN (SELECT url_key FROM dedup_signatures)"
+            ).rowcount
+            self._set_meta(last_compacted=datetime.utcnow().isoformat())
+            self._conn.commit()
+            self._conn.execute("VACUUM")
+        return removed
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                table: self._conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                for table in ("dedup_urls", "dedup_texts", "dedup_signatures", "dedup_bands")
+            }
+
+
+_index: Optional[DedupIndex] = None
+
+
+def get_dedup_index() -> DedupIndex:
+    global _index
+    if _index is None:
+        _index = DedupIndex()
+    return _index
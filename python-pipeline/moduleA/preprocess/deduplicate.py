@@ -4,14 +4,29 @@ deduplicate.py
 Module A - Preprocess responsibility:
 - 수집된 레퍼런스 중 중복 제거
 - URL / 텍스트 해시 기반 deduplication
+- 근접 중복(선택): MinHash-LSH로 Jaccard ≥ threshold 항목을 먼저 나온 항목(canonical)에 병합
+  (바이라인 / 추적 파라미터만 다른 신디케이션 기사)
+- URL은 canonical URL(utm_* / 끝 슬래시 / www. 차이 제거)로 비교
+- 실행 간 중복(선택): dedupIndex를 조회하고 남은 항목을 staging
+  (같은 URL이라도 텍스트가 바뀌었으면 갱신으로 보고 통과)
 - 의미 판단, 요약, 분류 금지
 
 Output:
 - 중복 제거된 reference list
+- deduplicate_with_report: + 제거된 항목별 canonical / 사유 리포트
 """
 
-import hashlib
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
+
+from common.utils.hashUtils import build_content_text, item_content_hash, sha256_hash
+from common.utils.urlUtils import canonicalize_url
+from moduleA.preprocess.dedupIndex import DedupIndex
+from moduleA.preprocess.minhash import (
+    LSHIndex, MinHasher, NUM_PERM, shingle_hashes, tokenize,
+)
+
+NEAR_DUP_THRESHOLD = 0.8
+MIN_NEAR_DUP_TOKENS = 8   # 이보다 짧은 텍스트(제목만 등)는 근접 중복 판단 제외 — 정확 일치만
 
 
 # =========================
@@ -19,48 +34,153 @@ from typing import List, Dict
 # =========================
 
 def _hash_text(text: str) -> str:
-    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+    return sha256_hash(text)
 
 
 def _build_text(item: Dict) -> str:
-    parts = [
-        item.get("title", ""),
-        item.get("summary", ""),
-        item.get("content", "")
-    ]
-    return " ".join([p.strip() for p in parts if p]).strip()
+    return build_content_text(item)
+
+
+def _item_url(item: Dict) -> str:
+    # 수집기별 필드명 차이 (crawler: url / rssCollector: source_url)
+    return (item.get("url") or item.get("source_url") or "").strip()
+
+
+def _drop(
+    item: Dict,
+    canonical: Dict,
+    reason: str,
+    similarity: float = 1.0,
+    previous_run: bool = False,
+) -> Dict:
+    return {
+        "item_id": item.get("id"),
+        "source_url": _item_url(item),
+        "canonical_id": canonical.get("id"),
+        "canonical_url": _item_url(canonical),
+        "reason": reason,              # url / text_hash / near_duplicate
+        "similarity": round(similarity, 3),
+        "previous_run": previous_run,  # True면 canonical은 이전 실행에서 저장된 항목
+    }
 
 
 # =========================
 # Core
 # =========================
 
-def deduplicate(items: List[Dict]) -> List[Dict]:
+def deduplicate_with_report(
+    items: List[Dict],
+    near_duplicates: bool = True,
+    threshold: float = NEAR_DUP_THRESHOLD,
+    num_perm: int = NUM_PERM,
+    index: Optional[DedupIndex] = None,
+) -> Tuple[List[Dict], List[Dict]]:
     """
-    중복 제거된 reference 리스트 반환
+    index: 주어지면 이전 실행 항목과도 비교하고, 남은 항목을 index에 staging (commit은 호출 측)
+
+    Returns:
+        unique_items: 중복 제거된 reference 리스트 (입력 순서 유지, 먼저 나온 항목이 canonical)
+        dropped:      제거된 항목별 { item_id, source_url, canonical_id, canonical_url,
+                                     reason, similarity, previous_run }
     """
-    seen_urls = set()
-    seen_text_hashes = set()
+    if index is not None and index.num_perm != num_perm:
+        raise ValueError(f"num_perm mismatch: index {index.num_perm} != {num_perm}")
+
+    prepared = []
+    for item in items:
+        # text_hash는 item 메모 재사용 (본문이 바뀌지 않았으면 재계산 없음)
+        prepared.append((item, canonicalize_url(_item_url(item)), _build_text(item), item_content_hash(item)))
+
+    stored_urls: Dict[str, Tuple[Optional[str], str]] = {}
+    stored_texts: Dict[str, Tuple[str, str]] = {}
+    if index is not None:
+        stored_urls = index.lookup_urls(key for _, key, _, _ in prepared)
+        stored_texts = index.lookup_texts(h for _, _, _, h in prepared)
+
+    by_url: Dict[str, Dict] = {}
+    by_text_hash: Dict[str, Dict] = {}
+    hasher: Optional[MinHasher] = MinHasher(num_perm) if near_duplicates else None
+    lsh: Optional[LSHIndex] = LSHIndex(threshold, num_perm) if near_duplicates else None
 
     unique_items: List[Dict] = []
+    dropped: List[Dict] = []
 
-    for item in items:
-        url = item.get("url", "").strip()
+    for item, url_key, text, text_hash in prepared:
 
-        # 1️⃣ URL 기준 중복 제거
-        if url:
-            if url in seen_urls:
+        def _fold(canonical: Dict, reason: str, similarity: float = 1.0, previous_run: bool = False):
+            dropped.append(_drop(item, canonical, reason, similarity, previous_run))
+            if url_key and url_key not in by_url:
+                by_url[url_key] = canonical
+
+        # 1️⃣ URL 기준 중복 제거 (이전 실행은 텍스트까지 같을 때만)
+        if url_key:
+            if url_key in by_url:
+                _fold(by_url[url_key], "url")
+                continue
+            if url_key in stored_urls and stored_urls[url_key][0] == text_hash:
+                index.touch(url_key)
+                _fold({"source_url": stored_urls[url_key][1]}, "url", previous_run=True)
                 continue
-            seen_urls.add(url)
 
         # 2️⃣ 텍스트 해시 기준 중복 제거
-        text = _build_text(item)
-        if text:
-            text_hash = _hash_text(text)
-            if text_hash in seen_text_hashes:
+        if text_hash:
+            if text_hash in by_text_hash:
+                _fold(by_text_hash[text_hash], "text_hash")
+                continue
+            if text_hash in stored_texts:
+                prev_key, prev_url = stored_texts[text_hash]
+                index.touch(prev_key)
+                _fold({"source_url": prev_url}, "text_hash", previous_run=True)
                 continue
-            seen_text_hashes.add(text_hash)
 
+        # 3️⃣ MinHash-LSH 근접 중복
+        signature = None
+        if lsh is not None:
+            tokens = tokenize(text)
+            if len(tokens) >= MIN_NEAR_DUP_TOKENS:
+                signature = hasher.signature(shingle_hashes(tokens))
+            if signature is not None:
+                match = lsh.query(signature)
+                if match is not None:
+                    _fold(unique_items[match[0]], "near_duplicate", match[1])
+                    continue
+                if index is not None:
+                    prev = index.query_signature(signature, exclude_key=url_key, threshold=threshold)
+                    if prev is not None:
+                        index.touch(prev[0])
+                        _fold({"source_url": prev[1]}, "near_duplicate", prev[2], previous_run=True)
+                        continue
+
+        if url_key:
+            by_url[url_key] = item
+        if text_hash:
+            by_text_hash[text_hash] = item
+        if signature is not None:
+            lsh.insert(len(unique_items), signature)
+        if index is not None:
+            index.stage(url_key, _item_url(item), text_hash, signature)
         unique_items.append(item)
 
+    return unique_items, dropped
+
+
+def recrawled_ids(items: List[Dict], index: DedupIndex) -> set:
+    """
+    같은 canonical URL이 이전 실행에 저장돼 있던 item id 집합
+    (dedup 통과 후 호출 → 내용이 바뀌어 다시 처리되는 재수집 문서)
+    """
+    keys = {item.get("id"): canonicalize_url(_item_url(item)) for item in items}
+    stored = index.lookup_urls(keys.values())
+    return {item_id for item_id, key in keys.items() if key in stored}
+
+
+def deduplicate(
+    items: List[Dict],
+    near_duplicates: bool = False,
+    threshold: float = NEAR_DUP_THRESHOLD,
+) -> List[Dict]:
+    """
+    중복 제거된 reference 리스트 반환
+    """
+    unique_items, _ = deduplicate_with_report(items, near_duplicates=near_duplicates, threshold=threshold)
     return unique_items
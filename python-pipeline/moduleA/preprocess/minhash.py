@@ -0,0 +1,147 @@
+"""
+minhash.py
+
+Module A - Preprocess responsibility:
+- 근접 중복(near-duplicate) 탐지용 MinHash 서명 + LSH band 인덱스
+- 텍스트 → 단어 k-shingle → 32bit 해시 → num_perm개 MinHash 서명
+- LSH: 서명을 (bands × rows)로 나눠 band별 버킷에 등록
+  → 같은 버킷을 공유하는 항목만 후보로 비교 (전체 쌍 비교 없이 기대 O(n))
+- (bands, rows)는 Jaccard threshold 기준 false positive / negative 가중 오차가 최소가 되도록 선택
+- 의미 판단 없음. 표면 텍스트 유사도만.
+"""
+
+import re
+import zlib
+from functools import lru_cache
+from typing import Dict, Hashable, List, Optional, Tuple
+
+import numpy as np
+
+
+NUM_PERM = 128
+SHINGLE_SIZE = 3          # 단어 단위 shingle 길이
+SEED = 1
+
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+_RE_TOKEN = re.compile(r"\w+")
+
+# numpy 2.x: trapz → trapezoid
+_trapezoid = getattr(np, "trapezoid", None) or np.trapz
+
+
+# =========================
+# Shingles / Signature
+# =========================
+
+def tokenize(text: str) -> List[str]:
+    return _RE_TOKEN.findall((text or "").lower())
+
+
+def shingle_hashes(tokens: List[str], k: int = SHINGLE_SIZE) -> np.ndarray:
+    """
+    단어 k-shingle 집합의 32bit 해시 (중복 제거). 토큰이 k개 미만이면 전체를 1개 shingle로
+    """
+    if not tokens:
+        return np.empty(0, dtype=np.uint64)
+    if len(tokens) < k:
+        grams = {" ".join(tokens)}
+    else:
+        grams = {" ".join(tokens[i:i + k]) for i in range(len(tokens) - k + 1)}
+    return np.fromiter(
+        (zlib.crc32(g.encode("utf-8")) for g in grams),
+        dtype=np.uint64,
+        count=len(grams),
+    )
+
+
+class MinHasher:
+    """
+    universal hashing h(x) = (a·x + b) mod p, p = 2^61 - 1
+    (x < 2^32, a < 2^32 이므로 uint64 곱셈 overflow 없음)
+    """
+
+    def __init__(self, num_perm: int = NUM_PERM, seed: int = SEED):
+        rng = np.random.RandomState(seed)
+        self.num_perm = num_perm
+        self._a = rng.randint(1, 1 << 32, size=num_perm, dtype=np.uint64)[:, None]
+        self._b = rng.randint(0, 1 << 32, size=num_perm, dtype=np.uint64)[:, None]
+
+    def signature(self, hashes: np.ndarray) -> Optional[np.ndarray]:
+        """shingle 해시 → MinHash 서명 (num_perm,). shingle이 없으면 None"""
+        if hashes.size == 0:
+            return None
+        permuted = (self._a * hashes[None, :] + self._b) % _MERSENNE_PRIME
+        return (permuted & _MAX_HASH).min(axis=1)
+
+
+def jaccard_estimate(sig_a: np.ndarray, sig_b: np.ndarray) -> float:
+    return float(np.mean(sig_a == sig_b))
+
+
+# =========================
+# LSH
+# =========================
+
+def _candidate_probability(s: np.ndarray, bands: int, rows: int) -> np.ndarray:
+    """Jaccard s인 두 항목이 최소 1개 band 버킷을 공유할 확률"""
+    return 1.0 - (1.0 - s ** rows) ** bands
+
+
+@lru_cache(maxsize=None)
+def optimal_bands(
+    threshold: float,
+    num_perm: int,
+    fp_weight: float = 0.5,
+    fn_weight: float = 0.5,
+) -> Tuple[int, int]:
+    """
+    bands × rows ≤ num_perm 중 가중 오차 (threshold 미만 후보 확률 + 이상 비후보 확률) 최소 조합
+    """
+    below = np.linspace(0.0, threshold, 200)
+    above = np.linspace(threshold, 1.0, 200)
+    best, best_error = (1, num_perm), float("inf")
+    for bands in range(1, num_perm + 1):
+        rows = num_perm // bands
+        fp = _trapezoid(_candidate_probability(below, bands, rows), below)
+        fn = _trapezoid(1.0 - _candidate_probability(above, bands, rows), above)
+        error = fp_weight * fp + fn_weight * fn
+        if error < best_error:
+            best, best_error = (bands, rows), error
+    return best
+
+
+class LSHIndex:
+    """
+    band 버킷 인덱스. 키는 호출 측 식별자 (예: item index)
+    """
+
+    def __init__(self, threshold: float, num_perm: int = NUM_PERM):
+        self.threshold = threshold
+        self.bands, self.rows = optimal_bands(threshold, num_perm)
+        self._buckets: List[Dict[bytes, List[Hashable]]] = [{} for _ in range(self.bands)]
+        self._signatures: Dict[Hashable, np.ndarray] = {}
+
+    def _band_keys(self, signature: np.ndarray) -> List[bytes]:
+        r = self.rows
+        return [signature[i * r:(i + 1) * r].tobytes() for i in range(self.bands)]
+
+    def insert(self, key: Hashable, signature: np.ndarray) -> None:
+        self._signatures[key] = signature
+        for bucket, band in zip(self._buckets, self._band_keys(signature)):
+            bucket.setdefault(band, []).append(key)
+
+    def query(self, signature: np.ndarray) -> Optional[Tuple[Hashable, float]]:
+        """
+        threshold 이상인 후보 중 추정 Jaccard가 가장 높은 (key, similarity). 없으면 None
+        """
+        candidates = set()
+        for bucket, band in zip(self._buckets, self._band_keys(signature)):
+            candidates.update(bucket.get(band, ()))
+
+        best: Optional[Tuple[Hashable, float]] = None
+        for key in candidates:
+            sim = jaccard_estimate(signature, self._signatures[key])
+            if sim >= self.threshold and (best is None or sim > best[1]):
+                best = (key, sim)
+        return best
@@ -1,9 +1,16 @@
 # python-pipeline/preprocess.py
+#
+# raw 파일 → 정규화 item → JSONL (스트리밍)
+# - 입력: data/raw/{news,pinterest,instagram}/*.json (배열 / 단일 값) · *.jsonl (줄당 1 item)
+# - 파일 전체를 메모리에 올리지 않음: 배열은 raw_decode로 원소 단위 디코딩, JSONL은 줄 단위
+# - 출력은 item마다 바로 기록 → 메모리 사용량은 코퍼스 크기와 무관 (버퍼 = 원소 1개 + 읽기 청크)
 
 import os
 import json
+import time
 import uuid
 from datetime import datetime
+from typing import Dict, IO, Iterator, Optional, Tuple
 
 # 🔥 핵심: 이 파일 기준으로 프로젝트 루트 계산
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -11,17 +18,116 @@ BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 RAW_DIR = os.path.join(BASE_DIR, "data", "raw")
 OUTPUT_DIR = os.path.join(BASE_DIR, "outputs", "preprocessed")
 
-os.makedirs(OUTPUT_DIR, exist_ok=True)
-
+SOURCES = ["news", "pinterest", "instagram"]
+READ_CHUNK = 1 << 16          # 스트림 디코딩 읽기 단위 (64KB)
+PROGRESS_EVERY = 10000        # N item마다 진행 상황 출력
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = " \t\r\n"
+
+
+# =========================
+# Streaming Readers
+# =========================
+
+def iter_json_values(f: IO[str], chunk_size: int = READ_CHUNK) -> Iterator:
+    """
+    JSON 파일 스트리밍 디코딩
+    - 최상위가 배열이면 원소를 하나씩 yield
+    - 아니면 최상위 값(들)을 차례로 yield (단일 객체 / 공백 구분 나열)
+    버퍼에는 디코딩 중인 원소 1개 + 읽기 청크만 유지
+    """
+    buf, pos, eof = "", 0, False
+    in_array: Optional[bool] = None
+
+    def fill(size: int) -> None:
+        nonlocal buf, pos, eof
+        chunk = f.read(size)
+        eof = not chunk
+        buf, pos = buf[pos:] + chunk, 0
+
+    while True:
+        # 공백 / 배열 구분자 건너뛰기
+        while True:
+            while pos < len(buf) and (buf[pos] in _WHITESPACE or (in_array and buf[pos] == ",")):
+                pos += 1
+            if pos < len(buf) or eof:
+                break
+            fill(chunk_size)
+
+        if pos >= len(buf):
+            return
+        if in_array is None:
+            in_array = buf[pos] == "["
+            if in_array:
+                pos += 1
+                continue
+        if in_array and buf[pos] == "]":
+            in_array = False
+            pos += 1
+            continue
 
-def load_json_files(path):
-    files = []
-    for file in os.listdir(path):
-        if file.endswith(".json"):
-            with open(os.path.join(path, file), "r", encoding="utf-8") as f:
-                files.append(json.load(f))
-    return files
+        # 원소 디코딩. 버퍼 끝에서 끝난 값은 잘린 숫자일 수 있으므로 더 읽고 재시도
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(buf, pos)
+                if end < len(buf) or eof:
+                    break
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+            fill(max(chunk_size, len(buf) - pos))    # 큰 원소는 읽기 단위를 키워 재파싱 횟수 제한
+        pos = end
+        yield value
+
+
+def iter_jsonl(f: IO[str], stats: Dict) -> Iterator:
+    """JSONL: 줄 단위 디코딩. 깨진 줄은 건너뛰고 stats["errors"] 증가"""
+    for line_no, line in enumerate(f, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError as e:
+            stats["errors"] += 1
+            print(f"[PREPROCESS] JSONL 파싱 실패 {getattr(f, 'name', '')}:{line_no} — {e}")
+
+
+def iter_raw_items(raw_dir: str, stats: Dict) -> Iterator[Tuple[str, Dict]]:
+    """
+    raw_dir/{source}/ 아래 파일을 정렬 순서대로 스트리밍 → (source, raw item)
+    """
+    for source in SOURCES:
+        source_path = os.path.join(raw_dir, source)
+        if not os.path.exists(source_path):
+            print(f"[PREPROCESS] Skip: {source_path} not found")
+            continue
 
+        for file in sorted(os.listdir(source_path)):
+            if not file.endswith((".json", ".jsonl")):
+                continue
+            path = os.path.join(source_path, file)
+            stats["files"] += 1
+            stats["bytes"] += os.path.getsize(path)
+
+            with open(path, "r", encoding="utf-8") as f:
+                if file.endswith(".jsonl"):
+                    values = iter_jsonl(f, stats)
+                else:
+                    # 🔥 여기 중요: crawler는 "파일 안에 리스트"를 저장함 → 원소 단위로 스트리밍
+                    values = iter_json_values(f)
+                try:
+                    for item in values:
+                        yield source, item
+                except json.JSONDecodeError as e:
+                    stats["errors"] += 1
+                    print(f"[PREPROCESS] JSON 파싱 실패, 파일 나머지 건너뜀: {path} — {e}")
+
+
+# =========================
+# Normalize
+# =========================
 
 def normalize_item(item, source):
     return {
@@ -43,31 +149,63 @@ def normalize_item(item, source):
     }
 
 
-def run_preprocess():
-    all_results = []
-
-    for source in ["news", "pinterest", "instagram"]:
-        source_path = os.path.join(RAW_DIR, source)
-        if not os.path.exists(source_path):
-            print(f"[PREPROCESS] Skip: {source_path} not found")
+def iter_preprocessed(raw_dir: str, stats: Dict) -> Iterator[Dict]:
+    """raw item 스트림 → 정규화 item 스트림. dict가 아닌 원소는 skipped로 집계"""
+    for source, item in iter_raw_items(raw_dir, stats):
+        if not isinstance(item, dict):
+            stats["skipped"] += 1
             continue
-
-        raw_files = load_json_files(source_path)
-        for file_data in raw_files:
-            # 🔥 여기 중요: crawler는 "파일 안에 리스트"를 저장함
-            for item in file_data:
-                normalized = normalize_item(item, source)
-                all_results.append(normalized)
-
+        yield normalize_item(item, source)
+
+
+# =========================
+# Entry
+# =========================
+
+def run_preprocess(
+    raw_dir: str = RAW_DIR,
+    output_dir: str = OUTPUT_DIR,
+    progress_every: int = PROGRESS_EVERY,
+) -> Dict:
+    """
+    스트리밍 전처리 → output_dir/preprocessed_{date}.jsonl
+    완료 전에는 .part 파일에 기록 후 교체 (중간 실패 시 이전 결과 유지)
+    반환: files / items / skipped / errors / bytes / elapsed_s / items_per_sec / output
+    """
+    os.makedirs(output_dir, exist_ok=True)
     output_path = os.path.join(
-        OUTPUT_DIR,
-        f"preprocessed_{datetime.utcnow().date().isoformat()}.json"
+        output_dir,
+        f"preprocessed_{datetime.utcnow().date().isoformat()}.jsonl"
     )
-
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(all_results, f, ensure_ascii=False, indent=2)
-
-    print(f"[PREPROCESS] {len(all_results)} items processed → {output_path}")
+    part_path = output_path + ".part"
+
+    stats = {"files": 0, "items": 0, "skipped": 0, "errors": 0, "bytes": 0}
+    started = time.perf_counter()
+
+    with open(part_path, "w", encoding="utf-8") as out:
+        for normalized in iter_preprocessed(raw_dir, stats):
+            out.write(json.dumps(normalized, ensure_ascii=False))
+            out.write("\n")
+            stats["items"] += 1
+            if progress_every and stats["items"] % progress_every == 0:
+                elapsed = time.perf_counter() - started
+                print(
+                    f"[PREPROCESS] {stats['items']} items / {stats['files']} files "
+                    f"({stats['items'] / elapsed:.0f} items/s)"
+                )
+    os.replace(part_path, output_path)
+
+    elapsed = time.perf_counter() - started
+    stats["elapsed_s"] = round(elapsed, 3)
+    stats["items_per_sec"] = round(stats["items"] / elapsed, 1) if elapsed > 0 else 0.0
+    stats["output"] = output_path
+
+    print(
+        f"[PREPROCESS] {stats['items']} items processed → {output_path} "
+        f"({stats['files']} files, {stats['skipped']} skipped, {stats['errors']} errors, "
+        f"{stats['items_per_sec']} items/s)"
+    )
+    return stats
 
 
 if __name__ == "__main__":
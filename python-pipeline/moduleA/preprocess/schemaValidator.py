@@ -6,6 +6,11 @@ Module A - Preprocess responsibility:
 - 데이터 의미 해석, 보정, 추론 금지
 - validation 실패 시 명확한 에러 반환
 
+검증 방식:
+- SchemaRegistry: schema/*.schema.json 을 이름별로 1회 로드 + check_schema + validator 컴파일 후 재사용
+- validate_batch: 배치 단위 검증, 예외 없이 item별 에러를 전부 수집 (iter_errors)
+- fast=True: required 필드 존재 + 최상위 property type만 확인 (컴파일된 schema에서 추출)
+
 Used before:
 - deduplicate
 - preprocess
@@ -13,9 +18,11 @@ Used before:
 
 import json
 import os
-from typing import Dict, List
+import threading
+from typing import Dict, List, Optional, Tuple
 
-from jsonschema import validate, ValidationError
+from jsonschema import validate
+from jsonschema.validators import validator_for
 
 
 # =========================
@@ -24,6 +31,20 @@ from jsonschema import validate, ValidationError
 
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 SCHEMA_DIR = os.path.join(BASE_DIR, "schema")
+SCHEMA_SUFFIX = ".schema.json"
+
+RAW_SCHEMA = "raw.schema.json"      # 수집기 출력 item (rssCollector)
+
+# JSON schema type → Python 타입 (bool은 number/integer에서 별도 제외)
+_JSON_TYPES = {
+    "string": (str,),
+    "number": (int, float),
+    "integer": (int,),
+    "boolean": (bool,),
+    "array": (list, tuple),
+    "object": (dict,),
+    "null": (type(None),),
+}
 
 
 # =========================
@@ -40,6 +61,110 @@ def load_schema(schema_name: str) -> Dict:
         return json.load(f)
 
 
+def _matches_type(value, json_types: List[str]) -> bool:
+    for t in json_types:
+        if t in ("number", "integer") and isinstance(value, bool):
+            continue
+        if isinstance(value, _JSON_TYPES.get(t, ())):
+            return True
+    return False
+
+
+def _fast_rules(schema: Dict) -> Tuple[List[str], Dict[str, List[str]]]:
+    """schema → (required 필드, 최상위 property별 허용 type 목록)"""
+    types: Dict[str, List[str]] = {}
+    for name, spec in (schema.get("properties") or {}).items():
+        t = spec.get("type") if isinstance(spec, dict) else None
+        if t:
+            types[name] = [t] if isinstance(t, str) else list(t)
+    return list(schema.get("required") or []), types
+
+
+class SchemaRegistry:
+    """
+    schema 이름 → 컴파일된 validator 캐시
+    파일 읽기 / check_schema / validator 생성은 schema당 1회
+    """
+
+    def __init__(self, schema_dir: str = SCHEMA_DIR):
+        self.schema_dir = schema_dir
+        self._lock = threading.Lock()
+        self._validators: Dict[str, object] = {}
+        self._fast: Dict[str, Tuple[List[str], Dict[str, List[str]]]] = {}
+
+    def names(self) -> List[str]:
+        return sorted(f for f in os.listdir(self.schema_dir) if f.endswith(SCHEMA_SUFFIX))
+
+    def _compile(self, schema_name: str) -> None:
+        schema_path = os.path.join(self.schema_dir, schema_name)
+        if not os.path.exists(schema_path):
+            raise FileNotFoundError(f"Schema not found: {schema_name}")
+        with open(schema_path, "r", encoding="utf-8") as f:
+            schema = json.load(f)
+
+        cls = validator_for(schema)
+        cls.check_schema(schema)
+        self._validators[schema_name] = cls(schema)
+        self._fast[schema_name] = _fast_rules(schema)
+
+    def validator(self, schema_name: str):
+        if schema_name not in self._validators:
+            with self._lock:
+                if schema_name not in self._validators:
+                    self._compile(schema_name)
+        return self._validators[schema_name]
+
+    def errors(self, item: Dict, schema_name: str) -> List[Dict]:
+        """전체 schema 검증. 에러 전부 반환 (없으면 [])"""
+        found = self.validator(schema_name).iter_errors(item)
+        return [
+            {"path": "/".join(str(p) for p in e.absolute_path), "message": e.message}
+            for e in sorted(found, key=lambda e: list(map(str, e.absolute_path)))
+        ]
+
+    def fast_errors(self, item: Dict, schema_name: str) -> List[Dict]:
+        """required 필드 존재 + 최상위 type만 확인"""
+        self.validator(schema_name)
+        required, types = self._fast[schema_name]
+        if not isinstance(item, dict):
+            return [{"path": "", "message": f"{item!r} is not of type 'object'"}]
+
+        errors = [
+            {"path": "", "message": f"{field!r} is a required property"}
+            for field in required if field not in item
+        ]
+        for field, allowed in types.items():
+            if field in item and not _matches_type(item[field], allowed):
+                expected = allowed[0] if len(allowed) == 1 else allowed
+                errors.append({"path": field, "message": f"{item[field]!r} is not of type {expected!r}"})
+        return errors
+
+    def validate_batch(
+        self,
+        items: List[Dict],
+        schema_name: str,
+        fast: bool = False,
+    ) -> Tuple[List[Dict], List[Dict]]:
+        """
+        배치 validation (예외 없음)
+        반환: (통과 item 목록, 실패 목록 [{index, id, errors: [{path, message}]}])
+        """
+        check = self.fast_errors if fast else self.errors
+        valid: List[Dict] = []
+        failed: List[Dict] = []
+        for idx, item in enumerate(items):
+            errors = check(item, schema_name)
+            if errors:
+                failed.append({
+                    "index": idx,
+                    "id": item.get("id") if isinstance(item, dict) else None,
+                    "errors": errors,
+                })
+            else:
+                valid.append(item)
+        return valid, failed
+
+
 def validate_item(item: Dict, schema: Dict) -> None:
     """
     단일 item validation
@@ -48,6 +173,15 @@ def validate_item(item: Dict, schema: Dict) -> None:
     validate(instance=item, schema=schema)
 
 
+def validate_batch(
+    items: List[Dict],
+    schema_name: str,
+    fast: bool = False,
+) -> Tuple[List[Dict], List[Dict]]:
+    """get_schema_registry().validate_batch 단축"""
+    return get_schema_registry().validate_batch(items, schema_name, fast=fast)
+
+
 def validate_items(
     items: List[Dict],
     schema_name: str
@@ -57,22 +191,23 @@ def validate_items(
     - 통과한 item만 반환
     - 실패 item은 명시적으로 제외
     """
-    schema = load_schema(schema_name)
-
-    valid_items: List[Dict] = []
-    errors: List[Dict] = []
-
-    for idx, item in enumerate(items):
-        try:
-            validate_item(item, schema)
-            valid_items.append(item)
-        except ValidationError as e:
-            errors.append({
-                "index": idx,
-                "error": e.message
-            })
+    valid_items, errors = validate_batch(items, schema_name)
 
     if errors:
         print(f"[SCHEMA] {len(errors)} items failed validation")
 
     return valid_items
+
+
+# =========================
+# Singleton
+# =========================
+
+_registry: Optional[SchemaRegistry] = None
+
+
+def get_schema_registry() -> SchemaRegistry:
+    global _registry
+    if _registry is None:
+        _registry = SchemaRegistry()
+    return _registry
@@ -15,7 +15,7 @@ import os
 import json
 import uuid
 from datetime import datetime
-from typing import List, Dict
+from typing import Dict, Iterator, List
 
 import numpy as np
 from tqdm import tqdm
@@ -59,6 +59,21 @@ def build_text(item: Dict) -> str:
     return " ".join([p for p in parts if p]).strip()
 
 
+def iter_preprocessed_file(path: str) -> Iterator[Dict]:
+    """
+    preprocess 출력 읽기
+    - .jsonl: 줄 단위 스트리밍
+    - .json: 이전 형식 (배열 전체 로드)
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        if not path.endswith(".jsonl"):
+            yield from json.load(f)
+            return
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
 # =========================
 # Core
 # =========================
@@ -67,18 +82,15 @@ def run_text_embedding():
     print("[EMBED] loading preprocessed text data...")
 
     files = sorted(
-        [f for f in os.listdir(INPUT_DIR) if f.startswith("preprocessed_")],
+        [f for f in os.listdir(INPUT_DIR) if f.startswith("preprocessed_") and not f.endswith(".part")],
         reverse=True
     )
     if not files:
         raise FileNotFoundError("No preprocessed files found")
 
-    with open(os.path.join(INPUT_DIR, files[0]), "r", encoding="utf-8") as f:
-        items: List[Dict] = json.load(f)
-
     results: List[Dict] = []
 
-    for item in tqdm(items):
+    for item in tqdm(iter_preprocessed_file(os.path.join(INPUT_DIR, files[0]))):
         text = build_text(item)
         if not text:
             continue
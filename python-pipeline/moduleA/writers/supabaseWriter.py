@@ -68,17 +68,27 @@ def upsert_references(items: List[Dict]) -> List[Dict]:
 CHUNK_BATCH_SIZE = 50  # 타임아웃 방지용 배치 크기
 
 
+def _vector_payload(embedding) -> List[float]:
+    """float32 버퍼 행(ChunkBatch) → JSON 전송용 list, list는 그대로"""
+    return embedding.tolist() if hasattr(embedding, "tolist") else embedding
+
+
 def insert_chunks(
-    chunks: List[Dict],
+    chunks,
     saved_refs: List[Dict],
     original_items: List[Dict],
 ) -> None:
+    """
+    chunks: embed_batch 결과 ChunkBatch 또는 embed_chunks 결과 dict 리스트
+    로컬 임베딩 저장소에서 재사용된 청크(_skipped)도 embedding이 있으므로 함께 저장
+    임베딩 → list 변환은 CHUNK_BATCH_SIZE 전송 배치 단위로만 수행
+    """
     sb = get_client()
 
     url_to_db_id = {r["source_url"]: r["id"] for r in saved_refs}
     tmp_id_to_url = {item["id"]: item["source_url"] for item in original_items}
 
-    rows = []
+    targets = []
     for chunk in chunks:
         if chunk.get("embedding") is None:
             continue
@@ -87,28 +97,31 @@ def insert_chunks(
         db_id = url_to_db_id.get(url) if url else None
         if not db_id:
             continue
-        rows.append({
-            "reference_id": db_id,
-            "chunk_index":  chunk["chunk_index"],
-            "chunk_text":   chunk["chunk_text"],
-            "embedding":    chunk["embedding"],
-        })
+        targets.append((chunk, db_id))
 
-    if not rows:
+    if not targets:
         return
 
     # 기존 청크 삭제 후 재삽입 (중복 방지)
-    db_ids = list({r["reference_id"] for r in rows})
+    db_ids = list({db_id for _, db_id in targets})
     for i in range(0, len(db_ids), 50):
         sb.table("reference_chunks").delete().in_("reference_id", db_ids[i:i+50]).execute()
 
     # 타임아웃 방지: CHUNK_BATCH_SIZE 단위로 나눠서 insert
-    for i in range(0, len(rows), CHUNK_BATCH_SIZE):
-        batch = rows[i: i + CHUNK_BATCH_SIZE]
+    for i in range(0, len(targets), CHUNK_BATCH_SIZE):
+        batch = [
+            {
+                "reference_id": db_id,
+                "chunk_index":  chunk["chunk_index"],
+                "chunk_text":   chunk["chunk_text"],
+                "embedding":    _vector_payload(chunk["embedding"]),
+            }
+            for chunk, db_id in targets[i: i + CHUNK_BATCH_SIZE]
+        ]
         sb.table("reference_chunks").insert(batch).execute()
         print(f"[WRITER] reference_chunks batch {i // CHUNK_BATCH_SIZE + 1}: {len(batch)} rows inserted")
 
-    print(f"[WRITER] reference_chunks total inserted: {len(rows)}")
+    print(f"[WRITER] reference_chunks total inserted: {len(targets)}")
 
 
 # ──────────────────────────────────────────
@@ -237,31 +250,3 @@ def mark_run_failed(run_id: str, error: str, trace: str) -> None:
         "error_message": error,
         "stack_trace": trace,
     }).eq("run_id", run_id).execute()
-
-
-def get_existing_chunk_hashes() -> set:
-    """
-    reference_chunks 테이블에서 chunk_hash 목록 조회 → set 반환.
-    embed_chunks 중복 스킵에 사용.
-    chunk_hash 컬럼이 없으면 빈 set 반환 (하위 호환).
-    """
-    sb = get_client()
-    try:
-        hashes = set()
-        offset, page = 0, 1000
-        while True:
-            res = sb.table("reference_chunks") \
-                .select("chunk_hash") \
-                .not_.is_("chunk_hash", "null") \
-                .range(offset, offset + page - 1) \
-                .execute()
-            batch = res.data or []
-            hashes.update(r["chunk_hash"] for r in batch if r.get("chunk_hash"))
-            if len(batch) < page:
-                break
-            offset += page
-        print(f"[EMBED] 기존 chunk_hash {len(hashes)}개 로드")
-        return hashes
-    except Exception as e:
-        print(f"[EMBED] chunk_hash 조회 실패 (스킵 없이 진행): {e}")
-        return set()
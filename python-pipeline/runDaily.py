@@ -4,11 +4,12 @@ runDaily.py
 Module A 일일 파이프라인 엔트리포인트
 
 실행 순서:
-  1. RSS 수집 (rssCollector)
-  2. 텍스트 정제 (textCleaner)
+  1. 수집 (collectorRegistry — RSS / Trends / Visual 동시 실행)
+     + 선택: 기사 본문 수집 (articleFetcher, --articles)
+  2. 텍스트 정제 (textCleaner) + schema 검증 (schemaValidator)
   3. 중복 제거 (deduplicate)
   4. Supabase references 저장
-  5. 문서 청킹 (documentChunker)
+  5. 문서 청킹 (documentChunker, 문단 / 섹션 기준 structure 모드) + 소스별 상용구 청크 제거 (boilerplateFilter)
   6. 임베딩 생성 (textEmbedder)
   7. reference_chunks 저장
   8. 16축 스코어링 (axisScorer)
@@ -34,29 +35,47 @@ if sys.platform == "win32":
 
 load_dotenv(dotenv_path=os.path.join(os.path.dirname(__file__), "..", ".env"))
 
-from moduleA.collectors.rssCollector import collect_rss
-from moduleA.collectors.googleTrendsCollector import collect_trends
-from moduleA.collectors.visualTrendCollector import collect_visual_trends
-from moduleA.chunker.documentChunker import chunk_items
-from moduleA.embedder.textEmbedder import embed_chunks
+from moduleA.collectors.collectorRegistry import run_collectors, store_collected
+from moduleA.collectors.feedCache import get_validator_cache
+from moduleA.collectors.seenIndex import get_seen_index
+from moduleA.collectors.sourceSchedule import get_source_schedule
+from moduleA.collectors.circuitBreaker import get_circuit_breaker
+from moduleA.collectors.articleFetcher import fetch_articles
+from moduleA.chunker.documentChunker import chunk_batch, chunk_report
+from moduleA.chunker.boilerplateFilter import filter_boilerplate, get_boilerplate_index
+from moduleA.embedder.textEmbedder import embed_batch, cache_hit_report
+from moduleA.embedder.embeddingStore import get_embedding_store
 from moduleA.scorer.axisScorer import score_items
 from moduleA.patterns.industryPatternBuilder import compute_industry_averages
 from moduleA.writers.supabaseWriter import (
     create_run, mark_run_success, mark_run_failed,
     upsert_references, insert_chunks, upsert_axis_scores,
     upsert_industry_patterns, insert_retrieval_logs,
-    upsert_trend_signals, upsert_visual_trends,
-    get_existing_chunk_hashes,
 )
 
 # 기존 공통 유틸 재사용
-from common.utils.textCleaner import clean_item_text
-from moduleA.preprocess.deduplicate import deduplicate
+from common.utils.textCleaner import clean_items
+from moduleA.preprocess.schemaValidator import validate_batch, RAW_SCHEMA
+from moduleA.preprocess.deduplicate import deduplicate_with_report, recrawled_ids
+from moduleA.preprocess.dedupIndex import get_dedup_index
 
 PIPELINE_VERSION = "v2.0.0"
+SCHEMA_ERROR_LOG_LIMIT = 5     # schema 실패는 앞의 N건만 상세 출력 (피드 형식이 바뀌면 전체가 실패할 수 있음)
 
 
-def run():
+def _local_state():
+    """실행 성공 시에만 반영되는 로컬 상태 (validator 캐시, seen 인덱스, 폴링 주기, circuit breaker, dedup 인덱스, 상용구 빈도)"""
+    return [
+        get_validator_cache(), get_seen_index(), get_source_schedule(),
+        get_circuit_breaker(), get_dedup_index(), get_boilerplate_index(),
+    ]
+
+
+def run(collectors=None, articles=False):
+    """
+    collectors: 실행할 수집기 이름 목록 (None이면 기본 활성 수집기 전체)
+    articles: True면 새 entry의 기사 본문을 받아 body_text 보강
+    """
     run_id = str(uuid.uuid4())
     run_date = datetime.utcnow().date().isoformat()
 
@@ -79,26 +98,54 @@ def run():
     try:
         # ── 1. 수집 ────────────────────────────────────
         print("[STEP 1] 데이터 수집")
-        rss_items, logs = collect_rss(run_id)
-        trend_rows = collect_trends(run_id)
-        visual_rows = collect_visual_trends(run_id)
+        collected = run_collectors(run_id, names=collectors)
+        rss_items, logs = (collected.get("rss") or {}).get("result") or ([], [])
         stats["collected"] = len(rss_items)
-        print(f"  → RSS: {len(rss_items)}, Trends: {len(trend_rows)}, Visual: {len(visual_rows)}")
+        stats["already_seen"] = sum(log.get("seen_count", 0) for log in logs)
+        stats["polled_sources"] = len(logs)
+        stats["collector_timings"] = {name: o["elapsed_ms"] for name, o in collected.items()}
+        stats["collector_errors"] = {name: o["error"] for name, o in collected.items() if o["error"]}
+        stats["breakers"] = get_circuit_breaker().summary()
+        print(f"  → RSS: {len(rss_items)} new ({stats['already_seen']} seen), timings: {stats['collector_timings']}")
+
+        if articles:
+            print("[STEP 1-1] 기사 본문 수집")
+            article_report = fetch_articles(rss_items)
+            stats["articles_updated"] = article_report["updated"]
+            stats["article_hosts"] = {
+                host: h["pages_per_sec"] for host, h in article_report["hosts"].items()
+            }
+            print(f"  → {article_report['updated']} items body_text 보강")
 
         # ── 2. 트렌드 별도 저장 (테이블 분리) ───────────
         print("[STEP 2] 트렌드 신호 저장")
-        upsert_trend_signals(trend_rows)
-        upsert_visual_trends(visual_rows)
+        store_collected(collected)
 
         # ── 3. RSS 정제 ────────────────────────────────
         print("[STEP 3] 텍스트 정제")
-        items = [clean_item_text(item) for item in rss_items]
+        items = clean_items(rss_items)
+        items, invalid = validate_batch(items, RAW_SCHEMA)
+        stats["schema_invalid"] = len(invalid)
+        for row in invalid[:SCHEMA_ERROR_LOG_LIMIT]:
+            print(f"  ↳ schema 실패 #{row['index']}: {row['errors'][0]['message']} ({len(row['errors'])} errors)")
+        if len(invalid) > SCHEMA_ERROR_LOG_LIMIT:
+            print(f"  ↳ ... 외 {len(invalid) - SCHEMA_ERROR_LOG_LIMIT}건 생략")
+        if invalid:
+            print(f"  → {len(invalid)} items failed schema validation (제외)")
 
         # ── 4. 중복 제거 ───────────────────────────────
         print("[STEP 4] 중복 제거")
-        items = deduplicate(items)
+        items, dropped = deduplicate_with_report(items, index=get_dedup_index())
         stats["after_dedup"] = len(items)
-        print(f"  → {len(items)} items after dedup")
+        stats["near_duplicates"] = sum(1 for d in dropped if d["reason"] == "near_duplicate")
+        stats["previous_run_duplicates"] = sum(1 for d in dropped if d["previous_run"])
+        for d in dropped:
+            if d["reason"] == "near_duplicate":
+                print(f"  ↳ near-dup ({d['similarity']}): {d['source_url']} → {d['canonical_url']}")
+        print(
+            f"  → {len(items)} items after dedup ({stats['near_duplicates']} near-duplicates, "
+            f"{stats['previous_run_duplicates']} seen in previous runs)"
+        )
 
         # ── 5. references 저장 ─────────────────────────
         print("[STEP 5] Supabase references 저장")
@@ -106,20 +153,50 @@ def run():
 
         # ── 6. 청킹 ────────────────────────────────────
         print("[STEP 6] 문서 청킹")
-        chunks = chunk_items(items)
+        chunks = chunk_batch(items)
+        created = len(chunks)
+        chunking = chunk_report(chunks)
+        stats["chunking"] = {
+            "chunks_per_reference": chunking["chunks_per_reference"],
+            "fill_ratio": chunking["fill_ratio"],
+        }
+        chunks, boilerplate = filter_boilerplate(chunks, items, index=get_boilerplate_index())
         stats["chunks"] = len(chunks)
-        print(f"  → {len(chunks)} chunks created")
+        stats["boilerplate"] = {
+            "dropped": boilerplate["dropped"],
+            "collapsed": boilerplate["collapsed"],
+            "tokens_saved": boilerplate["tokens_saved"],
+            "sources": {
+                source: s for source, s in boilerplate["sources"].items() if s["dropped"] or s["collapsed"]
+            },
+        }
+        print(
+            f"  → {created} chunks created ({chunking['chunks_per_reference']}/reference, "
+            f"fill {chunking['fill_ratio']}), 상용구 {boilerplate['dropped']} 제외 / "
+            f"{boilerplate['collapsed']} 축약 ({boilerplate['tokens_saved']} tokens saved)"
+        )
 
         # ── 7. 임베딩 ──────────────────────────────────
-        print("[STEP 7] 임베딩 생성 (OpenAI, 중복 스킵)")
-        existing_hashes = get_existing_chunk_hashes()
-        chunks_with_embedding = embed_chunks(chunks, existing_hashes=existing_hashes)
-        stats["embedded"] = sum(1 for c in chunks_with_embedding if c.get("embedding") and not c.get("_skipped"))
-        print(f"  → {stats['embedded']} chunks embedded")
+        print("[STEP 7] 임베딩 생성 (OpenAI, 로컬 임베딩 저장소 재사용)")
+        store = get_embedding_store()
+        embed_batch(chunks, store=store)
+        stats["embedded"] = chunks.embedded_count()
+        cache_hits = cache_hit_report(chunks)
+        recrawled = cache_hit_report(chunks, reference_ids=recrawled_ids(items, get_dedup_index()))
+        stats["embedding_cache"] = {
+            "hit_rate": cache_hits["hit_rate"],
+            "recrawled_chunks": recrawled["chunks"],
+            "recrawled_hit_rate": recrawled["hit_rate"],
+            "store": store.stats(),
+        }
+        print(
+            f"  → {stats['embedded']} chunks embedded (cache hit {cache_hits['hits']}/{cache_hits['chunks']}, "
+            f"재수집 문서 {recrawled['hits']}/{recrawled['chunks']})"
+        )
 
         # ── 8. reference_chunks 저장 ───────────────────
         print("[STEP 8] reference_chunks 저장")
-        insert_chunks(chunks_with_embedding, saved_refs, items)
+        insert_chunks(chunks, saved_refs, items)
 
         # ── 9. 16축 스코어링 ───────────────────────────
         print("[STEP 9] 16축 스코어링 (GPT-4o mini)")
@@ -145,17 +222,36 @@ def run():
         print("[STEP 13] retrieval_logs 저장")
         insert_retrieval_logs(logs)
 
+        # 모든 단계 성공 후에만 로컬 상태 반영 (실패 시 다음 실행에서 재수집)
+        for state in _local_state():
+            state.commit()
+
         # ── 완료 ───────────────────────────────────────
         mark_run_success(run_id, stats)
         print(f"\n[PIPELINE] ✅ 완료: {stats}")
 
     except Exception as e:
+        for state in _local_state():
+            state.rollback()
         tb = traceback.format_exc()
         mark_run_failed(run_id, str(e), tb)
         print(f"\n[PIPELINE] ❌ 실패: {e}")
         raise
 
 
+def show_schedule():
+    """소스별 학습된 폴링 주기 / 다음 due 시각 출력"""
+    rows = get_source_schedule().report()
+    print(f"\n[SCHEDULE] {len(rows)}개 소스\n")
+    for row in rows:
+        print(f"  {row.get('next_due', '-'):<32} {row.get('interval_hours', '-'):>7}h  {row['source_url']}")
+
+    breakers = get_circuit_breaker().summary()
+    print(f"\n[BREAKER] open {breakers['open']} / half_open {breakers['half_open']}\n")
+    for row in breakers["tripped"]:
+        print(f"  {row['retry_at'] or '-':<32} {row['state']:>9}  {row['source_url']}")
+
+
 def rescore_all(delay: float = 0.3):
     """
     DB의 모든 design_references를 새 16축으로 재스코어링
@@ -219,10 +315,23 @@ if __name__ == "__main__":
                         help="DB의 모든 레퍼런스를 새 16축으로 재스코어링")
     parser.add_argument("--delay", type=float, default=0.3,
                         help="API 호출 간격(초), 기본 0.3")
+    parser.add_argument("--show-schedule", action="store_true",
+                        help="소스별 폴링 주기 / 다음 due 시각 출력")
+    parser.add_argument("--collectors", type=lambda s: s.split(","), default=None,
+                        help="실행할 수집기 (예: rss,trends,visual,pinterest), 기본: 활성 수집기 전체")
+    parser.add_argument("--compact-dedup", type=int, metavar="DAYS", default=None,
+                        help="dedup 인덱스에서 DAYS일 동안 안 보인 항목 삭제 후 VACUUM")
+    parser.add_argument("--articles", action="store_true",
+                        help="RSS 새 entry의 기사 본문 수집 (body_text 보강)")
     args = parser.parse_args()
 
-    if args.rescore_all:
+    if args.show_schedule:
+        show_schedule()
+    elif args.compact_dedup is not None:
+        removed = get_dedup_index().compact(max_age_days=args.compact_dedup)
+        print(f"[DEDUP] compact 완료: {removed} → {get_dedup_index().stats()}")
+    elif args.rescore_all:
         from moduleA.scorer.axisScorer import score_item
         rescore_all(delay=args.delay)
     else:
-        run()
+        run(collectors=args.collectors, articles=args.articles)
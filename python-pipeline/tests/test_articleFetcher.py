@@ -0,0 +1,159 @@
+"""
+tests/test_articleFetcher.py
+
+httpPool / articleExtractor / articleFetcher 단위 테스트.
+로컬 HTTP 서버(127.0.0.1)로 keep-alive / robots / 캐시 동작 확인.
+"""
+
+import sys, os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from moduleA.collectors import articleExtractor, articleFetcher
+from moduleA.collectors.articleCache import ArticleCache
+from moduleA.collectors.articleFetcher import fetch_articles, RobotsPolicy
+from moduleA.collectors.httpPool import HostConnectionPool
+
+PARAGRAPH = "This paragraph is long enough to count as real article body text. "
+ARTICLE_HTML = (
+    "<html><head><script>var x = 1;</script></head><body>"
+    "<nav><p>Home About Contact and other navigation links here</p></nav>"
+    f"<article><h1>Title</h1><p>{PARAGRAPH * 2}</p><p>{PARAGRAPH * 2}</p></article>"
+    "<footer><p>Copyright footer text that should be dropped entirely</p></footer>"
+    "</body></html>"
+)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    requests = []
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status, body=b"", headers=None):
+        self.send_response(status)
+        for k, v in (headers or {}).items():
+            self.send_header(k, v)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        _Handler.requests.append((self.path, self.headers.get("If-None-Match")))
+        if self.path == "/robots.txt":
+            self._send(200, b"User-agent: *\nDisallow: /private\nCrawl-delay: 0\n")
+        elif self.path == "/moved":
+            self._send(301, headers={"Location": "/article"})
+        elif self.path == "/article":
+            if self.headers.get("If-None-Match") == '"v1"':
+                self._send(304)
+            else:
+                self._send(200, ARTICLE_HTML.encode(), {"ETag": '"v1"', "Content-Type": "text/html; charset=utf-8"})
+        else:
+            self._send(200, ARTICLE_HTML.encode(), {"Content-Type": "text/html"})
+
+
+@pytest.fixture
+def server():
+    _Handler.requests = []
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+# ── articleExtractor ───────────────────────────────────
+
+def test_fallback_extract_keeps_article_paragraphs(monkeypatch):
+    monkeypatch.setattr(articleExtractor, "trafilatura", None)
+    text = articleExtractor.extract_main_text(ARTICLE_HTML)
+    assert text.startswith("Title\n\nThis paragraph")
+    assert "navigation" not in text and "footer" not in text and "var x" not in text
+
+
+# ── httpPool ───────────────────────────────────────────
+
+def test_pool_reuses_connection_and_follows_redirect(server):
+    with HostConnectionPool() as pool:
+        for _ in range(3):
+            result = pool.request(f"{server}/moved")
+            assert result["status"] == 200 and result["error"] is None
+            assert result["headers"]["content-location"].endswith("/article")
+        assert pool.connections_opened == 1
+
+
+# ── articleFetcher ─────────────────────────────────────
+
+def test_fetch_articles_robots_cache_and_report(server, tmp_path, monkeypatch):
+    monkeypatch.setattr(articleExtractor, "trafilatura", None)
+    cache = ArticleCache(str(tmp_path / "articles.db"))
+    items = [
+        {"source_url": f"{server}/article", "body_text": "short summary"},
+        {"source_url": f"{server}/private/x", "body_text": "kept"},
+    ]
+    with HostConnectionPool() as pool:
+        robots = RobotsPolicy(pool, default_delay=0.01)
+        report = fetch_articles(items, pool=pool, cache=cache, robots=robots)
+
+    assert report["updated"] == 1
+    assert items[0]["body_text"].startswith("Title")
+    assert items[1]["body_text"] == "kept"
+    host = report["hosts"][server.split("//")[1]]
+    assert host["fetched"] == 1 and host["disallowed"] == 1
+
+    # 캐시가 fresh → 네트워크 요청 없이 재사용
+    before = len(_Handler.requests)
+    items = [{"source_url": f"{server}/article", "body_text": ""}]
+    fetch_articles(items, cache=cache, robots=RobotsPolicy(HostConnectionPool(), default_delay=0.01))
+    assert items[0]["body_text"].startswith("Title")
+    assert [p for p, _ in _Handler.requests[before:]] == []
+
+
+def test_stale_cache_uses_conditional_get(server, tmp_path, monkeypatch):
+    monkeypatch.setattr(articleExtractor, "trafilatura", None)
+    cache = ArticleCache(str(tmp_path / "articles.db"))
+    url = f"{server}/article"
+    cache.store(url, "old-hash", "cached body text", {"etag": '"v1"'})
+    monkeypatch.setattr(ArticleCache, "is_fresh", staticmethod(lambda entry, now=None: False))
+
+    items = [{"source_url": url, "body_text": ""}]
+    with HostConnectionPool() as pool:
+        report = fetch_articles(items, pool=pool, cache=cache, robots=RobotsPolicy(pool, default_delay=0.01))
+
+    assert items[0]["body_text"] == "cached body text"
+    assert ("/article", '"v1"') in _Handler.requests
+    assert report["hosts"][server.split("//")[1]]["not_modified"] == 1
+
+
+def test_budget_exceeded_leaves_items_and_pool_to_workers(tmp_path, monkeypatch):
+    events = []
+
+    class _Pool:
+        def close(self):
+            events.append("close")
+
+    def _slow_fetch(url, pool, cache, robots, stats):
+        time.sleep(0.3)
+        events.append("fetched")
+        return "a much longer article body than the feed summary"
+
+    monkeypatch.setattr(articleFetcher, "HostConnectionPool", _Pool)
+    monkeypatch.setattr(articleFetcher, "_fetch_text", _slow_fetch)
+    items = [{"source_url": "https://example.com/a", "body_text": "summary"}]
+    report = fetch_articles(
+        items, total_budget=0.05,
+        cache=ArticleCache(str(tmp_path / "articles.db")), robots=object(),
+    )
+    assert report["budget_exceeded"] == 1 and events == []     # 실행 중인 작업이 쓰는 pool은 아직 열림
+
+    time.sleep(0.6)
+    assert items[0]["body_text"] == "summary"                   # 반환 이후 item 수정 없음
+    assert events == ["fetched", "close"]
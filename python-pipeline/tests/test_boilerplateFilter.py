@@ -0,0 +1,117 @@
+"""
+tests/test_boilerplateFilter.py
+
+소스별 상용구 segment 학습 / 청크 제외·축약 단위 테스트.
+"""
+
+import sys, os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from moduleA.chunker.chunkBatch import ChunkBatch
+from moduleA.chunker.boilerplateFilter import (
+    BoilerplateIndex, filter_boilerplate, segment_fingerprint, segments,
+)
+
+FOOTER = "Subscribe to our weekly newsletter for the latest design stories."
+
+
+STUDIOS = ["Arper", "Muuto", "Hay", "Vitra", "Kvadrat", "Fritz Hansen", "Menu", "Gubi", "Tonelli", "Moroso", "Cassina"]
+MATERIALS = ["aluminium", "oak", "steel", "cork", "glass", "birch", "resin", "brass", "felt", "stone", "clay"]
+
+
+def _body(i):
+    return (
+        f"{STUDIOS[i]} designed a modular shelving system from recycled {MATERIALS[i]} profiles "
+        f"that can be rearranged without tools in homes, offices and retail spaces around the city."
+    )
+
+
+def _batch(n, source="Dezeen", start=0):
+    items, chunks = [], []
+    for i in range(start, start + n):
+        title = f"Shelving concept by {STUDIOS[i]}"
+        items.append({
+            "id": f"r{i}", "source_name": source, "title": title,
+            "source_url": f"https://www.{source.lower()}.com/shelving-{i}/?utm_source=rss",
+        })
+        text = f"{_body(i)} The post {title} appeared first on {source}."
+        chunks.append({
+            "reference_id": f"r{i}", "chunk_index": 0, "chunk_text": text,
+            "char_start": 0, "char_end": len(text),
+        })
+        chunks.append({"reference_id": f"r{i}", "chunk_index": 1, "chunk_text": FOOTER})
+    return items, chunks
+
+
+def test_segments_and_title_template_fingerprint():
+    text = "First sentence is here. Second one?\nThird line without stop"
+    assert [text[s:e] for s, e in segments(text)] == [
+        "First sentence is here.", "Second one?", "Third line without stop",
+    ]
+    a = segment_fingerprint("The post Red Chair appeared first on Dezeen.", "red chair")
+    b = segment_fingerprint("The post Blue Lamp 2 appeared first on Dezeen.", "blue lamp 2")
+    assert a == b
+    assert segment_fingerprint("Too short.", "") is None
+
+
+def test_repeated_footer_dropped_and_template_collapsed():
+    items, chunks = _batch(4)
+    kept, report = filter_boilerplate(chunks, items)
+
+    assert [c["chunk_index"] for c in kept] == [0, 0, 0, 0]
+    assert all("appeared first" not in c["chunk_text"] for c in kept)
+    assert kept[0]["chunk_text"] == _body(0)
+    assert all("char_start" not in c and "char_end" not in c for c in kept)    # 축약 → 원문 오프셋 무효
+    assert report["dropped"] == 4 and report["collapsed"] == 4 and report["tokens_saved"] > 0
+    assert report["sources"]["Dezeen"]["chunks"] == 8
+
+
+def test_chunk_batch_filtered_like_dicts():
+    items, chunks = _batch(4)
+    batch = ChunkBatch.from_dicts(chunks)
+    kept, report = filter_boilerplate(batch, items)
+    expected, expected_report = filter_boilerplate(chunks, items)
+
+    assert isinstance(kept, ChunkBatch)
+    assert kept.to_dicts() == expected
+    assert report == expected_report
+
+
+def test_rare_segments_and_other_sources_kept():
+    items, chunks = _batch(2)
+    other_items, other_chunks = _batch(1, source="Other", start=5)
+    kept, report = filter_boilerplate(chunks + other_chunks, items + other_items)
+    assert len(kept) == 6 and report["dropped"] == report["collapsed"] == 0
+
+
+def test_history_accumulates_across_runs_only_after_commit(tmp_path):
+    index = BoilerplateIndex(str(tmp_path / "bp.db"))
+    items, chunks = _batch(2)
+    filter_boilerplate(chunks, items, index=index)
+    index.rollback()
+
+    items, chunks = _batch(2, start=2)
+    kept, report = filter_boilerplate(chunks, items, index=index)
+    assert report["dropped"] == 0           # rollback된 1차 배치는 반영 안 됨
+    index.commit()
+
+    items, chunks = _batch(1, start=4)
+    kept, report = filter_boilerplate(chunks, items, index=BoilerplateIndex(str(tmp_path / "bp.db")))
+    assert report["dropped"] == 1 and report["collapsed"] == 1
+    assert index.stats()["fingerprints"] > 0
+
+
+def test_recrawled_article_counted_once(tmp_path):
+    path = str(tmp_path / "bp.db")
+    url = "https://www.dezeen.com/chair-story/"
+    for run in range(4):
+        # 수정된 같은 기사 — 실행마다 새 레퍼런스 id, 추적 파라미터만 다른 URL
+        text = f"{_body(0)} Updated {'again ' * run}with new photos of the chair."
+        items = [{"id": f"run{run}", "source_name": "Dezeen", "title": "Chair story",
+                  "source_url": f"{url}?utm_campaign={run}"}]
+        chunks = [{"reference_id": f"run{run}", "chunk_index": 0, "chunk_text": text}]
+        index = BoilerplateIndex(path)
+        kept, report = filter_boilerplate(chunks, items, index=index)
+        index.commit()
+        assert len(kept) == 1 and report["dropped"] == report["collapsed"] == 0
+    assert index.stats()["boilerplate"] == 0
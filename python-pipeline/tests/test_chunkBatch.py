@@ -0,0 +1,91 @@
+"""
+tests/test_chunkBatch.py
+
+컬럼 청크 배치 (ChunkBatch) 단위 테스트.
+"""
+
+import sys, os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import numpy as np
+import pytest
+
+from moduleA.chunker import documentChunker
+from moduleA.chunker.chunkBatch import ChunkBatch
+from moduleA.chunker.documentChunker import chunk_batch, chunk_items, _ApproxTokenizer
+
+
+ITEMS = [
+    {"id": f"r{i}", "title": f"Title {i}",
+     "body_text": " ".join([f"Sentence {j} about packaging design and recycled paper." for j in range(40 + i)])}
+    for i in range(3)
+]
+
+
+def _dicts(n=3):
+    return [
+        {"reference_id": "r1", "chunk_index": i, "chunk_text": f"text {i}", "token_count": 10 + i,
+         "char_start": i * 10, "char_end": i * 10 + 6}
+        for i in range(n)
+    ]
+
+
+@pytest.mark.parametrize("mode", ["cdc", "tokens", "chars"])
+def test_chunk_batch_matches_chunk_items(monkeypatch, mode):
+    monkeypatch.setattr(documentChunker, "get_tokenizer", lambda model=None: _ApproxTokenizer())
+    assert chunk_batch(ITEMS, mode=mode).to_dicts() == chunk_items(ITEMS, mode=mode)
+
+
+def test_rows_read_columns_without_copy():
+    batch = ChunkBatch.from_dicts(_dicts())
+    row = batch[1]
+    assert row["chunk_text"] == "text 1" and row.get("token_count") == 11
+    assert row.get("embedding") is None and row["_skipped"] is False
+    assert [r["chunk_index"] for r in batch] == [0, 1, 2]
+    assert batch[-1]["chunk_index"] == 2
+    with pytest.raises(IndexError):
+        batch[3]
+    with pytest.raises(KeyError):
+        row["missing"]
+
+
+def test_embeddings_held_in_float32_buffer():
+    batch = ChunkBatch.from_dicts(_dicts())
+    batch.chunk_hash = ["h0", "h1", "h2"]
+    batch.set_embeddings([0, 2], [[0.5] * 4, [0.25] * 4])
+
+    assert batch.embeddings.dtype == np.float32 and batch.embeddings.shape == (3, 4)
+    assert batch[1]["embedding"] is None
+    assert np.shares_memory(batch[2]["embedding"], batch.embeddings)
+    assert batch.embedded_count() == 2
+
+    dicts = batch.to_dicts()
+    assert dicts[0]["embedding"] == [0.5] * 4 and dicts[1]["embedding"] is None
+    assert dicts[0]["chunk_hash"] == "h0"
+
+
+def test_select_and_set_text():
+    batch = ChunkBatch.from_dicts(_dicts())
+    batch.chunk_hash = ["h0", "h1", "h2"]
+    batch.skipped[1] = True
+    batch.set_embeddings([0, 1, 2], np.eye(3))
+    batch.set_text(2, "shorter", 3)
+
+    out = batch.select([2, 1])
+    assert out.chunk_text == ["shorter", "text 1"]
+    assert list(out.token_count) == [3, 11]
+    assert out.chunk_hash == [None, "h1"]          # 텍스트가 바뀐 행은 해시 재계산 필요
+    assert list(out.char_start) == [-1, 10] and "char_start" not in out.to_dicts()[0]
+    assert out.skipped.tolist() == [False, True]
+    assert out.embeddings.tolist() == [[0, 0, 1], [0, 1, 0]]
+    assert out.embedded_count() == 1
+
+
+def test_from_dicts_round_trip_and_nbytes():
+    dicts = _dicts()
+    batch = ChunkBatch.from_dicts(dicts)
+    assert batch.to_dicts() == dicts
+    assert len(ChunkBatch()) == 0 and ChunkBatch().to_dicts() == []
+    before = batch.nbytes()
+    batch.set_embeddings([0, 1, 2], np.zeros((3, 1536)))
+    assert batch.nbytes() - before == 3 * 1536 * 4
@@ -0,0 +1,84 @@
+"""
+tests/test_circuitBreaker.py
+
+circuitBreaker 상태 전이 단위 테스트.
+"""
+
+import sys, os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+from moduleA.collectors.circuitBreaker import (
+    CircuitBreaker, FAILURE_THRESHOLD, BASE_COOLDOWN_HOURS,
+    CLOSED, OPEN, HALF_OPEN, FETCH, PROBE, SKIP,
+)
+
+URL = "https://a.com/feed"
+T0 = datetime(2030, 1, 1, 6, 0)
+
+
+def _breaker(tmp_path):
+    return CircuitBreaker(str(tmp_path / "breakers.json"))
+
+
+def _trip(breaker, now=T0):
+    for _ in range(FAILURE_THRESHOLD):
+        state = breaker.record(URL, "blocked", now=now)
+    return state
+
+
+def test_opens_after_consecutive_blocked(tmp_path):
+    breaker = _breaker(tmp_path)
+    for _ in range(FAILURE_THRESHOLD - 1):
+        assert breaker.record(URL, "blocked", now=T0) == CLOSED
+    assert breaker.record(URL, "blocked", now=T0) == OPEN
+    assert breaker.allow(URL, T0 + timedelta(hours=1)) == SKIP
+
+
+def test_success_resets_failure_count(tmp_path):
+    breaker = _breaker(tmp_path)
+    for _ in range(FAILURE_THRESHOLD - 1):
+        breaker.record(URL, "blocked", now=T0)
+    breaker.record(URL, "not_modified", now=T0)
+    assert breaker.record(URL, "blocked", now=T0) == CLOSED
+
+
+def test_half_open_probe_closes_on_success(tmp_path):
+    breaker = _breaker(tmp_path)
+    _trip(breaker)
+    later = T0 + timedelta(hours=BASE_COOLDOWN_HOURS + 1)
+    assert breaker.allow(URL, later) == PROBE
+    assert breaker.state_of(URL) == HALF_OPEN
+    assert breaker.record(URL, "success", now=later) == CLOSED
+    assert breaker.allow(URL, later) == FETCH
+
+
+def test_failed_probe_doubles_cooldown(tmp_path):
+    breaker = _breaker(tmp_path)
+    _trip(breaker)
+    later = T0 + timedelta(hours=BASE_COOLDOWN_HOURS + 1)
+    breaker.allow(URL, later)
+    assert breaker.record(URL, "blocked", now=later) == OPEN
+    assert breaker.get(URL)["cooldown_hours"] == BASE_COOLDOWN_HOURS * 2
+    assert breaker.allow(URL, later + timedelta(hours=BASE_COOLDOWN_HOURS + 1)) == SKIP
+
+
+def test_split_and_summary(tmp_path):
+    breaker = _breaker(tmp_path)
+    _trip(breaker)
+    a, b = SimpleNamespace(url=URL), SimpleNamespace(url="https://b.com/feed")
+    allowed, probes, skipped = breaker.split([a, b], T0 + timedelta(hours=1))
+    assert allowed == [b]
+    assert probes == set() and skipped == [a]
+    summary = breaker.summary()
+    assert summary[OPEN] == 1 and summary["tripped"][0]["source_url"] == URL
+
+
+def test_state_persists_only_after_commit(tmp_path):
+    breaker = _breaker(tmp_path)
+    _trip(breaker)
+    assert _breaker(tmp_path).state_of(URL) == CLOSED
+    breaker.commit()
+    assert _breaker(tmp_path).state_of(URL) == OPEN
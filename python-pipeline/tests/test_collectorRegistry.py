@@ -0,0 +1,92 @@
+"""
+tests/test_collectorRegistry.py
+
+collectorRegistry 단위 테스트 — 실제 수집기 대신 더미 callable 등록.
+"""
+
+import time
+import sys, os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+from moduleA.collectors import collectorRegistry
+from moduleA.collectors.collectorRegistry import (
+    CollectorCancelled, StagingGuard, register_collector, run_collectors, store_collected,
+)
+
+
+@pytest.fixture(autouse=True)
+def isolated_registry(monkeypatch):
+    monkeypatch.setattr(collectorRegistry, "_REGISTRY", {})
+
+
+def _boom(run_id):
+    raise RuntimeError("feed down")
+
+
+def test_failure_is_isolated():
+    register_collector("ok", lambda run_id: [run_id])
+    register_collector("bad", _boom)
+
+    outcomes = run_collectors("run-1")
+    assert outcomes["ok"]["result"] == ["run-1"]
+    assert outcomes["ok"]["error"] is None
+    assert "feed down" in outcomes["bad"]["error"]
+
+
+def test_deadline_exceeded():
+    register_collector("slow", lambda run_id: time.sleep(1.0) or [])
+    outcomes = run_collectors("run-1", deadline=0.2)
+    assert outcomes["slow"]["error"] == "deadline exceeded"
+
+
+def _staging_collector(staged, delay, stage_time=0.0):
+    def collect(run_id, guard=None):
+        time.sleep(delay)                       # fetch
+        with guard.staging():
+            time.sleep(stage_time)
+            staged.append(run_id)               # seen / validator / schedule staging 대역
+        return [run_id]
+    return collect
+
+
+def test_slow_collector_cannot_stage_after_deadline():
+    staged = []
+    register_collector("slow", _staging_collector(staged, delay=0.5))
+    register_collector("fast", _staging_collector(staged, delay=0.0))
+    outcomes = run_collectors("run-1", deadline=0.2)
+
+    assert outcomes["slow"]["error"] == "deadline exceeded"
+    assert outcomes["fast"]["result"] == ["run-1"]
+    time.sleep(0.5)                             # 늦게 끝난 수집기도 staging하지 못함
+    assert staged == ["run-1"]
+
+
+def test_collector_staging_at_deadline_keeps_result():
+    staged = []
+    register_collector("edge", _staging_collector(staged, delay=0.1, stage_time=0.3))
+    outcomes = run_collectors("run-1", deadline=0.2)
+    # 데드라인 시점에 이미 staging 중 → 끝날 때까지 기다려 결과 사용 (staged entry 유실 없음)
+    assert outcomes["edge"]["error"] is None
+    assert outcomes["edge"]["result"] == ["run-1"] and staged == ["run-1"]
+
+
+def test_guard_blocks_staging_after_cancel():
+    guard = StagingGuard()
+    assert guard.cancel() is False
+    with pytest.raises(CollectorCancelled):
+        with guard.staging():
+            pass
+
+
+def test_disabled_runs_only_when_named():
+    register_collector("off", lambda run_id: ["x"], enabled=False)
+    assert run_collectors("run-1") == {}
+    assert run_collectors("run-1", names=["off"])["off"]["result"] == ["x"]
+
+
+def test_store_collected_calls_store():
+    stored = []
+    register_collector("rows", lambda run_id: [1, 2], store=stored.extend)
+    store_collected(run_collectors("run-1"))
+    assert stored == [1, 2]
@@ -0,0 +1,117 @@
+"""
+tests/test_dedupIndex.py
+
+urlUtils canonical URL / dedupIndex 실행 간 중복 단위 테스트.
+"""
+
+import sys, os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import time
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from common.utils.urlUtils import canonicalize_url
+from moduleA.preprocess import dedupIndex
+from moduleA.preprocess.dedupIndex import DedupIndex
+from moduleA.preprocess.deduplicate import deduplicate_with_report, recrawled_ids
+
+BODY = (
+    "Pentagram unveiled a new visual identity for the museum built on a bold grotesque "
+    "wordmark, a flexible frame device and a palette drawn from the collection archive"
+)
+
+
+def _item(url, body=BODY, title="Museum identity"):
+    return {"id": url, "source_url": url, "title": title, "body_text": body}
+
+
+def _index(tmp_path):
+    return DedupIndex(str(tmp_path / "dedup.db"))
+
+
+# ── canonicalize_url ───────────────────────────────────
+
+def test_canonicalize_url_drops_tracking_and_slash():
+    assert canonicalize_url("https://www.A.com/x/?utm_source=rss&utm_medium=feed") == "https://a.com/x"
+    assert canonicalize_url("https://a.com/x?b=2&a=1#frag") == "https://a.com/x?a=1&b=2"
+    assert canonicalize_url("http://a.com:80") == "http://a.com/"
+
+
+def test_in_run_url_variants_are_duplicates():
+    unique, dropped = deduplicate_with_report([
+        _item("https://a.com/x"), _item("https://a.com/x/?utm_campaign=rss", body="other"),
+    ])
+    assert len(unique) == 1 and dropped[0]["reason"] == "url"
+
+
+# ── cross-run ──────────────────────────────────────────
+
+def test_cross_run_duplicates_after_commit(tmp_path):
+    index = _index(tmp_path)
+    deduplicate_with_report([_item("https://a.com/x")], index=index)
+    index.commit()
+
+    index = _index(tmp_path)
+    unique, dropped = deduplicate_with_report([
+        _item("https://a.com/x?utm_source=tw"),
+        _item("https://b.com/syndicated", body=BODY + " via partner feed"),
+    ], index=index)
+    assert unique == []
+    assert [d["reason"] for d in dropped] == ["url", "near_duplicate"]
+    assert all(d["previous_run"] and d["canonical_url"] == "https://a.com/x" for d in dropped)
+
+
+def test_rollback_keeps_items_new(tmp_path):
+    index = _index(tmp_path)
+    deduplicate_with_report([_item("https://a.com/x")], index=index)
+    index.rollback()
+    unique, _ = deduplicate_with_report([_item("https://a.com/x")], index=index)
+    assert len(unique) == 1
+
+
+def test_changed_text_same_url_passes(tmp_path):
+    index = _index(tmp_path)
+    deduplicate_with_report([_item("https://a.com/x")], index=index)
+    index.commit()
+    updated = _item("https://a.com/x", body=BODY + " Updated with a statement from the director.")
+    unique, _ = deduplicate_with_report([updated], index=index)
+    assert unique == [updated]
+
+
+def test_compact_removes_stale_entries(tmp_path):
+    index = _index(tmp_path)
+    past = datetime.utcnow() - timedelta(days=400)
+    with patch.object(dedupIndex, "datetime", wraps=datetime) as fake:
+        fake.utcnow.return_value = past
+        deduplicate_with_report([_item("https://a.com/old")], index=index)
+        index.commit()
+    deduplicate_with_report([_item("https://b.com/new", body="fresh text " * 10)], index=index)
+    index.commit()
+
+    removed = index.compact(max_age_days=180)
+    assert removed["dedup_urls"] == 1
+    assert index.stats()["dedup_urls"] == 1
+    assert index.stats()["dedup_bands"] == index.stats()["dedup_signatures"] * index.bands
+
+
+def test_reopen_is_fast(tmp_path):
+    index = _index(tmp_path)
+    for i in range(2000):
+        index.stage(f"https://a.com/{i}", f"https://a.com/{i}", f"h{i}")
+    index.commit()
+    started = time.perf_counter()
+    _index(tmp_path)
+    assert time.perf_counter() - started < 0.5
+
+
+def test_recrawled_ids_only_previous_run_urls(tmp_path):
+    index = _index(tmp_path)
+    deduplicate_with_report([_item("https://a.com/x")], index=index)
+    index.commit()
+
+    items, _ = deduplicate_with_report(
+        [_item("https://a.com/x?utm_source=rss", body=BODY + " updated"), _item("https://b.com/y", body="new")],
+        index=index,
+    )
+    assert recrawled_ids(items, index) == {"https://a.com/x?utm_source=rss"}
@@ -63,3 +63,51 @@ def test_deduplicate_keeps_unique():
 
 def test_deduplicate_empty():
     assert deduplicate([]) == []
+
+
+# ── near-duplicate (MinHash-LSH) ───────────────────────
+
+ARTICLE = (
+    "The studio rebuilt the brand identity around a custom variable typeface, "
+    "a restrained monochrome palette and a modular grid that scales from packaging "
+    "to the new ecommerce storefront launched this spring"
+)
+
+
+def test_near_duplicate_folded_into_canonical():
+    from moduleA.preprocess.deduplicate import deduplicate_with_report
+    items = [
+        {"id": "1", "source_url": "https://a.com/x", "title": "Rebrand", "body_text": ARTICLE},
+        {"id": "2", "source_url": "https://b.com/x?utm=rss", "title": "Rebrand",
+         "body_text": ARTICLE + " — by Jane Doe, syndicated"},
+        {"id": "3", "source_url": "https://c.com/y", "title": "Other",
+         "body_text": "A completely different story about restaurant signage and menu design systems in Seoul"},
+    ]
+    unique, dropped = deduplicate_with_report(items, threshold=0.7)
+    assert [i["id"] for i in unique] == ["1", "3"]
+    assert dropped[0]["canonical_id"] == "1" and dropped[0]["reason"] == "near_duplicate"
+    assert dropped[0]["similarity"] >= 0.7
+
+
+def test_near_duplicate_mode_off_by_default():
+    items = [
+        {"source_url": "https://a.com/x", "body_text": ARTICLE},
+        {"source_url": "https://b.com/x", "body_text": ARTICLE + " syndicated"},
+    ]
+    assert len(deduplicate(items)) == 2
+
+
+def test_source_url_and_body_text_used():
+    items = [
+        {"source_url": "https://a.com/x", "title": "T", "body_text": "one"},
+        {"source_url": "https://a.com/x", "title": "T", "body_text": "two"},
+    ]
+    assert len(deduplicate(items)) == 1
+
+
+def test_minhash_similarity_tracks_jaccard():
+    from moduleA.preprocess.minhash import MinHasher, jaccard_estimate, shingle_hashes, tokenize
+    hasher = MinHasher()
+    a = hasher.signature(shingle_hashes(tokenize(ARTICLE)))
+    b = hasher.signature(shingle_hashes(tokenize(ARTICLE.replace("spring", "autumn"))))
+    assert 0.8 < jaccard_estimate(a, b) < 1.0
@@ -0,0 +1,234 @@
+"""
+tests/test_documentChunker.py
+
+토큰 기준 청킹 단위 테스트 (근사 토크나이저 / 공백 포함 토큰 토크나이저).
+"""
+
+import sys, os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import random
+import re
+
+import pytest
+
+from moduleA.chunker import documentChunker
+from moduleA.chunker.documentChunker import (
+    chunk_item, chunk_report, cdc_spans, split_spans, structure_spans, _ApproxTokenizer,
+    CHUNK_TOKENS, CDC_MAX_TOKENS, MIN_CHUNK_TOKENS, STRUCT_MAX_TOKENS,
+)
+
+EN = " ".join(["The new packaging system uses recycled paper and a bold typographic identity."] * 30)
+KO = " ".join(["미니멀 패키징 트렌드가 2026년 뷰티 브랜드에서 빠르게 확산되고 있다."] * 30)
+CJK = "新的包装设计使用再生纸" * 60
+
+
+class _SpacePrefixTokenizer:
+    """tiktoken처럼 앞 공백이 토큰에 붙는 토크나이저"""
+    name = "space-prefix"
+    _re = re.compile(r"\s*\S{1,4}")
+
+    def offsets(self, text):
+        return [m.start() for m in self._re.finditer(text)]
+
+    def count(self, text):
+        return len(self._re.findall(text))
+
+
+@pytest.fixture(params=[_ApproxTokenizer(), _SpacePrefixTokenizer()], ids=lambda t: t.name)
+def tokenizer(request):
+    return request.param
+
+
+@pytest.mark.parametrize("text", [EN, KO, CJK, EN + "\n\n" + CJK + " " + KO])
+def test_spans_respect_budget_and_boundaries(text, tokenizer):
+    spans = split_spans(text, tokenizer=tokenizer)
+    assert len(spans) > 1
+    prev_start = -1
+    for span in spans:
+        chunk = text[span.start:span.end]
+        assert chunk == chunk.strip() and chunk
+        assert span.token_count == tokenizer.count(chunk) <= CHUNK_TOKENS
+        assert span.start > prev_start
+        prev_start = span.start
+        # 공백 없는 구간 안이 아니면 단어 중간에서 시작 / 끝나지 않음
+        if span.start > 0 and text[span.start - 1] not in " \n" and text[span.start] not in CJK:
+            pytest.fail(f"mid-word start: {chunk[:20]!r}")
+    assert spans[-1].end == len(text.rstrip())
+
+
+def test_last_window_not_mostly_overlap(tokenizer):
+    for extra in range(1, 30):
+        text = _article(3, sentences=20) + " " + " ".join(["tail"] * extra) + "."
+        spans = split_spans(text, tokenizer=tokenizer)
+        if len(spans) > 1:
+            new = text[spans[-2].end:spans[-1].end]
+            assert tokenizer.count(new) >= MIN_CHUNK_TOKENS
+            assert all(s.token_count <= CHUNK_TOKENS for s in spans)
+
+
+def test_sentence_boundaries_preferred():
+    spans = split_spans(EN, tokenizer=_ApproxTokenizer())
+    assert all(EN[s.end - 1] == "." for s in spans)
+
+
+def test_chunks_overlap():
+    spans = split_spans(EN, tokenizer=_ApproxTokenizer())
+    assert all(b.start < a.end for a, b in zip(spans, spans[1:]))
+
+
+def test_short_text_dropped_and_bad_overlap_rejected():
+    assert split_spans("short text", tokenizer=_ApproxTokenizer()) == []
+    with pytest.raises(ValueError):
+        split_spans(EN, max_tokens=10, overlap=10)
+
+
+def test_chunk_item_token_mode(monkeypatch):
+    monkeypatch.setattr(documentChunker, "get_tokenizer", lambda model=None: _ApproxTokenizer())
+    item = {"id": "r1", "title": "Title", "body_text": EN}
+    chunks = chunk_item(item, mode="tokens")
+    full_text = f"Title {EN}"
+    assert [c["chunk_index"] for c in chunks] == list(range(len(chunks)))
+    for c in chunks:
+        assert c["chunk_text"] == full_text[c["char_start"]:c["char_end"]]
+        assert c["token_count"] > 0
+
+
+def test_chunk_item_chars_mode_unchanged():
+    chunks = chunk_item({"id": "r1", "title": "", "body_text": "x" * 900}, mode="chars")
+    assert [len(c["chunk_text"]) for c in chunks] == [500, 500, 300]
+    assert "token_count" not in chunks[0]
+
+
+# ── content-defined (cdc) ──────────────────────────────
+
+VOCAB = (
+    "the new packaging system uses recycled paper and a bold typographic identity brand "
+    "color minimal design trend retail store launch campaign spring collection fabric texture"
+).split()
+
+
+def _article(seed, sentences=80):
+    rng = random.Random(seed)
+    return " ".join(
+        " ".join(rng.choice(VOCAB) for _ in range(rng.randint(8, 20))) + "."
+        for _ in range(sentences)
+    )
+
+
+@pytest.mark.parametrize("text", [_article(0), KO, CJK, EN + "\n\n" + CJK + " " + KO])
+def test_cdc_spans_cover_text_within_limits(text, tokenizer):
+    spans = cdc_spans(text, tokenizer=tokenizer)
+    assert spans[0].start == 0 and spans[-1].end == len(text)
+    for a, b in zip(spans, spans[1:]):
+        assert not text[a.end:b.start].strip()          # 오버랩 / 누락 없음
+    for span in spans:
+        chunk = text[span.start:span.end]
+        assert chunk == chunk.strip()
+        assert span.token_count == tokenizer.count(chunk)
+        assert MIN_CHUNK_TOKENS <= span.token_count <= CDC_MAX_TOKENS
+
+
+@pytest.mark.parametrize("max_tokens", [CDC_MAX_TOKENS, 60])
+def test_cdc_short_tail_never_exceeds_max_tokens(max_tokens, tokenizer):
+    for seed in range(200):
+        text = _article(seed, sentences=random.Random(seed).randint(3, 40))
+        spans = cdc_spans(text, min_tokens=max_tokens // 3, max_tokens=max_tokens, tokenizer=tokenizer)
+        assert spans[-1].end == len(text)
+        assert all(MIN_CHUNK_TOKENS <= span.token_count <= max_tokens for span in spans)
+
+
+def test_cdc_insert_only_invalidates_nearby_chunks():
+    tokenizer = _ApproxTokenizer()
+    reused = {"cdc": 0, "tokens": 0}
+    totals = {"cdc": 0, "tokens": 0}
+    for seed in range(10):
+        text = _article(seed)
+        cut = text.index(".", 300) + 1
+        edited = text[:cut] + " An entirely new sentence was inserted here." + text[cut:]
+        for mode, fn in (("cdc", cdc_spans), ("tokens", split_spans)):
+            before = {text[s.start:s.end] for s in fn(text, tokenizer=tokenizer)}
+            after = [edited[s.start:s.end] for s in fn(edited, tokenizer=tokenizer)]
+            reused[mode] += sum(chunk in before for chunk in after)
+            totals[mode] += len(after)
+    assert reused["cdc"] / totals["cdc"] > 0.8
+    assert reused["cdc"] / totals["cdc"] > reused["tokens"] / totals["tokens"]
+
+
+def test_chunk_item_cdc_mode(monkeypatch):
+    monkeypatch.setattr(documentChunker, "get_tokenizer", lambda model=None: _ApproxTokenizer())
+    item = {"id": "r1", "title": "Title", "body_text": _article(1)}
+    full_text = f"Title {item['body_text']}"
+    chunks = chunk_item(item, mode="cdc")
+    assert " ".join(c["chunk_text"] for c in chunks) == full_text
+
+
+# ── structure ──────────────────────────────────────────
+
+def _sectioned(seed, sections=4):
+    rng = random.Random(seed)
+    return "\n\n".join(
+        f"Section heading {i}\n\n" + "\n\n".join(_article(rng.random(), rng.randint(2, 9)) for _ in range(3))
+        for i in range(sections)
+    )
+
+
+def test_structure_spans_follow_sections(tokenizer):
+    text = "Article title\n\n" + _sectioned(0)
+    spans = structure_spans(text, tokenizer=tokenizer)
+    for a, b in zip(spans, spans[1:]):
+        assert not text[a.end:b.start].strip()          # 오버랩 / 누락 없음
+    assert spans[0].start == 0 and spans[-1].end == len(text)
+    for span in spans:
+        chunk = text[span.start:span.end]
+        assert span.token_count == tokenizer.count(chunk) <= STRUCT_MAX_TOKENS
+        assert chunk.count("Section heading") <= 1
+        if "Section heading" in chunk:
+            assert chunk.startswith(("Section heading", "Article title"))   # 섹션 중간에서 시작하지 않음
+        assert not chunk.endswith(tuple(f"Section heading {i}" for i in range(4)))   # 제목만 남지 않음
+
+
+def test_structure_oversized_paragraph_and_unspaced_text(tokenizer):
+    for text in (EN, CJK, "Heading\n\n" + KO):
+        spans = structure_spans(text, tokenizer=tokenizer)
+        assert len(spans) > 1 and spans[-1].end == len(text)
+        assert all(MIN_CHUNK_TOKENS <= s.token_count <= STRUCT_MAX_TOKENS for s in spans)
+    assert structure_spans("short text", tokenizer=_ApproxTokenizer()) == []
+
+
+def test_structure_edit_only_invalidates_its_section():
+    tokenizer = _ApproxTokenizer()
+    text = _sectioned(5, sections=6)
+    cut = text.index("Section heading 1")
+    cut = text.index(".", cut) + 1
+    edited = text[:cut] + " An entirely new sentence was inserted here." + text[cut:]
+    before = {text[s.start:s.end] for s in structure_spans(text, tokenizer=tokenizer)}
+    after = [edited[s.start:s.end] for s in structure_spans(edited, tokenizer=tokenizer)]
+    changed = [chunk for chunk in after if chunk not in before]
+    assert changed and all(
+        edited.index(chunk) < edited.index("Section heading 2") for chunk in changed
+    )
+
+
+def test_chunk_item_defaults_to_structure(monkeypatch):
+    monkeypatch.setattr(documentChunker, "get_tokenizer", lambda model=None: _ApproxTokenizer())
+    item = {"id": "r1", "title": "Title", "body_text": _sectioned(2)}
+    full_text = f"Title\n\n{item['body_text']}"
+    chunks = chunk_item(item)
+    assert chunks[0]["chunk_text"].startswith("Title\n\nSection heading 0")
+    for c in chunks:
+        assert c["chunk_text"] == full_text[c["char_start"]:c["char_end"]]
+
+
+def test_chunk_report_fill_ratio():
+    chunks = [
+        {"reference_id": "a", "token_count": STRUCT_MAX_TOKENS},
+        {"reference_id": "a", "token_count": STRUCT_MAX_TOKENS // 2},
+        {"reference_id": "b", "token_count": STRUCT_MAX_TOKENS // 4},
+    ]
+    report = chunk_report(chunks, mode="structure")
+    assert report == {
+        "references": 2, "chunks": 3, "chunks_per_reference": 1.5,
+        "max_chunks_per_reference": 2, "fill_ratio": 0.583,
+    }
+    assert chunk_report([])["fill_ratio"] == 0.0
@@ -0,0 +1,49 @@
+"""
+tests/test_embeddingStore.py
+
+로컬 content-addressed 임베딩 저장소 (SQLite + LRU) 단위 테스트.
+"""
+
+import sys, os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import numpy as np
+
+from common.utils.hashUtils import generate_embedding_hash
+from moduleA.embedder.embeddingStore import EmbeddingStore
+
+
+def test_round_trip_float32():
+    store = EmbeddingStore(":memory:")
+    store.put_many({"a": [0.1, 0.2, 0.3]}, "m")
+    found = store.get_many(["a", "b"])
+    assert list(found) == ["a"]
+    assert found["a"].dtype == np.float32
+    assert found["a"].tolist() == np.float32([0.1, 0.2, 0.3]).tolist()
+
+
+def test_persists_across_instances_and_tracks_hits(tmp_path):
+    path = str(tmp_path / "emb.db")
+    key = generate_embedding_hash("hello", "text-embedding-3-small")
+    EmbeddingStore(path).put_many({key: np.ones(4)}, "text-embedding-3-small")
+
+    store = EmbeddingStore(path)
+    assert store.get_many([key, key])[key].tolist() == [1.0] * 4
+    store.get_many([key, "missing"])
+    assert store.stats() == {"stored": 1, "hot": 1, "memory_hits": 1, "disk_hits": 1, "misses": 1}
+
+
+def test_hot_set_is_lru_bounded():
+    store = EmbeddingStore(":memory:", hot_set_size=2)
+    store.put_many({"a": [1.0], "b": [2.0]}, "m")
+    store.get_many(["a"])                          # a 최근 사용 → b가 가장 오래됨
+    store.put_many({"c": [3.0]}, "m")
+    assert store.stats()["hot"] == 2
+    store.get_many(["a", "b", "c"])
+    stats = store.stats()
+    assert stats["disk_hits"] == 1                 # b만 디스크에서
+    assert stats["memory_hits"] == 3
+
+
+def test_key_depends_on_model():
+    assert generate_embedding_hash("x", "model-a") != generate_embedding_hash("x", "model-b")
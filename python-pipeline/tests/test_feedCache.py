@@ -0,0 +1,41 @@
+"""
+tests/test_feedCache.py
+
+feedCache(ValidatorCache) 단위 테스트.
+"""
+
+import sys, os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from moduleA.collectors.feedCache import ValidatorCache
+
+
+URL = "https://a.com/feed"
+
+
+def test_headers_empty_without_cache(tmp_path):
+    cache = ValidatorCache(str(tmp_path / "v.json"))
+    assert cache.headers_for(URL) == {}
+
+
+def test_record_is_staged_until_commit(tmp_path):
+    path = str(tmp_path / "v.json")
+    cache = ValidatorCache(path)
+    cache.record(URL, {"etag": '"abc"', "last-modified": "Tue, 01 Jan 2030 00:00:00 GMT"})
+
+    # commit 전에는 다른 인스턴스에서 보이지 않음
+    assert ValidatorCache(path).headers_for(URL) == {}
+
+    cache.commit()
+    headers = ValidatorCache(path).headers_for(URL)
+    assert headers["If-None-Match"] == '"abc"'
+    assert headers["If-Modified-Since"] == "Tue, 01 Jan 2030 00:00:00 GMT"
+
+
+def test_rollback_discards_pending(tmp_path):
+    path = str(tmp_path / "v.json")
+    cache = ValidatorCache(path)
+    cache.record(URL, {"etag": '"abc"'})
+    cache.rollback()
+    cache.commit()
+    assert ValidatorCache(path).headers_for(URL) == {}
@@ -0,0 +1,61 @@
+"""
+tests/test_feedFetcher.py
+
+feedFetcher 단위 테스트.
+실제 네트워크 호출은 mock으로 대체.
+"""
+
+import gzip
+import time
+import sys, os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from unittest.mock import patch
+from moduleA.collectors import feedFetcher
+from moduleA.collectors.feedFetcher import fetch_all, _interleave_by_host, _decode_body
+
+
+# ── _interleave_by_host ────────────────────────────────
+
+def test_interleave_round_robin():
+    urls = [
+        "https://a.com/1", "https://a.com/2", "https://a.com/3",
+        "https://b.com/1",
+    ]
+    assert _interleave_by_host(urls) == [
+        "https://a.com/1", "https://b.com/1", "https://a.com/2", "https://a.com/3",
+    ]
+
+
+# ── _decode_body ───────────────────────────────────────
+
+def test_decode_body_gzip():
+    assert _decode_body(gzip.compress(b"<rss/>"), "gzip") == b"<rss/>"
+
+
+def test_decode_body_identity():
+    assert _decode_body(b"<rss/>", None) == b"<rss/>"
+
+
+# ── fetch_all ──────────────────────────────────────────
+
+def _fake_fetch(url, connect_timeout, read_deadline, headers=None):
+    if "slow" in url:
+        time.sleep(1.0)
+    return {"url": url, "status": 200, "body": b"<rss/>", "headers": {},
+            "latency_ms": 1, "error": None}
+
+
+@patch.object(feedFetcher, "fetch_one", side_effect=_fake_fetch)
+def test_fetch_all_returns_every_url(_mock):
+    urls = ["https://a.com/feed", "https://b.com/feed"]
+    results = fetch_all(urls)
+    assert set(results) == set(urls)
+    assert all(r["error"] is None for r in results.values())
+
+
+@patch.object(feedFetcher, "fetch_one", side_effect=_fake_fetch)
+def test_fetch_all_total_budget(_mock):
+    results = fetch_all(["https://a.com/feed", "https://slow.com/feed"], total_budget=0.3)
+    assert results["https://a.com/feed"]["error"] is None
+    assert results["https://slow.com/feed"]["error"] == "collection budget exceeded"
@@ -0,0 +1,45 @@
+"""
+tests/test_feedParser.py
+
+feedParser 단위 테스트 (로컬 RSS 문자열, 네트워크 없음).
+"""
+
+import sys, os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from moduleA.collectors.feedParser import parse_compact, FeedParsePool, ENTRY_FIELDS
+
+
+def _rss(n: int) -> bytes:
+    items = "".join(
+        f"<item><title>T{i}</title><link>https://a.com/{i}</link>"
+        f"<guid>g{i}</guid><description>body {i}</description></item>"
+        for i in range(n)
+    )
+    return f'<?xml version="1.0"?><rss version="2.0"><channel><title>f</title>{items}</channel></rss>'.encode()
+
+
+def test_parse_compact_fields_only():
+    feed = parse_compact(_rss(3))
+    assert feed["bozo"] is False
+    assert len(feed["entries"]) == 3
+    assert set(feed["entries"][0]) == set(ENTRY_FIELDS)
+    assert feed["entries"][0]["link"] == "https://a.com/0"
+
+
+def test_parse_compact_max_entries():
+    assert len(parse_compact(_rss(5), max_entries=2)["entries"]) == 2
+
+
+def test_pool_inline_and_process_paths():
+    small, large = _rss(2), _rss(50)
+    with FeedParsePool(max_entries=10, max_workers=1, min_bytes=len(large)) as parser:
+        parser.submit({"url": "small", "body": small, "headers": {}})
+        parser.submit({"url": "large", "body": large, "headers": {}})
+        parser.submit({"url": "not-modified", "body": None, "headers": {}})
+        parsed = parser.drain()
+
+    assert len(parsed["small"]["entries"]) == 2
+    assert len(parsed["large"]["entries"]) == 10
+    assert "not-modified" not in parsed
+    assert parser._executor._mp_context.get_start_method() != "fork"
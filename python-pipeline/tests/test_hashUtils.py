@@ -0,0 +1,69 @@
+"""
+tests/test_hashUtils.py
+
+hashUtils 단위 테스트 (canonical 인코딩 호환성 / digest 백엔드 / item 해시 메모).
+"""
+
+import sys, os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import hashlib
+import json
+
+import pytest
+
+from common.utils import hashUtils
+from common.utils.hashUtils import (
+    canonical_encode, digest, fast_digest, hash_from_fields, hash_many,
+    item_content_hash, register_digest, sha256_hash, generate_embedding_hash,
+)
+
+
+def _legacy(fields):
+    return json.dumps(fields, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+
+
+@pytest.mark.parametrize("fields", [
+    {},
+    {"b": "x", "a": "y"},
+    {"title": "한글 \"따옴표\" \\ \n\t  😀", "summary": ""},
+    {"n": 3, "f": 0.1, "big": 1e300, "neg": -2.5e-10, "t": True, "no": False, "none": None},
+    {"nested": {"b": 1, "a": [1, 2]}, "s": "x"},
+    {"nan": float("nan")},
+])
+def test_canonical_encode_matches_json_dumps(fields):
+    assert canonical_encode(fields) == _legacy(fields)
+
+
+def test_hash_from_fields_unchanged():
+    fields = {"model": "text-embedding-3-small", "text": "hello"}
+    assert hash_from_fields(fields) == hashlib.sha256(_legacy(fields).encode("utf-8")).hexdigest()
+    assert generate_embedding_hash(" hello ", "text-embedding-3-small") == hash_from_fields(fields)
+
+
+def test_digest_backends(monkeypatch):
+    assert digest("abc") == sha256_hash("abc")
+    assert fast_digest("abc") == hashlib.blake2b(b"abc", digest_size=16).hexdigest()
+    assert fast_digest(b"abc") == fast_digest("abc")
+    monkeypatch.setattr(hashUtils, "DIGESTS", dict(hashUtils.DIGESTS))
+    register_digest("md5", lambda data: hashlib.md5(data).hexdigest())
+    assert hash_from_fields({"a": 1}, algo="md5") == hashlib.md5(b'{"a":1}').hexdigest()
+    with pytest.raises(ValueError):
+        digest("abc", algo="nope")
+
+
+def test_hash_many_matches_single_and_keeps_order():
+    values = ["a", "b", "a", "", "한글"]
+    assert hash_many(values) == [sha256_hash(v) for v in values]
+    assert hash_many(values, algo="blake2b") == [fast_digest(v) for v in values]
+
+
+def test_item_content_hash_memoized_and_invalidated():
+    item = {"title": " Title ", "body_text": "Body"}
+    h = item_content_hash(item)
+    assert h == sha256_hash("Title Body")
+    assert item_content_hash(item) is h
+
+    item["body_text"] = "Changed"
+    assert item_content_hash(item) == sha256_hash("Title Changed")
+    assert item_content_hash({"title": ""}) is None
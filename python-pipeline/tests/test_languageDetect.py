@@ -0,0 +1,64 @@
+"""
+tests/test_languageDetect.py
+
+배치 언어 감지 단위 테스트 (문자 체계 fast path / 모델 fallback / 캐시).
+"""
+
+import sys, os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from common.utils import languageDetect
+from common.utils.languageDetect import (
+    LanguageCache, detect_languages, detect_items_language, script_language,
+)
+
+EN = "The new packaging system uses recycled paper and a bold typographic identity for the brand."
+KO = "미니멀 packaging 트렌드가 2026년 뷰티 브랜드에서 확산되고 있다"
+JA = "新しいパッケージデザインは再生紙を使用しています"
+FR = "La nouvelle identité de la marque utilise un papier recyclé et une typographie audacieuse."
+
+
+def test_script_fast_path():
+    assert script_language(EN) == "en"
+    assert script_language(KO) == "ko"
+    assert script_language(JA) == "ja"
+    assert script_language("12345 !!") is None
+    # 라틴 비영어 / 한자만 / 짧은 텍스트는 모델로
+    for text in (FR, "新的包装设计使用再生纸", "Nike Air Max"):
+        assert script_language(text) is languageDetect._AMBIGUOUS
+
+
+def test_batch_uses_model_only_for_ambiguous_and_caches(monkeypatch):
+    calls = []
+    real = languageDetect._model_chunk
+    monkeypatch.setattr(languageDetect, "_model_chunk", lambda texts: calls.extend(texts) or real(texts))
+    cache = LanguageCache(":memory:")
+
+    stats = {}
+    langs = detect_languages([EN, KO, JA, FR, FR, "", None, "!!"], cache=cache, stats=stats)
+    assert langs == ["en", "ko", "ja", "fr", "fr", None, None, None]
+    assert calls == [FR]
+    assert stats == {"cached": 0, "script": 4, "model": 1}
+
+    stats = {}
+    assert detect_languages([FR, EN], cache=cache, stats=stats) == ["fr", "en"]
+    assert calls == [FR] and stats["cached"] == 2
+
+
+def test_cache_persists_across_instances(tmp_path):
+    path = str(tmp_path / "lang.db")
+    detect_languages([FR], cache=LanguageCache(path))
+    stats = {}
+    assert detect_languages([FR], cache=LanguageCache(path), stats=stats) == ["fr"]
+    assert stats["cached"] == 1
+
+
+def test_only_prefix_is_used():
+    long_text = " ".join([EN] * 6) + " " + "Le texte français " * 200
+    assert detect_languages([long_text], cache=LanguageCache(":memory:")) == ["en"]
+
+
+def test_detect_items_language_sets_field():
+    items = [{"title": "", "body_text": KO}, {"title": EN}, {"title": None}]
+    detect_items_language(items, cache=LanguageCache(":memory:"))
+    assert [i["language"] for i in items] == ["ko", "en", None]
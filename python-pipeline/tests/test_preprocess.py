@@ -0,0 +1,59 @@
+"""
+tests/test_preprocess.py
+
+스트리밍 preprocess 단위 테스트 (JSON 배열 원소 디코딩 / JSONL / 출력 JSONL).
+"""
+
+import sys, os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import io
+import json
+
+import pytest
+
+from moduleA.preprocess.preprocess import iter_json_values, run_preprocess
+
+
+def _raw(i):
+    return {"url": f"https://example.com/{i}", "title": f"title {i} 한글", "content": "x" * (i % 50), "likes": i}
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, 1 << 16])
+def test_iter_json_values_array_matches_json_load(chunk_size):
+    data = [_raw(i) for i in range(30)] + [12345, 1.5e3, "s", None, [1, [2]], {"nested": {"a": [1, 2]}}]
+    text = json.dumps(data, ensure_ascii=False, indent=2)
+    assert list(iter_json_values(io.StringIO(text), chunk_size=chunk_size)) == data
+
+
+def test_iter_json_values_single_object_and_concatenated_values():
+    assert list(iter_json_values(io.StringIO('{"a": 1}'), chunk_size=3)) == [{"a": 1}]
+    assert list(iter_json_values(io.StringIO('{"a": 1}\n{"b": 2}\n'), chunk_size=3)) == [{"a": 1}, {"b": 2}]
+    assert list(iter_json_values(io.StringIO("  [ ]  "))) == []
+
+
+def test_iter_json_values_truncated_raises():
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_json_values(io.StringIO('[{"a": 1}, {"b": '), chunk_size=4))
+
+
+def test_run_preprocess_streams_json_and_jsonl(tmp_path):
+    raw = tmp_path / "raw"
+    (raw / "news").mkdir(parents=True)
+    (raw / "pinterest").mkdir()
+    (raw / "news" / "a.json").write_text(json.dumps([_raw(i) for i in range(5)]), encoding="utf-8")
+    (raw / "news" / "b.json").write_text('[{"url": "u"}, {"broken": ', encoding="utf-8")
+    (raw / "pinterest" / "c.jsonl").write_text(
+        "\n".join([json.dumps(_raw(10)), "{not json", "", json.dumps(_raw(11)), "7"]), encoding="utf-8"
+    )
+
+    stats = run_preprocess(raw_dir=str(raw), output_dir=str(tmp_path / "out"), progress_every=2)
+
+    with open(stats["output"], encoding="utf-8") as f:
+        rows = [json.loads(line) for line in f]
+    assert stats["output"].endswith(".jsonl") and not os.path.exists(stats["output"] + ".part")
+    assert [r["source"] for r in rows] == ["news"] * 6 + ["pinterest"] * 2
+    assert rows[0]["title"] == "title 0 한글" and rows[0]["meta"]["likes"] == 0
+    assert rows[5]["source_url"] == "u"
+    assert stats["files"] == 3 and stats["items"] == 8
+    assert stats["errors"] == 2 and stats["skipped"] == 1
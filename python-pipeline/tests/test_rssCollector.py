@@ -0,0 +1,90 @@
+"""
+tests/test_rssCollector.py
+
+rss / visual 수집 결과의 schedule / circuit breaker 반영 테스트 (네트워크 없음).
+"""
+
+import sys, os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from common.config.sourceCatalog import SourceCatalog, SourceRecord
+from common.enums.signalType import SignalStage
+from moduleA.collectors import rssCollector, visualTrendCollector
+from moduleA.collectors.circuitBreaker import CircuitBreaker
+from moduleA.collectors.feedCache import ValidatorCache
+from moduleA.collectors.feedFetcher import BUDGET_EXCEEDED
+from moduleA.collectors.sourceSchedule import SourceSchedule
+
+OK_URL = "https://ok.com/feed"
+SLOW_URL = "https://slow.com/feed"
+
+
+def _record(url, group):
+    return SourceRecord(
+        id=url, name=url, url=url, host=url.split("/")[2], group=group,
+        stage=list(SignalStage)[0], priority=2, category=None, language="en",
+        domain="fashion", geography=None, enabled=True,
+    )
+
+
+def _patch(monkeypatch, module, tmp_path, group, fetched, parsed):
+    breaker = CircuitBreaker(str(tmp_path / "breakers.json"))
+    schedule = SourceSchedule(str(tmp_path / "schedule.json"))
+
+    class _Parser:
+        def __init__(self, **kwargs):
+            pass
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            pass
+
+        def submit(self, result):
+            pass
+
+        def drain(self):
+            return parsed
+
+    catalog = SourceCatalog([_record(url, group) for url in fetched])
+    monkeypatch.setattr(module, "get_source_catalog", lambda: catalog)
+    monkeypatch.setattr(module, "get_circuit_breaker", lambda: breaker)
+    monkeypatch.setattr(module, "get_source_schedule", lambda: schedule)
+    monkeypatch.setattr(module, "get_validator_cache", lambda: ValidatorCache(str(tmp_path / "validators.json")))
+    monkeypatch.setattr(module, "FeedParsePool", _Parser)
+    monkeypatch.setattr(module, "fetch_all", lambda urls, **kwargs: {url: fetched[url] for url in urls})
+    return breaker, schedule
+
+
+def _result(url, error=None, status=200):
+    return {"url": url, "status": status, "body": None, "headers": {}, "latency_ms": 5, "error": error}
+
+
+def _feed(n, bozo=False):
+    entries = [{"id": str(i), "link": f"https://ok.com/{i}", "title": "t", "summary": "s", "published": ""} for i in range(n)]
+    return {"bozo": bozo, "bozo_exception": None, "entries": entries}
+
+
+def test_budget_exceeded_does_not_feed_breaker_or_schedule(tmp_path, monkeypatch):
+    fetched = {OK_URL: _result(OK_URL), SLOW_URL: _result(SLOW_URL, error=BUDGET_EXCEEDED)}
+    breaker, schedule = _patch(monkeypatch, rssCollector, tmp_path, "rss", fetched, {OK_URL: _feed(5)})
+
+    for _ in range(5):
+        _, logs = rssCollector.collect_rss("run", only_new=False, respect_schedule=False)
+
+    slow = next(log for log in logs if log["source_url"] == SLOW_URL)
+    assert slow["crawl_status"] == "blocked" and slow["breaker_state"] == "closed"
+    assert breaker.get(SLOW_URL) == {} and schedule.next_due(SLOW_URL) is None
+    assert schedule.next_due(OK_URL) is not None
+
+
+def test_visual_classifies_empty_feed_as_blocked(tmp_path, monkeypatch):
+    fetched = {OK_URL: _result(OK_URL)}
+    breaker, _ = _patch(monkeypatch, visualTrendCollector, tmp_path, "visual", fetched, {OK_URL: _feed(0, bozo=True)})
+
+    for _ in range(3):
+        rows = visualTrendCollector.collect_visual_trends("run", only_new=False, respect_schedule=False)
+
+    assert rows == []
+    assert breaker.state_of(OK_URL) == "open"
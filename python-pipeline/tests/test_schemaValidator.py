@@ -0,0 +1,114 @@
+"""
+tests/test_schemaValidator.py
+
+SchemaRegistry 컴파일 캐시 / 배치 검증 / fast path 단위 테스트.
+"""
+
+import sys, os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import json
+import uuid
+
+import pytest
+
+from moduleA.preprocess import schemaValidator
+from moduleA.preprocess.schemaValidator import SchemaRegistry, RAW_SCHEMA, validate_items
+
+
+def _raw_item(**overrides):
+    item = {
+        "id": str(uuid.uuid4()),
+        "run_id": str(uuid.uuid4()),
+        "source_name": "Dezeen",
+        "source_url": "https://example.com/a",
+        "title": "minimal packaging",
+        "body_text": "Body text.",
+        "industry": "fashion",
+        "domain": "brand",
+        "tags": [],
+        "crawl_status": "success",
+        "language": "en",
+        "priority": "high",
+        "collected_at": "2026-01-01T00:00:00",
+    }
+    item.update(overrides)
+    return item
+
+
+def test_all_repo_schemas_compile():
+    registry = SchemaRegistry()
+    for name in registry.names():
+        registry.validator(name)
+    assert RAW_SCHEMA in registry.names()
+
+
+def test_schema_file_read_once(monkeypatch):
+    registry = SchemaRegistry()
+    opened = []
+    real_open = open
+
+    def counting_open(path, *args, **kwargs):
+        opened.append(path)
+        return real_open(path, *args, **kwargs)
+
+    monkeypatch.setattr("builtins.open", counting_open)
+    for _ in range(3):
+        registry.validate_batch([_raw_item()], RAW_SCHEMA)
+    assert len([p for p in opened if p.endswith(RAW_SCHEMA)]) == 1
+
+
+def test_batch_collects_all_errors_without_raising():
+    items = [
+        _raw_item(),
+        _raw_item(title=3, crawl_status="unknown", tags=[1]),
+        {"id": "x"},
+    ]
+    valid, failed = SchemaRegistry().validate_batch(items, RAW_SCHEMA)
+
+    assert valid == [items[0]]
+    assert [f["index"] for f in failed] == [1, 2]
+    paths = {e["path"] for e in failed[0]["errors"]}
+    assert paths == {"title", "crawl_status", "tags/0"}
+    assert len(failed[1]["errors"]) == 5     # required 필드 5개 누락
+
+
+def test_fast_path_checks_required_and_top_level_types_only():
+    registry = SchemaRegistry()
+    items = [
+        _raw_item(crawl_status="unknown"),         # enum → fast path에서는 통과
+        _raw_item(title=None),
+        _raw_item(industry=None),                  # ["string", "null"]
+        {k: v for k, v in _raw_item().items() if k != "body_text"},
+        _raw_item(title=True, body_text=1),
+    ]
+    valid, failed = registry.validate_batch(items, RAW_SCHEMA, fast=True)
+
+    assert valid == [items[0], items[2]]
+    assert [f["index"] for f in failed] == [1, 3, 4]
+    assert failed[1]["errors"][0]["message"] == "'body_text' is a required property"
+    assert {e["path"] for e in failed[2]["errors"]} == {"title", "body_text"}
+
+
+def test_fast_path_rejects_bool_as_number(tmp_path):
+    schema = {"type": "object", "required": ["n"], "properties": {"n": {"type": "number"}}}
+    (tmp_path / "n.schema.json").write_text(json.dumps(schema))
+    registry = SchemaRegistry(str(tmp_path))
+
+    valid, failed = registry.validate_batch([{"n": 1.5}, {"n": True}], "n.schema.json", fast=True)
+    assert valid == [{"n": 1.5}] and failed[0]["index"] == 1
+
+
+def test_invalid_schema_and_missing_file_raise(tmp_path):
+    (tmp_path / "bad.schema.json").write_text(json.dumps({"type": 12}))
+    registry = SchemaRegistry(str(tmp_path))
+    with pytest.raises(Exception):
+        registry.validator("bad.schema.json")
+    with pytest.raises(FileNotFoundError):
+        registry.validator("missing.schema.json")
+
+
+def test_validate_items_keeps_legacy_contract(monkeypatch):
+    monkeypatch.setattr(schemaValidator, "_registry", None)
+    items = [_raw_item(), _raw_item(title=1)]
+    assert validate_items(items, RAW_SCHEMA) == [items[0]]
@@ -0,0 +1,55 @@
+"""
+tests/test_seenIndex.py
+
+seenIndex 단위 테스트 (임시 SQLite 파일 사용).
+"""
+
+import sys, os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from moduleA.collectors.seenIndex import SeenIndex, entry_key
+
+
+def _entry(link, title="T", summary="S", guid=None):
+    e = {"link": link, "title": title, "summary": summary}
+    if guid:
+        e["id"] = guid
+    return e
+
+
+def test_entry_key_prefers_guid():
+    assert entry_key(_entry("https://a.com/1", guid="guid-1")) == "guid-1"
+    assert entry_key(_entry("https://a.com/1")) == "https://a.com/1"
+
+
+def test_partition_after_commit(tmp_path):
+    path = str(tmp_path / "seen.db")
+    index = SeenIndex(path)
+    entries = [_entry("https://a.com/1"), _entry("https://a.com/2")]
+
+    new, seen = index.partition("feed", entries)
+    assert (len(new), seen) == (2, 0)
+    index.commit()
+
+    new, seen = SeenIndex(path).partition("feed", entries + [_entry("https://a.com/3")])
+    assert [e["link"] for e in new] == ["https://a.com/3"]
+    assert seen == 2
+
+
+def test_changed_content_is_new(tmp_path):
+    index = SeenIndex(str(tmp_path / "seen.db"))
+    index.partition("feed", [_entry("https://a.com/1", summary="v1")])
+    index.commit()
+
+    new, seen = index.partition("feed", [_entry("https://a.com/1", summary="v2")])
+    assert len(new) == 1 and seen == 0
+
+
+def test_rollback_keeps_entries_new(tmp_path):
+    index = SeenIndex(str(tmp_path / "seen.db"))
+    entries = [_entry("https://a.com/1")]
+    index.partition("feed", entries)
+    index.rollback()
+
+    new, _ = index.partition("feed", entries)
+    assert len(new) == 1
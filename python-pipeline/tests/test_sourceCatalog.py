@@ -0,0 +1,56 @@
+"""
+tests/test_sourceCatalog.py
+
+sourceCatalog 로드 / fetch 계획 단위 테스트.
+"""
+
+import sys, os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+
+from common.config.sourceCatalog import SourceCatalog, _record
+from common.enums.signalType import SignalStage
+
+
+def _catalog(*raws):
+    return SourceCatalog(_record("rss", SignalStage.WHY, raw, {}) for raw in raws)
+
+
+def _raw(id, url, **kw):
+    return {"id": id, "name": id, "url": url, **kw}
+
+
+def test_settings_catalog_loads():
+    catalog = SourceCatalog.from_settings()
+    rss, visual = catalog.sources("rss"), catalog.sources("visual")
+    assert rss and visual
+    assert all(r.stage is SignalStage.WHY for r in rss)
+    assert all(r.stage is SignalStage.HOW for r in visual)
+    assert len(catalog.sources("rss", include_disabled=True)) > len(rss)
+    assert [r.priority for r in rss] == sorted(r.priority for r in rss)
+
+
+def test_record_fields():
+    record = _catalog(_raw("a", "https://A.com/feed", priority="high")).sources()[0]
+    assert record.host == "a.com"
+    assert record.priority == 1 and record.priority_label == "high"
+    assert record.language == "en" and record.enabled
+
+
+def test_duplicate_url_rejected():
+    with pytest.raises(ValueError):
+        _catalog(_raw("a", "https://a.com/feed"), _raw("b", "https://a.com/feed"))
+
+
+def test_plan_orders_by_priority_then_host():
+    catalog = _catalog(
+        _raw("a1", "https://a.com/1"),
+        _raw("a2", "https://a.com/2"),
+        _raw("b1", "https://b.com/1"),
+        _raw("c1", "https://c.com/1", priority="high"),
+    )
+    assert catalog.plan(catalog.sources()) == [
+        "https://c.com/1", "https://a.com/1", "https://b.com/1", "https://a.com/2",
+    ]
+    assert catalog.by_host("a.com")[1].id == "a2"
@@ -0,0 +1,58 @@
+"""
+tests/test_sourceSchedule.py
+
+sourceSchedule 적응형 폴링 주기 단위 테스트.
+"""
+
+import sys, os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from datetime import datetime, timedelta
+
+from moduleA.collectors.sourceSchedule import (
+    SourceSchedule, MAX_INTERVAL_HOURS, RUN_INTERVAL_HOURS,
+)
+
+URL = "https://a.com/feed"
+T0 = datetime(2030, 1, 1, 6, 0)
+
+
+def _schedule(tmp_path):
+    return SourceSchedule(str(tmp_path / "schedule.json"))
+
+
+def test_unknown_source_is_due(tmp_path):
+    assert _schedule(tmp_path).is_due(URL, T0)
+
+
+def test_idle_source_backs_off(tmp_path):
+    schedule = _schedule(tmp_path)
+    now = T0
+    for _ in range(20):
+        due = schedule.observe(URL, "not_modified", 0, now=now)
+        now = due
+    state = schedule.report()[0]
+    assert state["interval_hours"] == MAX_INTERVAL_HOURS
+    assert not schedule.is_due(URL, T0 + timedelta(hours=RUN_INTERVAL_HOURS * 2))
+
+
+def test_busy_source_polled_every_run(tmp_path):
+    schedule = _schedule(tmp_path)
+    due = schedule.observe(URL, "success", 20, page_size=20, now=T0)
+    assert schedule.is_due(URL, T0 + timedelta(hours=RUN_INTERVAL_HOURS))
+    assert due - T0 <= timedelta(hours=RUN_INTERVAL_HOURS)
+
+
+def test_blocked_retries_next_run(tmp_path):
+    schedule = _schedule(tmp_path)
+    schedule.observe(URL, "blocked", 0, now=T0)
+    assert schedule.is_due(URL, T0 + timedelta(hours=RUN_INTERVAL_HOURS))
+
+
+def test_commit_persists(tmp_path):
+    path = str(tmp_path / "schedule.json")
+    schedule = SourceSchedule(path)
+    schedule.observe(URL, "success", 1, now=T0)
+    assert SourceSchedule(path).next_due(URL) is None
+    schedule.commit()
+    assert SourceSchedule(path).next_due(URL) is not None
@@ -0,0 +1,64 @@
+"""
+tests/test_textCleaner.py
+
+textCleaner 정제 모드 / 배치 API 단위 테스트.
+"""
+
+import re
+import sys, os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from common.utils.textCleaner import (
+    clean_text, clean_texts, clean_items, clean_item_text, MARKUP, NORMALIZE,
+)
+
+SAMPLES = [
+    "<p>see https://a.com</p><p>Next para</p>",
+    "mail me@x.com<br>Thanks team",
+    "<b>x</b>me@x.com and <i>https://b.io/path</i>tail",
+    "abc@http://x.com tail",
+    "Hello <b>World</b>!",
+    "See https://example.com/path?q=1 for more",
+    "Contact design@example.com today",
+    "Minimal   UI ✨ trends 🚀 2025",
+    "브랜드 아이덴티티 — <em>리뉴얼</em> 사례",
+    "self-serve, dark-mode & AI-first",
+    "",
+]
+
+
+def _legacy_clean_text(text):
+    """기존 7회 치환 구현 (동작 비교용)"""
+    text = text.lower()
+    text = re.sub(r"<[^>]+>", " ", text)
+    text = re.sub(r"http[s]?://\S+", " ", text)
+    text = re.sub(r"\S+@\S+", " ", text)
+    text = re.sub("[\U0001F600-\U0001F64F\U0001F300-\U0001F5FF\U0001F680-\U0001F6FF\U0001F1E0-\U0001F1FF]+", " ", text)
+    text = re.sub(r"[^\w\s\-]", " ", text)
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def test_normalize_matches_legacy_output():
+    for sample in SAMPLES:
+        assert clean_text(sample) == _legacy_clean_text(sample)
+    assert clean_text(None) == ""
+
+
+def test_markup_keeps_case_punctuation_and_paragraphs():
+    html = "<p>First <b>bold</b> sentence.</p>\n<p>Second &amp; last!</p><script>x</script>"
+    assert clean_texts([html], mode=MARKUP) == ["First bold sentence.\n\nSecond & last!"]
+
+
+def test_clean_items_uses_field_modes():
+    item = {"title": "New <b>Logo</b>!", "body_text": "<p>Body Text.</p>", "source_url": "https://a.com/x"}
+    clean_item_text(item)
+    assert item == {"title": "new logo", "body_text": "Body Text.", "source_url": "https://a.com/x"}
+
+
+def test_parallel_path_preserves_order():
+    texts = SAMPLES * 50
+    assert clean_texts(texts, mode=NORMALIZE, workers=2, parallel_min=10) == [clean_text(t) for t in texts]
+
+    items = [{"title": t} for t in texts]
+    clean_items(items, field_modes={"title": NORMALIZE}, workers=2, parallel_min=10)
+    assert [i["title"] for i in items] == [clean_text(t) for t in texts]
@@ -9,9 +9,24 @@ import sys, os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
 from unittest.mock import patch, MagicMock
+
+import numpy as np
+import pytest
+
+from moduleA.chunker.chunkBatch import ChunkBatch
+from moduleA.embedder import textEmbedder
+from moduleA.embedder.embeddingStore import EmbeddingStore
 from moduleA.embedder.textEmbedder import embed_chunks, _text_hash
 
 
+@pytest.fixture(autouse=True)
+def store(monkeypatch):
+    """실제 로컬 저장소 대신 테스트마다 빈 인메모리 저장소"""
+    store = EmbeddingStore(":memory:")
+    monkeypatch.setattr(textEmbedder, "get_embedding_store", lambda: store)
+    return store
+
+
 # ── _text_hash ─────────────────────────────────────────
 
 def test_text_hash_deterministic():
@@ -61,3 +76,80 @@ def test_embed_chunks_api_failure_returns_none(mock_client):
     chunks = [{"reference_id": "r1", "chunk_index": 0, "chunk_text": "test"}]
     result = embed_chunks(chunks)
     assert result[0]["embedding"] is None
+
+
+# ── _pack_batches ──────────────────────────────────────
+
+def test_pack_batches_by_token_count(monkeypatch):
+    monkeypatch.setattr(textEmbedder, "MAX_BATCH_TOKENS", 300)
+    chunks = [{"chunk_text": "x", "token_count": 100} for _ in range(7)]
+    chunks.append({"chunk_text": "y", "token_count": 500})     # 한도 초과 청크는 단독 배치
+    batches = textEmbedder._pack_batches(chunks)
+    assert [len(b) for b in batches] == [3, 3, 1, 1]
+
+
+@patch("moduleA.embedder.textEmbedder.client")
+def test_embed_chunks_splits_batches_by_tokens(mock_client, monkeypatch):
+    monkeypatch.setattr(textEmbedder, "MAX_BATCH_TOKENS", 250)
+    mock_client.embeddings.create.side_effect = lambda model, input: _make_embed_response(len(input))
+    chunks = [{"reference_id": "r1", "chunk_index": i, "chunk_text": f"t{i}", "token_count": 100} for i in range(5)]
+    result = embed_chunks(chunks)
+    assert mock_client.embeddings.create.call_count == 3
+    assert all(r["embedding"] is not None for r in result)
+
+
+# ── cache_hit_report ───────────────────────────────────
+
+def test_cache_hit_report_filters_references():
+    chunks = [
+        {"reference_id": "a", "_skipped": True},
+        {"reference_id": "a"},
+        {"reference_id": "b", "_skipped": True},
+    ]
+    assert textEmbedder.cache_hit_report(chunks) == {"chunks": 3, "hits": 2, "hit_rate": 0.667}
+    assert textEmbedder.cache_hit_report(chunks, reference_ids={"a"})["hit_rate"] == 0.5
+    assert textEmbedder.cache_hit_report([], reference_ids={"a"})["hit_rate"] == 0.0
+
+
+# ── embed_batch ────────────────────────────────────────
+
+@patch("moduleA.embedder.textEmbedder.client")
+def test_embed_batch_fills_batch_in_place(mock_client, monkeypatch):
+    monkeypatch.setattr(textEmbedder, "MAX_BATCH_TOKENS", 150)
+    mock_client.embeddings.create.side_effect = [_make_embed_response(1), Exception("rate limit")]
+    batch = ChunkBatch.from_dicts([
+        {"reference_id": "r1", "chunk_index": i, "chunk_text": f"t{i}", "token_count": 100} for i in range(3)
+    ])
+    result = textEmbedder.embed_batch(batch, existing_hashes={_text_hash("t1")})
+
+    assert result is batch
+    assert batch.chunk_hash == [_text_hash(f"t{i}") for i in range(3)]
+    assert batch.skipped.tolist() == [False, True, False]
+    assert batch.embeddings.dtype == np.float32 and batch.embeddings.shape == (3, 1536)
+    assert batch[0]["embedding"] is not None and batch[2]["embedding"] is None    # 2번째 API 배치 실패
+    assert batch.embedded_count() == 1
+    assert textEmbedder.cache_hit_report(batch) == {"chunks": 3, "hits": 1, "hit_rate": 0.333}
+    assert textEmbedder.cache_hit_report(batch, reference_ids={"r2"})["chunks"] == 0
+
+
+# ── 로컬 임베딩 저장소 ────────────────────────────────
+
+@patch("moduleA.embedder.textEmbedder.client")
+def test_stored_vectors_reused_across_references(mock_client, store):
+    mock_client.embeddings.create.side_effect = lambda model, input: _make_embed_response(len(input))
+    first = embed_chunks([
+        {"reference_id": "r1", "chunk_index": 0, "chunk_text": "shared text"},
+        {"reference_id": "r1", "chunk_index": 1, "chunk_text": "shared text"},   # 배치 내 중복 → 1회 요청
+    ])
+    assert mock_client.embeddings.create.call_args.kwargs["input"] == ["shared text"]
+    assert all(r["embedding"] is not None for r in first)
+
+    second = embed_chunks([
+        {"reference_id": "r2", "chunk_index": 0, "chunk_text": "shared text"},
+        {"reference_id": "r2", "chunk_index": 1, "chunk_text": "new text"},
+    ])
+    assert mock_client.embeddings.create.call_count == 2
+    assert mock_client.embeddings.create.call_args.kwargs["input"] == ["new text"]
+    assert second[0]["_skipped"] is True
+    assert second[0]["embedding"] == pytest.approx([0.1] * 1536)     # 스킵해도 벡터는 채워짐
+    assert store.stats()["stored"] == 2
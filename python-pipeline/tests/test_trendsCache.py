@@ -0,0 +1,65 @@
+"""
+tests/test_trendsCache.py
+
+trendsCache tail 병합 / 구간 계산 단위 테스트 (네트워크 없음).
+"""
+
+import sys, os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from datetime import date
+
+import pandas as pd
+
+from moduleA.collectors import trendsCache
+from moduleA.collectors.trendsCache import tail_timeframe, merge_tail, load_frame, save_frame
+
+
+def _frame(start, values):
+    index = pd.date_range(start, periods=len(values), freq="D")
+    return pd.DataFrame({"ux": values, "isPartial": [False] * len(values)}, index=index)
+
+
+# ── tail_timeframe ─────────────────────────────────────
+
+def test_tail_timeframe_fresh_cache():
+    cached = _frame("2030-01-01", [10] * 10)   # 마지막 2030-01-10
+    assert tail_timeframe(cached, today=date(2030, 1, 11)) is None
+
+
+def test_tail_timeframe_stale_cache():
+    cached = _frame("2030-01-01", [10] * 10)
+    assert tail_timeframe(cached, today=date(2030, 1, 20)) == "2029-12-27 2030-01-20"
+
+
+# ── merge_tail ─────────────────────────────────────────
+
+def test_merge_tail_rescales_to_cached_scale():
+    cached = _frame("2030-01-01", [50, 50, 50, 50])
+    # tail은 2배 스케일로 정규화됨 (겹침 01-03, 01-04)
+    tail = _frame("2030-01-03", [100, 100, 80])
+    merged = merge_tail(cached, tail, window_days=90)
+    assert len(merged) == 5
+    assert merged["ux"].iloc[-1] == 40
+
+
+def test_merge_tail_trims_window():
+    cached = _frame("2030-01-01", [10] * 5)
+    tail = _frame("2030-01-05", [10] * 5)
+    merged = merge_tail(cached, tail, window_days=3)
+    assert merged.index.min() == pd.Timestamp("2030-01-07")
+
+
+def test_merge_tail_without_overlap_returns_none():
+    cached = _frame("2030-01-01", [10] * 3)
+    tail = _frame("2030-02-01", [10] * 3)
+    assert merge_tail(cached, tail, window_days=90) is None
+
+
+def test_save_and_load_roundtrip(tmp_path, monkeypatch):
+    monkeypatch.setattr(trendsCache, "CACHE_DIR", str(tmp_path))
+    frame = _frame("2030-01-01", [1, 2, 3])
+    save_frame("k", frame)
+    loaded = load_frame("k")
+    assert list(loaded["ux"]) == [1, 2, 3]
+    assert loaded.index[0] == pd.Timestamp("2030-01-01")
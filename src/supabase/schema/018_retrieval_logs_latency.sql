@@ -0,0 +1,6 @@
+-- 018_retrieval_logs_latency.sql
+-- 소스별 fetch 지연시간 기록 (feedFetcher 동시 수집)
+-- Supabase SQL Editor에서 실행
+
+ALTER TABLE retrieval_logs
+  ADD COLUMN IF NOT EXISTS latency_ms int;
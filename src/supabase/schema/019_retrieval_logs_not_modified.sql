@@ -0,0 +1,10 @@
+-- 019_retrieval_logs_not_modified.sql
+-- 조건부 GET(ETag / Last-Modified) 304 응답을 별도 상태로 기록
+-- Supabase SQL Editor에서 실행
+
+ALTER TABLE retrieval_logs
+  DROP CONSTRAINT IF EXISTS retrieval_logs_crawl_status_check;
+
+ALTER TABLE retrieval_logs
+  ADD CONSTRAINT retrieval_logs_crawl_status_check
+  CHECK (crawl_status IN ('success', 'partial', 'blocked', 'not_modified'));
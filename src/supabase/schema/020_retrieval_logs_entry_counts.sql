@@ -0,0 +1,7 @@
+-- 020_retrieval_logs_entry_counts.sql
+-- 소스별 새 entry / 이미 처리한 entry 개수 (seenIndex)
+-- Supabase SQL Editor에서 실행
+
+ALTER TABLE retrieval_logs
+  ADD COLUMN IF NOT EXISTS new_count  int DEFAULT 0,
+  ADD COLUMN IF NOT EXISTS seen_count int DEFAULT 0;
@@ -0,0 +1,6 @@
+-- 021_retrieval_logs_next_due.sql
+-- 소스별 적응형 폴링 주기(sourceSchedule)가 계산한 다음 수집 예정 시각
+-- Supabase SQL Editor에서 실행
+
+ALTER TABLE retrieval_logs
+  ADD COLUMN IF NOT EXISTS next_due_at timestamptz;
@@ -0,0 +1,7 @@
+-- 022_retrieval_logs_breaker_state.sql
+-- 소스별 circuit breaker(circuitBreaker) 상태: 수집 직후 closed / open / half_open
+-- Supabase SQL Editor에서 실행
+
+ALTER TABLE retrieval_logs
+  ADD COLUMN IF NOT EXISTS breaker_state text
+  CHECK (breaker_state IN ('closed', 'open', 'half_open'));
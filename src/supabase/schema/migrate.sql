@@ -106,9 +106,14 @@ CREATE TABLE IF NOT EXISTS retrieval_logs (
   id              uuid PRIMARY KEY DEFAULT gen_random_uuid(),
   run_id          uuid REFERENCES pipeline_runs(run_id),
   source_url      text,
-  crawl_status    text CHECK (crawl_status IN ('success', 'partial', 'blocked')),
+  crawl_status    text CHECK (crawl_status IN ('success', 'partial', 'blocked', 'not_modified')),
   retrieved_count int DEFAULT 0,
   error_message   text,
+  latency_ms      int,
+  new_count       int DEFAULT 0,
+  seen_count      int DEFAULT 0,
+  next_due_at     timestamptz,
+  breaker_state   text CHECK (breaker_state IN ('closed', 'open', 'half_open')),
   logged_at       timestamptz DEFAULT now()
 );
 